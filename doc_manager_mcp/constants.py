@@ -8,10 +8,10 @@ FUNCTION_PATTERN = re.compile(r'^(([A-Z][a-zA-Z0-9]*\.)?([a-z_][a-zA-Z0-9_]*)\(\
 CLASS_PATTERN = re.compile(r'^([A-Z][a-zA-Z0-9]+)$')
 
 # Common words to exclude from class matching (acronyms, not actual classes)
-CLASS_EXCLUDES = {
+CLASS_EXCLUDES = frozenset({
     'API', 'CLI', 'HTTP', 'HTTPS', 'URL', 'JSON', 'XML', 'HTML', 'CSS',
     'SQL', 'REST', 'YAML', 'TOML', 'UUID', 'UTF', 'ASCII', 'ISO'
-}
+})
 
 # Response size limit
 CHARACTER_LIMIT = 25000  # Maximum response size in characters
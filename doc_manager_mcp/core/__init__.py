@@ -23,10 +23,10 @@ from .api_coverage import (
 )
 
 # Checksums
-from .checksums import calculate_checksum
+from .checksums import calculate_checksum, calculate_checksums, calculate_checksums_incremental
 
 # Configuration
-from .config import load_config, save_config
+from .config import get_checksum_workers, load_config, save_config
 
 # Conventions
 from .conventions import (
@@ -39,7 +39,7 @@ from .conventions import (
 from .errors import handle_error
 
 # Git operations
-from .git import run_git_command
+from .git import get_git_head_info, run_git_command
 
 # Gitignore parsing
 from .gitignore import get_gitignore_patterns, parse_gitignore
@@ -48,10 +48,11 @@ from .gitignore import get_gitignore_patterns, parse_gitignore
 from .paths import safe_resolve, validate_path_boundary
 
 # Pattern matching
-from .patterns import matches_exclude_pattern
+from .patterns import compile_exclude_matcher, matches_exclude_pattern
 
 # Project detection
 from .project import (
+    ProjectProbe,
     detect_platform_quick,
     detect_project_language,
     extract_module_all,
@@ -59,13 +60,14 @@ from .project import (
     find_markdown_files,
     get_doc_relative_path,
     is_public_symbol,
+    probe_project,
 )
 
 # Resource management
 from .resources import ResourceLimits, operation_timeout
 
 # Response utilities
-from .responses import enforce_response_limit, safe_json_dumps
+from .responses import enforce_response_limit, read_json_file, safe_json_dumps, write_json_file
 
 # Security
 from .security import file_lock
@@ -82,8 +84,12 @@ from .staleness import (
 __all__ = [
     "API_COVERAGE_PRESETS",
     "ApiCoverageConfig",
+    "ProjectProbe",
     "ResourceLimits",
     "calculate_checksum",
+    "calculate_checksums",
+    "calculate_checksums_incremental",
+    "compile_exclude_matcher",
     "detect_platform_quick",
     "detect_project_language",
     "enforce_response_limit",
@@ -91,9 +97,11 @@ __all__ = [
     "file_lock",
     "find_docs_directory",
     "find_markdown_files",
+    "get_checksum_workers",
     "get_convention_summary",
     "get_default_config",
     "get_doc_relative_path",
+    "get_git_head_info",
     "get_gitignore_patterns",
     "handle_error",
     "is_public_symbol",
@@ -103,6 +111,8 @@ __all__ = [
     "matches_exclude_pattern",
     "operation_timeout",
     "parse_gitignore",
+    "probe_project",
+    "read_json_file",
     "run_git_command",
     "safe_json_dumps",
     "safe_resolve",
@@ -114,4 +124,5 @@ __all__ = [
     "format_staleness_warnings",
     "validate_against_conventions",
     "validate_path_boundary",
+    "write_json_file",
 ]
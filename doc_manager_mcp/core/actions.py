@@ -5,7 +5,7 @@ documentation tasks from detected code changes. It enables AI agents to
 act directly on change detection output without manual interpretation.
 """
 
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, fields
 from pathlib import Path
 from typing import Any, ClassVar
 
@@ -15,7 +15,7 @@ from doc_manager_mcp.indexing.analysis.semantic_diff import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionItem:
     """Represents a specific action for an AI agent to take.
 
@@ -50,6 +50,9 @@ class ActionItem:
     suggested_content: str | None = None
 
 
+_ACTION_FIELDS = tuple(f.name for f in fields(ActionItem))
+
+
 class ActionGenerator:
     """Generates actionable items from detected changes.
 
@@ -374,4 +377,5 @@ class ActionGenerator:
 
 def actions_to_dicts(actions: list[ActionItem]) -> list[dict[str, Any]]:
     """Convert action items to dictionaries for JSON serialization."""
-    return [asdict(a) for a in actions]
+    # Shallow field copy: asdict() deep-copies source_change for every item
+    return [{name: getattr(a, name) for name in _ACTION_FIELDS} for a in actions]
@@ -1,16 +1,153 @@
 """File checksum utilities."""
 
 import hashlib
+import os
+import time
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, BinaryIO
+
+# Read size per hash update (1 MiB); large blocks amortize Python loop overhead
+CHECKSUM_BLOCK_SIZE = 1 << 20
+
+# Below this many files, thread startup costs more than it saves
+_PARALLEL_CHECKSUM_MIN_FILES = 32
+
+# Files modified this close to (or after) the previous scan are rehashed even when
+# their stat fingerprint matches: a same-size edit within the filesystem's
+# timestamp granularity leaves mtime and ctime unchanged ("racily clean" in git).
+# Two seconds covers the coarsest common granularity (FAT).
+_RACY_WINDOW_NS = 2_000_000_000
+
+# hashlib.file_digest is only available on Python 3.11+
+_file_digest = getattr(hashlib, "file_digest", None)
+
+# Linux-only flag that skips the atime update on read
+_O_NOATIME = getattr(os, "O_NOATIME", 0)
+# Windows needs O_BINARY so low-level reads are not newline-translated
+_O_READ_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+
+
+def _open_read(file_path: Path) -> BinaryIO:
+    """Open a file for unbuffered reading without updating its atime if possible.
+
+    O_NOATIME is only permitted for the file's owner (or a privileged process);
+    on EPERM the file is reopened normally.
+    """
+    try:
+        fd = os.open(file_path, _O_READ_FLAGS | _O_NOATIME)
+    except PermissionError:
+        if not _O_NOATIME:
+            raise
+        fd = os.open(file_path, _O_READ_FLAGS)
+    return os.fdopen(fd, "rb", buffering=0)
 
 
 def calculate_checksum(file_path: Path) -> str:
     """Calculate SHA-256 checksum of a file."""
-    sha256_hash = hashlib.sha256()
     try:
-        with open(file_path, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
+        # Unbuffered: each read already pulls a full block from the OS
+        with _open_read(file_path) as f:
+            if os.fstat(f.fileno()).st_size < CHECKSUM_BLOCK_SIZE:
+                # Most repo files are small: one read + one update beats
+                # file_digest's per-call 256 KiB buffer allocation
+                return hashlib.sha256(f.read()).hexdigest()
+            if _file_digest is not None:
+                # Python 3.11+: the read/update loop runs in C
+                return _file_digest(f, "sha256").hexdigest()
+            sha256_hash = hashlib.sha256()
+            for byte_block in iter(lambda: f.read(CHECKSUM_BLOCK_SIZE), b""):
                 sha256_hash.update(byte_block)
-        return sha256_hash.hexdigest()
-    except Exception:
+            return sha256_hash.hexdigest()
+    except OSError:
         return ""
+
+
+def calculate_checksums(file_paths: Sequence[Path], max_workers: int | None = None) -> list[str]:
+    """Calculate SHA-256 checksums for many files concurrently.
+
+    hashlib releases the GIL while hashing large blocks, so a thread pool
+    spreads file reads and hashing across cores.
+
+    Args:
+        file_paths: Files to hash
+        max_workers: Thread count (default: cpu_count + 4, capped at 32). Lower
+            it for spinning disks, where concurrent reads cause seek thrashing.
+
+    Returns:
+        Checksums in the same order as file_paths ("" for unreadable files)
+    """
+    if len(file_paths) < _PARALLEL_CHECKSUM_MIN_FILES or max_workers == 1:
+        return [calculate_checksum(path) for path in file_paths]
+
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 1) + 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(calculate_checksum, file_paths))
+
+
+def calculate_checksums_incremental(
+    file_paths: Sequence[Path],
+    relative_paths: Sequence[str],
+    prior_baseline: Mapping[str, Any] | None,
+    max_workers: int | None = None,
+) -> tuple[list[str], dict[str, list[int]], int]:
+    """Calculate checksums, reusing prior ones for files whose stat is unchanged.
+
+    A file keeps the checksum recorded in the prior baseline only if its
+    [size, mtime_ns, ctime_ns, inode] fingerprint is unchanged and its mtime and
+    ctime are older than the prior scan (minus _RACY_WINDOW_NS). ctime and inode
+    catch copies that preserve mtime (cp -p, rsync -t); the scan-time check
+    catches same-size edits within one timestamp tick. Everything else is hashed.
+
+    Args:
+        file_paths: Files to hash
+        relative_paths: Baseline keys for file_paths, in the same order
+        prior_baseline: Previous repo-baseline.json contents, if any
+        max_workers: Thread count for hashing (see calculate_checksums)
+
+    Returns:
+        Tuple of (checksums in file_paths order, relative path -> fingerprint,
+        scan start time in ns). Store the last two as the baseline's
+        ``file_stats`` and ``file_stats_time_ns``.
+    """
+    # Taken before any stat, so edits during the scan fall inside the racy window
+    scan_time_ns = time.time_ns()
+
+    prior = prior_baseline or {}
+    prior_files = prior.get("files") or {}
+    prior_stats = prior.get("file_stats") or {}
+    prior_time_ns = prior.get("file_stats_time_ns")
+    if not isinstance(prior_time_ns, int):
+        # No record of when the fingerprints were taken: trust none of them
+        prior_stats = {}
+        prior_time_ns = 0
+    racy_after_ns = prior_time_ns - _RACY_WINDOW_NS
+
+    checksums = [""] * len(file_paths)
+    file_stats: dict[str, list[int]] = {}
+    to_hash: list[int] = []
+    for i, (path, rel) in enumerate(zip(file_paths, relative_paths, strict=True)):
+        try:
+            st = os.stat(path)
+        except OSError:
+            to_hash.append(i)
+            continue
+        fingerprint = [st.st_size, st.st_mtime_ns, st.st_ctime_ns, st.st_ino]
+        file_stats[rel] = fingerprint
+        prior_checksum = prior_files.get(rel)
+        if (
+            prior_checksum
+            and prior_stats.get(rel) == fingerprint
+            and max(st.st_mtime_ns, st.st_ctime_ns) < racy_after_ns
+        ):
+            checksums[i] = prior_checksum
+        else:
+            to_hash.append(i)
+
+    hashed = calculate_checksums([file_paths[i] for i in to_hash], max_workers=max_workers)
+    for i, checksum in zip(to_hash, hashed, strict=True):
+        checksums[i] = checksum
+
+    return checksums, file_stats, scan_time_ns
@@ -4,184 +4,268 @@ This module provides utilities for loading and saving .doc-manager.yml
 configuration files with helpful examples and documentation.
 """
 
+import copy
+import os
+import stat
+import tempfile
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 
 def load_config(project_path: Path) -> dict[str, Any] | None:
     """Load .doc-manager.yml configuration.
 
     Normalizes None values to empty lists for fields that consumers expect to be lists.
     This handles configs where empty lists were saved as 'null' for YAML aesthetics.
+
+    Parsed configs are memoized on the file's mtime and size, so repeated tool
+    calls against an unchanged config skip YAML parsing. Each call returns a
+    fresh copy that callers may modify.
     """
     config_path = project_path / ".doc-manager.yml"
-    if not config_path.exists():
+    try:
+        stat = config_path.stat()
+    except OSError:
         return None
 
+    config = _load_config_cached(str(config_path), stat.st_mtime_ns, stat.st_size)
+    return copy.deepcopy(config)
+
+
+def get_checksum_workers(project_path: Path) -> int | None:
+    """Return the configured checksum thread count, or None for the default."""
+    config = load_config(project_path)
+    workers = config.get('checksum_workers') if config else None
+    if isinstance(workers, int) and not isinstance(workers, bool) and workers >= 1:
+        return workers
+    return None
+
+
+def _yaml_safe_loader() -> type:
+    """Return libyaml's C safe loader if PyYAML was built with it, else SafeLoader."""
+    import yaml
+
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _yaml_safe_dumper() -> type:
+    """Return libyaml's C safe dumper if PyYAML was built with it, else SafeDumper."""
+    import yaml
+
+    return getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+@lru_cache(maxsize=32)
+def _load_config_cached(config_path: str, mtime_ns: int, size: int) -> dict[str, Any] | None:
+    """Parse and normalize a config file; cached on its (mtime_ns, size) signature."""
+    # Deferred so servers that never read a config skip importing PyYAML
+    import yaml
+
     try:
         with open(config_path, encoding='utf-8') as f:
-            config = yaml.safe_load(f)
-
-            if config:
-                # Normalize None to empty lists for expected list fields
-                # Fixes: dict.get("key", []) returns None when key exists with None value
-                if config.get('exclude') is None:
-                    config['exclude'] = []
-                if config.get('sources') is None:
-                    config['sources'] = []
-
-                # Normalize api_coverage section
-                if config.get('api_coverage'):
-                    api_coverage = config['api_coverage']
-                    if api_coverage.get('exclude_symbols') is None:
-                        api_coverage['exclude_symbols'] = []
-                    if api_coverage.get('include_symbols') is None:
-                        api_coverage['include_symbols'] = []
-
-            return config
-    except Exception:
+            config = yaml.load(f, Loader=_yaml_safe_loader())  # noqa: S506
+    except (OSError, UnicodeDecodeError, yaml.YAMLError):
         return None
 
+    if not config:
+        return config
+    # Configs that aren't a mapping can't be normalized or used
+    if not isinstance(config, dict):
+        return None
+
+    # Normalize None to empty lists for expected list fields
+    # Fixes: dict.get("key", []) returns None when key exists with None value
+    if config.get('exclude') is None:
+        config['exclude'] = []
+    if config.get('sources') is None:
+        config['sources'] = []
+
+    # Normalize api_coverage section
+    if config.get('api_coverage'):
+        api_coverage = config['api_coverage']
+        if not isinstance(api_coverage, dict):
+            return None
+        if api_coverage.get('exclude_symbols') is None:
+            api_coverage['exclude_symbols'] = []
+        if api_coverage.get('include_symbols') is None:
+            api_coverage['include_symbols'] = []
+
+    return config
+
+
+# Commented guide appended after the YAML body of .doc-manager.yml
+_CONFIG_GUIDE = "".join((
+    "\n",
+    "# " + "=" * 76 + "\n",
+    "# Configuration Guide & Examples\n",
+    "# " + "=" * 76 + "\n",
+    "\n",
+    "# Exclude Patterns\n",
+    "# ----------------\n",
+    "# Use glob patterns to exclude files from documentation tracking.\n",
+    "# Examples:\n",
+    "#   exclude:\n",
+    "#     - \"**/node_modules/**\"     # Exclude all node_modules directories\n",
+    "#     - \"**/*.pyc\"               # Exclude Python bytecode files\n",
+    "#     - \"**/dist/**\"             # Exclude build artifacts\n",
+    "#     - \"**/.git/**\"             # Exclude git directory\n",
+    "#     - \"**/venv/**\"             # Exclude Python virtual environments\n",
+    "#     - \"**/__pycache__/**\"      # Exclude Python cache\n",
+    "\n",
+    "# Source Files (Glob Patterns)\n",
+    "# -----------------------------\n",
+    "# Glob patterns to specify which source files to track.\n",
+    "# IMPORTANT: Use glob patterns (e.g., 'src/**/*.py'), not just directory names.\n",
+    "# Examples:\n",
+    "#   sources:\n",
+    "#     - \"src/**/*.py\"            # All Python files in src/\n",
+    "#     - \"lib/**/*.js\"            # All JavaScript files in lib/\n",
+    "#     - \"packages/core/**/*.ts\"  # TypeScript files in packages/core/\n",
+    "#     - \"**/*.go\"                # All Go files in project\n",
+    "\n",
+    "# Documentation Path\n",
+    "# -------------------\n",
+    "# Path to documentation directory (relative to project root).\n",
+    "# Common values: docs, doc, documentation, website/docs\n",
+    "\n",
+    "# Platform\n",
+    "# --------\n",
+    "# Documentation platform: mkdocs, sphinx, hugo, docusaurus, etc.\n",
+    "# Set to 'unknown' if not using a specific platform.\n",
+    "\n",
+    "# Include Root README\n",
+    "# -------------------\n",
+    "# Set to true to include the root README.md in documentation operations.\n",
+    "# When enabled, validation, quality assessment, and change detection\n",
+    "# will include the root README.md alongside docs in the docs/ directory.\n",
+    "# Default: false (backwards compatible)\n",
+    "\n",
+    "# Use Gitignore\n",
+    "# -------------\n",
+    "# Set to true to automatically exclude files based on .gitignore patterns.\n",
+    "# When enabled, files ignored by git will also be excluded from doc tracking.\n",
+    "# Priority: user excludes > .gitignore > built-in defaults\n",
+    "# Default: false (opt-in feature)\n",
+    "# Example:\n",
+    "#   use_gitignore: true\n",
+    "#   exclude:              # Additional patterns beyond .gitignore\n",
+    "#     - \"specs/**\"\n",
+    "\n",
+    "# Documentation Path Mappings\n",
+    "# ---------------------------\n",
+    "# Map change categories to documentation file paths.\n",
+    "# Supports non-standard layouts (documentation/, wiki/, _docs/, etc.).\n",
+    "# When not configured, falls back to default paths in docs/.\n",
+    "# Example:\n",
+    "#   doc_mappings:\n",
+    "#     cli: 'docs/reference/command-reference.md'\n",
+    "#     api: 'docs/reference/api.md'\n",
+    "#     config: 'docs/reference/configuration.md'\n",
+    "#     dependency: 'docs/getting-started/installation.md'\n",
+    "#     infrastructure: 'docs/development/ci-cd.md'\n",
+    "# Non-standard layout example:\n",
+    "#   doc_mappings:\n",
+    "#     cli: 'documentation/commands.md'  # Uses documentation/ instead of docs/\n",
+    "#     api: 'wiki/API-Reference.md'      # Uses wiki/ directory\n",
+    "\n",
+    "# API Coverage Configuration\n",
+    "# --------------------------\n",
+    "# Configure how public symbols are detected for API coverage metrics.\n",
+    "# Follows industry standards from Sphinx autodoc and mkdocstrings.\n",
+    "# Example:\n",
+    "#   api_coverage:\n",
+    "#     strategy: 'all_then_underscore'  # Options: all_then_underscore, all_only, underscore_only\n",
+    "#     preset: 'pydantic'               # See preset list below\n",
+    "#     exclude_symbols:                 # Additional patterns (fnmatch syntax)\n",
+    "#       - 'my_internal_*'\n",
+    "#     include_symbols:                 # Force-include these (overrides exclusions)\n",
+    "#       - 'MySpecialClass'\n",
+    "#\n",
+    "# Strategy options:\n",
+    "#   - all_then_underscore: Use __all__ if defined, else underscore convention (default)\n",
+    "#   - all_only: Only symbols in __all__ are public (strict)\n",
+    "#   - underscore_only: Only use underscore convention, ignore __all__\n",
+    "#\n",
+    "# Available presets by language:\n",
+    "#   Python:\n",
+    "#     - pydantic: Config, model_config, validators, validate_*\n",
+    "#     - django: Meta, DoesNotExist, MultipleObjectsReturned\n",
+    "#     - fastapi: Config, model_config\n",
+    "#     - pytest: test_*, Test*, fixture, conftest\n",
+    "#     - sqlalchemy: metadata, __table__, __mapper__, _sa_*\n",
+    "#   JavaScript/TypeScript:\n",
+    "#     - jest: describe, it, test, beforeEach, afterEach, expect\n",
+    "#     - vitest: same as jest + vi, suite\n",
+    "#     - react: _render*, UNSAFE_*, __*, $$typeof\n",
+    "#     - vue: $_*, __v*, internal render helpers\n",
+    "#   Go:\n",
+    "#     - go-test: Test*, Benchmark*, Example*, Fuzz*\n",
+    "#   Rust:\n",
+    "#     - rust-test: tests, test_*, bench_*\n",
+    "#     - serde: Serialize, Deserialize, __serde_*\n",
+))
+
+
+def _config_file_mode(config_path: Path) -> int:
+    """Permission bits for a saved config: the existing file's, else the umask default."""
+    try:
+        return stat.S_IMODE(os.stat(config_path).st_mode)
+    except OSError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
 
 def save_config(project_path: Path, config: dict[str, Any]) -> bool:
     """Save .doc-manager.yml configuration with helpful examples."""
+    import yaml
+
     config_path = project_path / ".doc-manager.yml"
     try:
-        with open(config_path, 'w', encoding='utf-8') as f:
-            # Write main configuration with custom formatting for empty lists
-            config_copy = config.copy()
-            # Replace empty lists with None so they appear as empty lines instead of []
-            if not config_copy.get('exclude'):
-                config_copy['exclude'] = None
-            if not config_copy.get('sources'):
-                config_copy['sources'] = None
-
-            # Ensure include_root_readme is saved with default if not set
-            if 'include_root_readme' not in config_copy:
-                config_copy['include_root_readme'] = False
-
-            # Ensure use_gitignore is saved with default if not set
-            if 'use_gitignore' not in config_copy:
-                config_copy['use_gitignore'] = False
-
-            # Replace empty dict with None for doc_mappings
-            if not config_copy.get('doc_mappings'):
-                config_copy['doc_mappings'] = None
-
-            yaml.dump(config_copy, f, default_flow_style=False, sort_keys=False)
-
-            # Add helpful examples and documentation
-            f.write("\n")
-            f.write("# " + "=" * 76 + "\n")
-            f.write("# Configuration Guide & Examples\n")
-            f.write("# " + "=" * 76 + "\n")
-            f.write("\n")
-            f.write("# Exclude Patterns\n")
-            f.write("# ----------------\n")
-            f.write("# Use glob patterns to exclude files from documentation tracking.\n")
-            f.write("# Examples:\n")
-            f.write("#   exclude:\n")
-            f.write("#     - \"**/node_modules/**\"     # Exclude all node_modules directories\n")
-            f.write("#     - \"**/*.pyc\"               # Exclude Python bytecode files\n")
-            f.write("#     - \"**/dist/**\"             # Exclude build artifacts\n")
-            f.write("#     - \"**/.git/**\"             # Exclude git directory\n")
-            f.write("#     - \"**/venv/**\"             # Exclude Python virtual environments\n")
-            f.write("#     - \"**/__pycache__/**\"      # Exclude Python cache\n")
-            f.write("\n")
-            f.write("# Source Files (Glob Patterns)\n")
-            f.write("# -----------------------------\n")
-            f.write("# Glob patterns to specify which source files to track.\n")
-            f.write("# IMPORTANT: Use glob patterns (e.g., 'src/**/*.py'), not just directory names.\n")
-            f.write("# Examples:\n")
-            f.write("#   sources:\n")
-            f.write("#     - \"src/**/*.py\"            # All Python files in src/\n")
-            f.write("#     - \"lib/**/*.js\"            # All JavaScript files in lib/\n")
-            f.write("#     - \"packages/core/**/*.ts\"  # TypeScript files in packages/core/\n")
-            f.write("#     - \"**/*.go\"                # All Go files in project\n")
-            f.write("\n")
-            f.write("# Documentation Path\n")
-            f.write("# -------------------\n")
-            f.write("# Path to documentation directory (relative to project root).\n")
-            f.write("# Common values: docs, doc, documentation, website/docs\n")
-            f.write("\n")
-            f.write("# Platform\n")
-            f.write("# --------\n")
-            f.write("# Documentation platform: mkdocs, sphinx, hugo, docusaurus, etc.\n")
-            f.write("# Set to 'unknown' if not using a specific platform.\n")
-            f.write("\n")
-            f.write("# Include Root README\n")
-            f.write("# -------------------\n")
-            f.write("# Set to true to include the root README.md in documentation operations.\n")
-            f.write("# When enabled, validation, quality assessment, and change detection\n")
-            f.write("# will include the root README.md alongside docs in the docs/ directory.\n")
-            f.write("# Default: false (backwards compatible)\n")
-            f.write("\n")
-            f.write("# Use Gitignore\n")
-            f.write("# -------------\n")
-            f.write("# Set to true to automatically exclude files based on .gitignore patterns.\n")
-            f.write("# When enabled, files ignored by git will also be excluded from doc tracking.\n")
-            f.write("# Priority: user excludes > .gitignore > built-in defaults\n")
-            f.write("# Default: false (opt-in feature)\n")
-            f.write("# Example:\n")
-            f.write("#   use_gitignore: true\n")
-            f.write("#   exclude:              # Additional patterns beyond .gitignore\n")
-            f.write("#     - \"specs/**\"\n")
-            f.write("\n")
-            f.write("# Documentation Path Mappings\n")
-            f.write("# ---------------------------\n")
-            f.write("# Map change categories to documentation file paths.\n")
-            f.write("# Supports non-standard layouts (documentation/, wiki/, _docs/, etc.).\n")
-            f.write("# When not configured, falls back to default paths in docs/.\n")
-            f.write("# Example:\n")
-            f.write("#   doc_mappings:\n")
-            f.write("#     cli: 'docs/reference/command-reference.md'\n")
-            f.write("#     api: 'docs/reference/api.md'\n")
-            f.write("#     config: 'docs/reference/configuration.md'\n")
-            f.write("#     dependency: 'docs/getting-started/installation.md'\n")
-            f.write("#     infrastructure: 'docs/development/ci-cd.md'\n")
-            f.write("# Non-standard layout example:\n")
-            f.write("#   doc_mappings:\n")
-            f.write("#     cli: 'documentation/commands.md'  # Uses documentation/ instead of docs/\n")
-            f.write("#     api: 'wiki/API-Reference.md'      # Uses wiki/ directory\n")
-            f.write("\n")
-            f.write("# API Coverage Configuration\n")
-            f.write("# --------------------------\n")
-            f.write("# Configure how public symbols are detected for API coverage metrics.\n")
-            f.write("# Follows industry standards from Sphinx autodoc and mkdocstrings.\n")
-            f.write("# Example:\n")
-            f.write("#   api_coverage:\n")
-            f.write("#     strategy: 'all_then_underscore'  # Options: all_then_underscore, all_only, underscore_only\n")
-            f.write("#     preset: 'pydantic'               # See preset list below\n")
-            f.write("#     exclude_symbols:                 # Additional patterns (fnmatch syntax)\n")
-            f.write("#       - 'my_internal_*'\n")
-            f.write("#     include_symbols:                 # Force-include these (overrides exclusions)\n")
-            f.write("#       - 'MySpecialClass'\n")
-            f.write("#\n")
-            f.write("# Strategy options:\n")
-            f.write("#   - all_then_underscore: Use __all__ if defined, else underscore convention (default)\n")
-            f.write("#   - all_only: Only symbols in __all__ are public (strict)\n")
-            f.write("#   - underscore_only: Only use underscore convention, ignore __all__\n")
-            f.write("#\n")
-            f.write("# Available presets by language:\n")
-            f.write("#   Python:\n")
-            f.write("#     - pydantic: Config, model_config, validators, validate_*\n")
-            f.write("#     - django: Meta, DoesNotExist, MultipleObjectsReturned\n")
-            f.write("#     - fastapi: Config, model_config\n")
-            f.write("#     - pytest: test_*, Test*, fixture, conftest\n")
-            f.write("#     - sqlalchemy: metadata, __table__, __mapper__, _sa_*\n")
-            f.write("#   JavaScript/TypeScript:\n")
-            f.write("#     - jest: describe, it, test, beforeEach, afterEach, expect\n")
-            f.write("#     - vitest: same as jest + vi, suite\n")
-            f.write("#     - react: _render*, UNSAFE_*, __*, $$typeof\n")
-            f.write("#     - vue: $_*, __v*, internal render helpers\n")
-            f.write("#   Go:\n")
-            f.write("#     - go-test: Test*, Benchmark*, Example*, Fuzz*\n")
-            f.write("#   Rust:\n")
-            f.write("#     - rust-test: tests, test_*, bench_*\n")
-            f.write("#     - serde: Serialize, Deserialize, __serde_*\n")
+        # Write main configuration with custom formatting for empty lists
+        config_copy = config.copy()
+        # Replace empty lists with None so they appear as empty lines instead of []
+        if not config_copy.get('exclude'):
+            config_copy['exclude'] = None
+        if not config_copy.get('sources'):
+            config_copy['sources'] = None
+
+        # Ensure include_root_readme is saved with default if not set
+        if 'include_root_readme' not in config_copy:
+            config_copy['include_root_readme'] = False
+
+        # Ensure use_gitignore is saved with default if not set
+        if 'use_gitignore' not in config_copy:
+            config_copy['use_gitignore'] = False
+
+        # Replace empty dict with None for doc_mappings
+        if not config_copy.get('doc_mappings'):
+            config_copy['doc_mappings'] = None
+
+        content = yaml.dump(
+            config_copy, Dumper=_yaml_safe_dumper(), default_flow_style=False, sort_keys=False
+        ) + _CONFIG_GUIDE
+
+        # Write the whole file in one call to a uniquely named temp file, then
+        # rename it into place so readers never see a partially written config
+        # and overlapping saves never write into each other's temp file
+        tmp_fd, tmp_name = tempfile.mkstemp(dir=project_path, prefix=".doc-manager.yml.", suffix=".tmp")
+        tmp_path = Path(tmp_name)
+        try:
+            with os.fdopen(tmp_fd, 'w', encoding='utf-8') as f:
+                f.write(content)
+            # mkstemp creates the file 0600; keep the mode the config would have had
+            os.chmod(tmp_path, _config_file_mode(config_path))
+            os.replace(tmp_path, config_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
 
         return True
     except Exception:
         return False
+    finally:
+        # Coarse mtime resolution could let a same-size rewrite keep its old
+        # signature, so drop memoized parses whenever we write the file
+        _load_config_cached.cache_clear()
@@ -3,8 +3,6 @@
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-import yaml
-
 if TYPE_CHECKING:
     from doc_manager_mcp.models import DocumentationConventions
 
@@ -23,8 +21,12 @@ def load_conventions(project_path: Path) -> "DocumentationConventions | None":
         >>> if conventions and conventions.style.headings.case:
         ...     print(f"Use {conventions.style.headings.case} for headings")
     """
+    import yaml
+
     from doc_manager_mcp.models import DocumentationConventions
 
+    from .config import _yaml_safe_loader
+
     conventions_path = project_path / ".doc-manager" / "memory" / "doc-conventions.yml"
 
     if not conventions_path.exists():
@@ -32,7 +34,7 @@ def load_conventions(project_path: Path) -> "DocumentationConventions | None":
 
     try:
         with open(conventions_path, encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_yaml_safe_loader())  # noqa: S506
 
         if not data:
             return None
@@ -4,6 +4,15 @@ This module provides consistent error formatting and logging utilities
 with path sanitization for security.
 """
 
+import re
+import sys
+from datetime import datetime
+
+# Windows paths (C:\..., R:\...)
+_WINDOWS_PATH_RE = re.compile(r'[A-Z]:\\[^\s]+')
+# Unix paths (/home/..., /usr/...)
+_UNIX_PATH_RE = re.compile(r'/[\w/]+/[\w/]+')
+
 
 def handle_error(e: Exception, context: str = "", log_to_stderr: bool = True) -> str:
     """Consistent error formatting across all tools.
@@ -16,23 +25,12 @@ def handle_error(e: Exception, context: str = "", log_to_stderr: bool = True) ->
     Returns:
         Formatted error message string (sanitized per FR-017)
     """
-    import re
-    import sys
-    from datetime import datetime
-
-    # Format error message without sensitive paths (FR-017)
-    error_msg = f"Error: {type(e).__name__}"
-    if context:
-        error_msg += f" in {context}"
-
-    # Sanitize error message - remove full paths
-    error_str = str(e)
-    # Remove Windows paths (C:\..., R:\...)
-    error_str = re.sub(r'[A-Z]:\\[^\s]+', '[path]', error_str)
-    # Remove Unix paths (/home/..., /usr/...)
-    error_str = re.sub(r'/[\w/]+/[\w/]+', '[path]', error_str)
-
-    error_msg += f": {error_str}"
+    # Sanitize error message - remove full paths (FR-017)
+    error_str = _UNIX_PATH_RE.sub('[path]', _WINDOWS_PATH_RE.sub('[path]', str(e)))
+
+    # Format error message in one step
+    location = f" in {context}" if context else ""
+    error_msg = f"Error: {type(e).__name__}{location}: {error_str}"
 
     # Log to stderr (FR-015: errors must be logged, not silent)
     if log_to_stderr:
@@ -10,13 +10,14 @@ Provides unified file scanning with:
 - Configurable scanning methods (walk vs rglob)
 """
 
+import os
 from collections.abc import Iterator
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from doc_manager_mcp.constants import MAX_FILES
 from doc_manager_mcp.core import (
-    matches_exclude_pattern,
+    compile_exclude_matcher,
     validate_path_boundary,
 )
 from doc_manager_mcp.core.patterns import build_exclude_patterns
@@ -57,7 +58,12 @@ def scan_project_files(
         # Only build gitignore if patterns were provided but gitignore wasn't
         _, gitignore_spec = build_exclude_patterns(project_path)
 
+    is_excluded = compile_exclude_matcher(exclude_patterns)
     file_count = 0
+    # Relative paths are sliced off the root prefix instead of via relative_to()
+    # (a "." root is dropped entirely from Path-normalized children)
+    root = os.fspath(project_path)
+    root_prefix_len = 0 if root == "." else len(os.path.join(root, ""))
 
     # Choose scanning method
     if use_walk:
@@ -75,14 +81,15 @@ def scan_project_files(
                 f"→ Consider processing a smaller directory or increasing the limit."
             )
 
-        # Only process files (not directories)
-        if not file_path.is_file():
-            continue
-
         # Skip hidden files/directories (files with parts starting with '.')
+        # Checked before is_file() so hidden trees cost no stat syscalls
         if any(part.startswith('.') for part in file_path.parts):
             continue
 
+        # Only process files (not directories)
+        if not file_path.is_file():
+            continue
+
         # Validate path boundary and check for malicious symlinks
         if validate_boundaries:
             try:
@@ -92,10 +99,10 @@ def scan_project_files(
                 continue
 
         # Get relative path for pattern matching
-        relative_path = str(file_path.relative_to(project_path)).replace('\\', '/')
+        relative_path = os.fspath(file_path)[root_prefix_len:].replace('\\', '/')
 
         # Skip if matches exclude patterns
-        if matches_exclude_pattern(relative_path, exclude_patterns):
+        if is_excluded(relative_path):
             continue
 
         # Skip if matches gitignore patterns
@@ -108,17 +115,31 @@ def scan_project_files(
 
 
 def _walk_files(project_path: Path) -> Iterator[Path]:
-    """Walk directory tree using Path.walk() (Python 3.12+).
+    """Walk directory tree with os.scandir(), pruning hidden directories.
+
+    Hidden entries are dropped at the DirEntry level so trees like .git are
+    never descended into. Symlinks to directories are yielded, not followed.
 
     Args:
         project_path: Root directory to walk
 
     Yields:
-        Path objects for all files in the tree
+        Path objects for all non-hidden files in the tree
     """
-    for root, _dirs, files in project_path.walk():
-        for file in files:
-            yield root / file
+    stack = [os.fspath(project_path)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.name.startswith('.'):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        yield Path(entry.path)
+        except OSError:
+            # Skip directories that can't be read
+            continue
 
 
 def categorize_file(file_path: Path) -> str:
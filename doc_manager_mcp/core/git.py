@@ -6,6 +6,9 @@ timeouts, and validation.
 
 from pathlib import Path
 
+# shutil.which() stats every PATH entry; once git has been found, skip the lookup
+_git_found = False
+
 
 async def run_git_command(cwd: Path, *args, check_git_available: bool = True) -> str | None:
     """Run a git command and return output.
@@ -29,13 +32,16 @@ async def run_git_command(cwd: Path, *args, check_git_available: bool = True) ->
     import asyncio
     import shutil
 
+    global _git_found
+
     # Check if git is available in PATH (T018)
-    if check_git_available:
+    if check_git_available and not _git_found:
         if shutil.which('git') is None:
             raise RuntimeError(
                 "Git is required but not found. Please install git and ensure it's in your PATH. "
                 "Visit https://git-scm.com/downloads for installation instructions."
             )
+        _git_found = True
 
     try:
         # Security: Using array form with hardcoded "git" binary and validated args
@@ -45,15 +51,17 @@ async def run_git_command(cwd: Path, *args, check_git_available: bool = True) ->
             *args,
             cwd=cwd,
             stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,  # stderr is never read
             stdin=asyncio.subprocess.DEVNULL,  # Prevent hanging on Windows
         )
 
         # 30-second timeout (T019)
-        stdout, _stderr = await asyncio.wait_for(proc.communicate(), timeout=30)
+        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=30)
 
         if proc.returncode == 0:
-            return stdout.decode().strip()
+            # Decode once; undecodable bytes (e.g. non-UTF-8 file names) must not
+            # turn a successful command into a failure
+            return stdout.decode('utf-8', 'replace').strip()
         else:
             return None
     except FileNotFoundError as err:
@@ -61,5 +69,30 @@ async def run_git_command(cwd: Path, *args, check_git_available: bool = True) ->
         raise RuntimeError("Git is required but not found. Please install git.") from err
     except asyncio.TimeoutError:
         return None
-    except Exception:
+    except OSError:
         return None
+
+
+async def get_git_head_info(cwd: Path) -> tuple[str | None, str | None]:
+    """Get the current commit hash and branch name with a single git call.
+
+    ``git rev-parse HEAD --abbrev-ref HEAD`` prints the full hash followed by
+    the branch name, saving a second process spawn.
+
+    Args:
+        cwd: Working directory inside the git repository
+
+    Returns:
+        Tuple of (commit hash, branch name); both None if git fails
+
+    Raises:
+        RuntimeError: If git binary is not found
+    """
+    output = await run_git_command(cwd, "rev-parse", "HEAD", "--abbrev-ref", "HEAD")
+    if not output:
+        return None, None
+
+    lines = output.splitlines()
+    if len(lines) != 2:
+        return None, None
+    return lines[0], lines[1]
@@ -7,7 +7,7 @@ Performance improvement: Eliminates 6x parsing in validate_docs and 7x in
 assess_quality (13x total when both tools run).
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
@@ -26,6 +26,7 @@ class ParsedMarkdown:
     links: list[dict[str, Any]]  # Links with text, url, line
     images: list[dict[str, Any]]  # Images with alt, src, line
     code_blocks: list[dict[str, Any]]  # Code blocks with language, code, line
+    inline_code: list[dict[str, Any]] = field(default_factory=list)  # Inline code spans with text, line
 
 
 class MarkdownCache:
@@ -49,6 +50,47 @@ class MarkdownCache:
     def __init__(self):
         """Initialize empty cache."""
         self._cache: dict[Path, ParsedMarkdown] = {}
+        self._contents: dict[Path, str] = {}
+        self._listings: dict[Path, list[Path]] = {}
+
+    def list_files(self, directory: Path) -> list[Path]:
+        """List markdown files (``*.md`` and ``*.markdown``) under a directory.
+
+        Checks that scan the whole docs tree share one recursive glob per
+        directory instead of each walking it again.
+
+        Args:
+            directory: Directory to search recursively
+
+        Returns:
+            New list of matching paths, in glob order
+        """
+        files = self._listings.get(directory)
+        if files is None:
+            files = []
+            for pattern in ["**/*.md", "**/*.markdown"]:
+                files.extend(directory.glob(pattern))
+            self._listings[directory] = files
+        return list(files)
+
+    def read(self, file_path: Path) -> str:
+        """Read markdown file content, using cache if available.
+
+        Validators running side by side share one read per file instead of
+        each opening every file again. Read errors propagate and are not cached.
+
+        Args:
+            file_path: Path to markdown file
+
+        Returns:
+            File content decoded as UTF-8
+        """
+        content = self._contents.get(file_path)
+        if content is None:
+            with open(file_path, encoding='utf-8') as f:
+                content = f.read()
+            self._contents[file_path] = content
+        return content
 
     def parse(self, file_path: Path, content: str) -> ParsedMarkdown:
         """Parse markdown content, using cache if available.
@@ -64,21 +106,23 @@ class MarkdownCache:
         if file_path in self._cache:
             return self._cache[file_path]
 
-        # Parse markdown using existing parser
+        # Parse markdown once and extract every component from the same tokens
         parser = MarkdownParser()
+        tokens = parser.parse(content)
 
-        # Extract all components (using correct method names)
-        headings = parser.extract_headers(content)
-        links = parser.extract_links(content)
-        images = parser.extract_images(content)
-        code_blocks = parser.extract_code_blocks(content)
+        headings = parser.extract_headers(content, tokens)
+        links = parser.extract_links(content, tokens)
+        images = parser.extract_images(content, tokens)
+        code_blocks = parser.extract_code_blocks(content, tokens)
+        inline_code = parser.extract_inline_code(content, tokens)
 
         # Cache the parsed result
         parsed = ParsedMarkdown(
             headings=headings,
             links=links,
             images=images,
-            code_blocks=code_blocks
+            code_blocks=code_blocks,
+            inline_code=inline_code
         )
 
         self._cache[file_path] = parsed
@@ -93,6 +137,8 @@ class MarkdownCache:
         - Running in watch mode with file modifications
         """
         self._cache.clear()
+        self._contents.clear()
+        self._listings.clear()
 
     def __len__(self) -> int:
         """Return number of cached files."""
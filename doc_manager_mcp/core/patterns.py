@@ -8,6 +8,10 @@ across init, update_baseline, and detect_changes tools.
 """
 
 import fnmatch
+import os
+import re
+from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -15,20 +19,22 @@ if TYPE_CHECKING:
     import pathspec
 
 
-def build_exclude_patterns(project_path: Path) -> tuple[list[str], "pathspec.PathSpec | None"]:
-    """Build exclude patterns from config, gitignore, and defaults.
-
-    Priority order: user patterns > gitignore > default patterns
+def _file_signature(path: Path) -> tuple[int, int] | None:
+    """Return (mtime_ns, size) for a file, or None if it does not exist."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
 
-    User patterns are checked first (highest priority), then gitignore patterns
-    (if enabled), then built-in defaults (lowest priority).
 
-    Args:
-        project_path: Project root directory
-
-    Returns:
-        Tuple of (exclude_patterns list, gitignore_spec object or None)
-    """
+@lru_cache(maxsize=32)
+def _build_exclude_patterns_cached(
+    project_path: Path,
+    config_signature: tuple[int, int] | None,
+    gitignore_signature: tuple[int, int] | None,
+) -> tuple[tuple[str, ...], "pathspec.PathSpec | None"]:
+    """Build exclude patterns; cached on the config and .gitignore signatures."""
     from doc_manager_mcp.constants import DEFAULT_EXCLUDE_PATTERNS
     from doc_manager_mcp.core import load_config, parse_gitignore
 
@@ -50,50 +56,190 @@ def build_exclude_patterns(project_path: Path) -> tuple[list[str], "pathspec.Pat
     # Built-in defaults added last (lowest priority)
     exclude_patterns.extend(DEFAULT_EXCLUDE_PATTERNS)
 
-    return exclude_patterns, gitignore_spec
+    return tuple(exclude_patterns), gitignore_spec
 
 
-def matches_exclude_pattern(path: str, exclude_patterns: list[str]) -> bool:
-    """Check if a path matches any of the exclude patterns.
+def build_exclude_patterns(project_path: Path) -> tuple[list[str], "pathspec.PathSpec | None"]:
+    """Build exclude patterns from config, gitignore, and defaults.
+
+    Priority order: user patterns > gitignore > default patterns
+
+    User patterns are checked first (highest priority), then gitignore patterns
+    (if enabled), then built-in defaults (lowest priority).
+
+    Results are memoized per project and invalidated when .doc-manager.yml or
+    .gitignore change (by mtime and size), so repeated calls within a workflow
+    do not re-read and re-parse either file.
 
     Args:
-        path: Relative path to check (string)
-        exclude_patterns: List of glob patterns (e.g., ["**/node_modules", "**/*.log"])
+        project_path: Project root directory
 
     Returns:
-        True if path should be excluded, False otherwise
+        Tuple of (exclude_patterns list, gitignore_spec object or None)
     """
-    # Normalize path separators
-    normalized_path = str(Path(path)).replace('\\', '/')
+    exclude_patterns, gitignore_spec = _build_exclude_patterns_cached(
+        project_path,
+        _file_signature(project_path / ".doc-manager.yml"),
+        _file_signature(project_path / ".gitignore"),
+    )
+    # Return a fresh list so callers can't mutate the cached patterns
+    return list(exclude_patterns), gitignore_spec
+
+
+@lru_cache(maxsize=1024)
+def _exclude_pattern_to_regex(pattern: str) -> str:
+    """Translate one exclude pattern into an anchored regex fragment.
+
+    Mirrors the glob semantics of matches_exclude_pattern:
+    - ``**/suffix`` matches ``suffix`` at the root or after any ``/``
+    - ``dir/**`` matches ``dir`` itself and everything beneath it
+    - anything else is a plain fnmatch glob (where ``*`` also crosses ``/``)
+    """
+    normalized_pattern = pattern.replace('\\', '/')
+
+    if normalized_pattern.startswith('**/'):
+        return r'(?s:.*/)?' + fnmatch.translate(normalized_pattern[3:])
+    if normalized_pattern.endswith('/**'):
+        return re.escape(normalized_pattern[:-3]) + r'(?s:/.*)?\Z'
+    return fnmatch.translate(normalized_pattern)
+
 
+@lru_cache(maxsize=64)
+def _compile_exclude_regex(exclude_patterns: tuple[str, ...]) -> "re.Pattern[str] | None":
+    if not exclude_patterns:
+        return None
+    union = '|'.join(f'(?:{_exclude_pattern_to_regex(p)})' for p in exclude_patterns)
+    # fnmatch is case-insensitive on Windows (os.path.normcase); keep that behaviour
+    flags = re.IGNORECASE if os.name == 'nt' else 0
+    return re.compile(union, flags)
+
+
+# Glob metacharacters, with [...] classes (including []...] and [!...]) as one unit
+_GLOB_META_RE = re.compile(r'\[!?\]?[^\]]*\]|[*?\[]')
+
+
+def _has_glob_meta(text: str) -> bool:
+    return _GLOB_META_RE.search(text) is not None
+
+
+@lru_cache(maxsize=64)
+def _split_exclude_patterns(
+    exclude_patterns: tuple[str, ...],
+) -> tuple[frozenset[str], frozenset[str], tuple[str, ...], tuple[str, ...]]:
+    """Split patterns into (file names, directory names, suffixes, remaining globs).
+
+    Nearly all exclude patterns take one of three literal forms, which are
+    answered exactly with set lookups and str.endswith instead of regex:
+    - ``**/name`` matches when the last path segment is ``name``
+    - ``**/name/**`` matches when any directory segment is ``name``
+    - ``*suffix`` / ``**/*suffix`` matches when the path ends with ``suffix``
+    Everything else is left for the combined regex.
+    """
+    fold = str.lower if os.name == 'nt' else str
+    names: set[str] = set()
+    dir_names: set[str] = set()
+    suffixes: set[str] = set()
+    rest: list[str] = []
     for pattern in exclude_patterns:
-        # Normalize pattern separators
         normalized_pattern = pattern.replace('\\', '/')
-
-        # Handle **/ prefix (matches any depth)
-        if normalized_pattern.startswith('**/'):
-            pattern_suffix = normalized_pattern[3:]  # Remove **/
-            # Check if pattern matches the full path or any part
-            if fnmatch.fnmatch(normalized_path, '*/' + pattern_suffix) or \
-               fnmatch.fnmatch(normalized_path, pattern_suffix):
-                return True
-            # Check if any component matches
-            parts = normalized_path.split('/')
-            for i, _part in enumerate(parts):
-                remaining = '/'.join(parts[i:])
-                if fnmatch.fnmatch(remaining, pattern_suffix):
-                    return True
-        # Handle /** suffix (matches directory and contents)
-        elif normalized_pattern.endswith('/**'):
-            dir_pattern = normalized_pattern[:-3]  # Remove /**
-            if normalized_path.startswith(dir_pattern + '/') or normalized_path == dir_pattern:
-                return True
-        # Regular pattern matching
+        tail = normalized_pattern[3:] if normalized_pattern.startswith('**/') else None
+        if tail and tail.endswith('/**') and '/' not in tail[:-3] and tail[:-3] and not _has_glob_meta(tail[:-3]):
+            dir_names.add(fold(tail[:-3]))
+        elif tail and '/' not in tail and not _has_glob_meta(tail):
+            names.add(fold(tail))
         else:
-            if fnmatch.fnmatch(normalized_path, normalized_pattern):
-                return True
+            glob = normalized_pattern if tail is None else tail
+            if len(glob) > 1 and glob[0] == '*' and not _has_glob_meta(glob[1:]):
+                suffixes.add(fold(glob[1:]))
+            else:
+                rest.append(pattern)
+    return frozenset(names), frozenset(dir_names), tuple(sorted(suffixes)), tuple(rest)
+
+
+def _exclude_pattern_literal(pattern: str) -> str:
+    """Return the longest literal run that every path matching ``pattern`` contains."""
+    normalized_pattern = pattern.replace('\\', '/')
+    if normalized_pattern.startswith('**/'):
+        normalized_pattern = normalized_pattern[3:]
+    elif normalized_pattern.endswith('/**'):
+        normalized_pattern = normalized_pattern[:-3]
+    return max(_GLOB_META_RE.split(normalized_pattern), key=len)
+
+
+@lru_cache(maxsize=64)
+def _compile_exclude_prefilter(exclude_patterns: tuple[str, ...]) -> "re.Pattern[str] | None":
+    """Build a literal-substring prefilter for the combined exclude regex.
+
+    Each remaining glob still carries a required literal (``cmake-build-``,
+    ``.egg-info/``); paths containing none of them can skip the alternation.
+    Returns None when some pattern has no literal (e.g. ``*``), since then no
+    path can be ruled out.
+    """
+    literals = {_exclude_pattern_literal(p) for p in exclude_patterns}
+    if not literals or '' in literals:
+        return None
+    union = '|'.join(re.escape(lit) for lit in sorted(literals))
+    flags = re.IGNORECASE if os.name == 'nt' else 0
+    return re.compile(union, flags)
+
+
+def compile_exclude_matcher(exclude_patterns: list[str]) -> Callable[[str], bool]:
+    """Compile exclude patterns into a single reusable matcher.
+
+    Simple ``**/name``, ``**/name/**`` and ``**/*suffix`` patterns are checked
+    with set lookups and str.endswith. The remaining patterns are combined into
+    one regex alternation, guarded by a literal-substring prefilter, so each
+    path costs at most one regex match instead of one fnmatch call per pattern.
+    Compiled matchers are cached per pattern list.
+
+    Args:
+        exclude_patterns: List of glob patterns (e.g., ["**/node_modules", "**/*.log"])
+
+    Returns:
+        Callable taking a relative path and returning True if it is excluded
+    """
+    patterns = tuple(exclude_patterns)
+    if not patterns:
+        return lambda _path: False
+
+    names, dir_names, suffixes, rest = _split_exclude_patterns(patterns)
+    regex = _compile_exclude_regex(rest)
+    match = regex.match if regex is not None else None
+    prefilter = _compile_exclude_prefilter(rest)
+    search = prefilter.search if prefilter is not None else None
+    fold_case = os.name == 'nt'
+
+    def matcher(path: str) -> bool:
+        # Only separators need normalizing; avoid a Path allocation per file
+        normalized = path.replace('\\', '/')
+        key = normalized.lower() if fold_case else normalized
+        if suffixes and key.endswith(suffixes):
+            return True
+        head, _, last = key.rpartition('/')
+        if last in names:
+            return True
+        if dir_names and head and not dir_names.isdisjoint(head.split('/')):
+            return True
+        if match is None:
+            return False
+        if search is not None and search(normalized) is None:
+            return False
+        return match(normalized) is not None
+
+    return matcher
+
+
+def matches_exclude_pattern(path: str, exclude_patterns: list[str]) -> bool:
+    """Check if a path matches any of the exclude patterns.
 
-    return False
+    Args:
+        path: Relative path to check (string)
+        exclude_patterns: List of glob patterns (e.g., ["**/node_modules", "**/*.log"])
+
+    Returns:
+        True if path should be excluded, False otherwise
+    """
+    return compile_exclude_matcher(exclude_patterns)(path)
 
 
 # File categorization patterns for detect_changes
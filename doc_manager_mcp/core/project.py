@@ -4,64 +4,137 @@ This module provides utilities for detecting project languages, documentation
 directories, markdown files, and documentation platforms.
 """
 
+import os
+from collections.abc import Callable
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from ..constants import MAX_FILES, DocumentationPlatform
 
+# (marker file, language) in priority order
+_LANGUAGE_INDICATORS: tuple[tuple[str, str], ...] = (
+    # Go
+    ("go.mod", "Go"),
+    # JavaScript/TypeScript
+    ("package.json", "JavaScript/TypeScript"),
+    # Rust
+    ("Cargo.toml", "Rust"),
+    # Python (check pyproject.toml first as it's the modern standard)
+    ("pyproject.toml", "Python"),
+    ("Pipfile", "Python"),
+    ("requirements.txt", "Python"),
+    ("setup.py", "Python"),
+    # Java/Kotlin
+    ("pom.xml", "Java"),
+    ("build.gradle", "Java"),
+    ("build.gradle.kts", "Kotlin"),
+    # Ruby
+    ("Gemfile", "Ruby"),
+    # PHP
+    ("composer.json", "PHP"),
+    # C/C++
+    ("CMakeLists.txt", "C/C++"),
+    # Scala
+    ("build.sbt", "Scala"),
+    # Elixir
+    ("mix.exs", "Elixir"),
+    # Swift
+    ("Package.swift", "Swift"),
+)
+
+_DOCS_DIR_CANDIDATES = ("docs", "doc", "documentation", "docsite", "website/docs")
+
+
+def _scan_root(root: str) -> tuple[set[str], set[str]]:
+    """List the project root once, returning (entry names, directory names).
+
+    Uses the file type cached by readdir, so marker checks become set lookups
+    instead of one stat per candidate. Names are normcased so lookups stay
+    case-insensitive where the filesystem is.
+    """
+    names: set[str] = set()
+    dirs: set[str] = set()
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                name = os.path.normcase(entry.name)
+                names.add(name)
+                try:
+                    if entry.is_dir():
+                        dirs.add(name)
+                except OSError:
+                    pass
+    except OSError:
+        pass
+    return names, dirs
+
+
+def _language_from_names(names: set[str]) -> str:
+    for file, language in _LANGUAGE_INDICATORS:
+        if os.path.normcase(file) in names:
+            return language
+    return "Unknown"
+
+
+def _docs_dir_from_dirs(project_path: Path, dirs: set[str]) -> Path | None:
+    root = os.fspath(project_path)
+    for dir_name in _DOCS_DIR_CANDIDATES:
+        head, _, tail = dir_name.partition("/")
+        # Nested candidates (website/docs) need one stat, only if the parent exists
+        if os.path.normcase(head) in dirs and (not tail or os.path.isdir(os.path.join(root, head, tail))):
+            return project_path / dir_name
+    return None
+
 
 def detect_project_language(project_path: Path) -> str:
     """Detect primary programming language of project.
 
     Returns the detected language based on project files.
     """
-    language_indicators = {
-        # Go
-        "go.mod": "Go",
-        # JavaScript/TypeScript
-        "package.json": "JavaScript/TypeScript",
-        # Rust
-        "Cargo.toml": "Rust",
-        # Python (check pyproject.toml first as it's the modern standard)
-        "pyproject.toml": "Python",
-        "Pipfile": "Python",
-        "requirements.txt": "Python",
-        "setup.py": "Python",
-        # Java/Kotlin
-        "pom.xml": "Java",
-        "build.gradle": "Java",
-        "build.gradle.kts": "Kotlin",
-        # Ruby
-        "Gemfile": "Ruby",
-        # PHP
-        "composer.json": "PHP",
-        # C/C++
-        "CMakeLists.txt": "C/C++",
-        # Scala
-        "build.sbt": "Scala",
-        # Elixir
-        "mix.exs": "Elixir",
-        # Swift
-        "Package.swift": "Swift",
-    }
-
-    for file, language in language_indicators.items():
-        if (project_path / file).exists():
-            return language
-
-    return "Unknown"
+    names, _ = _scan_root(os.fspath(project_path))
+    return _language_from_names(names)
 
 
 def find_docs_directory(project_path: Path) -> Path | None:
     """Find documentation directory in project."""
-    common_doc_dirs = ["docs", "doc", "documentation", "docsite", "website/docs"]
+    _, dirs = _scan_root(os.fspath(project_path))
+    return _docs_dir_from_dirs(project_path, dirs)
 
-    for dir_name in common_doc_dirs:
-        doc_path = project_path / dir_name
-        if doc_path.exists() and doc_path.is_dir():
-            return doc_path
 
-    return None
+@dataclass(slots=True)
+class ProjectProbe:
+    """Project markers gathered from a single scan of the project root.
+
+    Lets tools that need the language, docs directory and platform share one
+    os.scandir() instead of each probing marker files separately.
+    """
+
+    language: str
+    docs_dir: Path | None
+    platform: DocumentationPlatform
+
+
+def probe_project(project_path: Path) -> ProjectProbe:
+    """Scan the project root once and derive language, docs directory and platform.
+
+    Results match detect_project_language(), find_docs_directory() and
+    detect_platform_quick(), which would otherwise each scan the root.
+    """
+    root = os.fspath(project_path)
+    names, dirs = _scan_root(root)
+
+    def exists(*parts: str) -> bool:
+        # Only nested markers need a stat, and only if their parent exists
+        if len(parts) == 1:
+            return os.path.normcase(parts[0]) in names
+        return os.path.normcase(parts[0]) in dirs and os.path.exists(os.path.join(root, *parts))
+
+    return ProjectProbe(
+        language=_language_from_names(names),
+        docs_dir=_docs_dir_from_dirs(project_path, dirs),
+        platform=_quick_platform(exists),
+    )
 
 
 def get_doc_relative_path(file_path: Path, docs_path: Path, project_path: Path) -> str:
@@ -102,6 +175,30 @@ def get_doc_relative_path(file_path: Path, docs_path: Path, project_path: Path)
         return str(file_path.relative_to(project_path)).replace("\\", "/")
 
 
+_MARKDOWN_SUFFIXES = ('.md', '.markdown')
+
+
+def _iter_markdown_entries(docs_path: Path):
+    """Yield (path, is_symlink) for every markdown file under docs_path.
+
+    One os.scandir() walk covers both .md and .markdown, and file type and
+    symlink checks come from the directory entries rather than extra stats.
+    Symlinked directories are not descended into, matching Path.glob("**").
+    """
+    pending = [str(docs_path)]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif os.path.normcase(entry.name).endswith(_MARKDOWN_SUFFIXES):
+                        if entry.is_file():
+                            yield Path(entry.path), entry.is_symlink()
+        except OSError:
+            continue
+
+
 def find_markdown_files(
     docs_path: Path,
     project_path: Path | None = None,
@@ -135,35 +232,42 @@ def find_markdown_files(
     file_count = 0
     limit = max_files if max_files is not None else MAX_FILES
 
-    for pattern in ["**/*.md", "**/*.markdown"]:
-        for file_path in docs_path.glob(pattern):
-            if file_count >= limit:
-                raise ValueError(
-                    f"File count limit exceeded (maximum: {limit:,} files)\n"
-                    f"→ Consider processing a smaller directory or increasing the limit."
-                )
-
-            # Optionally validate path boundary and check for malicious symlinks
-            if validate_boundaries:
+    for file_path, is_symlink in _iter_markdown_entries(docs_path):
+        if file_count >= limit:
+            raise ValueError(
+                f"File count limit exceeded (maximum: {limit:,} files)\n"
+                f"→ Consider processing a smaller directory or increasing the limit."
+            )
+
+        # Optionally validate path boundary and check for malicious symlinks
+        if validate_boundaries:
+            try:
+                _ = validate_path_boundary(file_path, project_path)  # type: ignore
+                markdown_files.append(file_path)
+                file_count += 1
+            except ValueError:
+                # Skip files that escape project boundary or malicious symlinks
+                continue
+        else:
+            # Symlinked docs are only read when they stay inside the project,
+            # so a link to e.g. ~/.ssh never has its contents validated
+            if project_path is not None and is_symlink:
                 try:
-                    _ = validate_path_boundary(file_path, project_path)  # type: ignore
-                    markdown_files.append(file_path)
-                    file_count += 1
+                    _ = validate_path_boundary(file_path, project_path)
                 except ValueError:
-                    # Skip files that escape project boundary or malicious symlinks
                     continue
-            else:
-                markdown_files.append(file_path)
-                file_count += 1
+            markdown_files.append(file_path)
+            file_count += 1
 
     # Optionally include root README.md (case-insensitive)
     if include_root_readme and project_path is not None:
         # Find README case-insensitively
         root_readme = None
-        for file in project_path.iterdir():
-            if file.is_file() and file.name.lower() == "readme.md":
-                root_readme = file
-                break
+        with os.scandir(project_path) as entries:
+            for entry in entries:
+                if entry.name.lower() == "readme.md" and entry.is_file():
+                    root_readme = Path(entry.path)
+                    break
 
         if root_readme is not None:
             if file_count >= limit:
@@ -221,7 +325,7 @@ def is_public_symbol(
         - Python: configurable strategy + pattern filtering
         - JavaScript/TypeScript: public if no leading underscore
     """
-    from fnmatch import fnmatch
+    from .api_coverage import matches_any_pattern
 
     if not symbol.name:
         return False
@@ -238,12 +342,12 @@ def is_public_symbol(
 
         # Step 1: Check include patterns (force-include override)
         if include_patterns:
-            if any(fnmatch(name, pattern) for pattern in include_patterns):
+            if matches_any_pattern(name, include_patterns):
                 return True
 
         # Step 2: Check exclude patterns
         if exclude_patterns:
-            if any(fnmatch(name, pattern) for pattern in exclude_patterns):
+            if matches_any_pattern(name, exclude_patterns):
                 return False
 
         # Step 3: Apply strategy
@@ -328,13 +432,23 @@ def detect_platform_quick(project_path: Path) -> DocumentationPlatform:
     Returns:
         DocumentationPlatform enum value
     """
-    if (project_path / "docsite" / "hugo.yaml").exists() or (project_path / "hugo.toml").exists():
+    root = os.fspath(project_path)
+
+    def exists(*parts: str) -> bool:
+        return os.path.exists(os.path.join(root, *parts))
+
+    return _quick_platform(exists)
+
+
+def _quick_platform(exists: Callable[..., bool]) -> DocumentationPlatform:
+    """Map platform config files to a platform, given an existence check."""
+    if exists("docsite", "hugo.yaml") or exists("hugo.toml"):
         return DocumentationPlatform.HUGO
-    elif (project_path / "docusaurus.config.js").exists():
+    elif exists("docusaurus.config.js"):
         return DocumentationPlatform.DOCUSAURUS
-    elif (project_path / "mkdocs.yml").exists():
+    elif exists("mkdocs.yml"):
         return DocumentationPlatform.MKDOCS
-    elif (project_path / "conf.py").exists():
+    elif exists("conf.py"):
         return DocumentationPlatform.SPHINX
     else:
         return DocumentationPlatform.UNKNOWN
@@ -4,8 +4,15 @@ This module provides utilities for enforcing response size limits and
 safe JSON serialization to comply with MCP protocol constraints.
 """
 
+import json
+import os
 from typing import Any, overload
 
+try:
+    import orjson
+except ImportError:  # optional speedup for large baseline files
+    orjson = None
+
 
 @overload
 def enforce_response_limit(response: dict[str, Any], limit: int = 25000) -> dict[str, Any]: ...
@@ -49,6 +56,55 @@ def enforce_response_limit(response: str | dict, limit: int = 25000) -> str | di
     return truncated
 
 
+# Large write buffer so streamed JSON chunks reach disk in few syscalls
+_JSON_WRITE_BUFFER = 1 << 20
+
+
+def write_json_file(file: str | os.PathLike[str] | int, obj: Any) -> None:
+    """Write object to disk as indented UTF-8 JSON.
+
+    Uses orjson when it is installed, which is several times faster than the
+    standard library for large baselines and produces bytes directly. Without
+    orjson the output is streamed through json.dump() so the full document is
+    never held in memory as one string.
+
+    Args:
+        file: Path to write, or an open file descriptor (closed afterwards)
+        obj: Object to serialize
+    """
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        with open(file, "wb") as f:
+            f.write(data)
+        return
+
+    with open(file, "w", encoding="utf-8", buffering=_JSON_WRITE_BUFFER) as f:
+        json.dump(obj, f, indent=2, ensure_ascii=False)
+
+
+def read_json_file(file: str | os.PathLike[str]) -> Any:
+    """Read a JSON document from disk.
+
+    Counterpart to write_json_file(): parses the raw bytes with orjson when it
+    is installed, otherwise with json.loads(), skipping the text decode step.
+
+    Args:
+        file: Path to read
+
+    Returns:
+        Parsed JSON value
+
+    Raises:
+        OSError: If the file can't be read
+        ValueError: If the content is not valid JSON (both parsers raise a subclass)
+    """
+    with open(file, "rb") as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def safe_json_dumps(obj: Any, **kwargs) -> str:
     """Safely serialize object to JSON with error handling (T050 - FR-012).
 
@@ -63,8 +119,6 @@ def safe_json_dumps(obj: Any, **kwargs) -> str:
         Prevents crashes from unserializable objects (e.g., datetime, Path, custom classes).
         Returns a structured error message that's still valid for MCP responses.
     """
-    import json
-
     try:
         return json.dumps(obj, **kwargs)
     except (TypeError, ValueError) as e:
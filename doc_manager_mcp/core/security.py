@@ -4,20 +4,44 @@ This module provides cross-platform file locking utilities to prevent
 concurrent access issues and ensure data integrity.
 """
 
+import os
 import platform
 import time
 from contextlib import contextmanager
 from pathlib import Path
 
+# Contended locks are polled with exponential backoff between these bounds
+_LOCK_POLL_INITIAL = 0.01
+_LOCK_POLL_MAX = 0.25
+
+
+def _is_current_lock_file(lock_handle, lock_file_path: Path) -> bool:
+    """Check the locked handle is still the file at lock_file_path.
+
+    A holder unlinks the lock file on release, so a waiter that opened it
+    earlier can end up locking an orphaned inode while a newcomer locks a
+    fresh file at the same path.
+    """
+    try:
+        on_disk = os.stat(lock_file_path)
+    except OSError:
+        return False
+    held = os.fstat(lock_handle.fileno())
+    return (on_disk.st_dev, on_disk.st_ino) == (held.st_dev, held.st_ino)
+
 
 @contextmanager
 def file_lock(file_path: Path, timeout: int = 5, retries: int = 3):
     """Acquire exclusive file lock with timeout and retry (cross-platform).
 
+    A held lock is polled with a short exponential backoff, so waiters get
+    the lock within milliseconds of its release instead of after a fixed
+    one-second sleep.
+
     Args:
         file_path: Path to file to lock
         timeout: Lock acquisition timeout in seconds (default: 5 per clarification)
-        retries: Number of retry attempts (default: 3 per clarification)
+        retries: Minimum number of attempts before giving up (default: 3 per clarification)
 
     Yields:
         None when lock is acquired
@@ -36,9 +60,14 @@ def file_lock(file_path: Path, timeout: int = 5, retries: int = 3):
     acquired = False
 
     try:
-        for attempt in range(retries):
+        deadline = time.monotonic() + timeout
+        delay = _LOCK_POLL_INITIAL
+        attempt = 0
+
+        while True:
+            attempt += 1
             try:
-                # Create lock file
+                # Create lock file (reopened each attempt, since release unlinks it)
                 lock_handle = open(lock_file_path, 'w')
 
                 # Platform-specific locking
@@ -48,23 +77,35 @@ def file_lock(file_path: Path, timeout: int = 5, retries: int = 3):
                 else:
                     import fcntl  # type: ignore[attr-defined]
                     fcntl.flock(lock_handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)  # type: ignore[attr-defined]
+                    if not _is_current_lock_file(lock_handle, lock_file_path):
+                        raise BlockingIOError("lock file was replaced while waiting")
 
                 acquired = True
                 break  # Lock acquired successfully
             except OSError as e:
-                if attempt < retries - 1:
-                    # Wait before retry
-                    time.sleep(1)
-                    continue
-                else:
-                    # Final attempt failed
-                    raise TimeoutError(f"Failed to acquire lock on {file_path.name} after {retries} attempts ({timeout}s timeout)") from e
+                if lock_handle:
+                    lock_handle.close()
+                    lock_handle = None
+                remaining = deadline - time.monotonic()
+                if attempt >= retries and remaining <= 0:
+                    raise TimeoutError(f"Failed to acquire lock on {file_path.name} after {attempt} attempts ({timeout}s timeout)") from e
+                # Wait before retry
+                time.sleep(min(delay, remaining) if remaining > 0 else delay)
+                delay = min(delay * 2, _LOCK_POLL_MAX)
 
         yield  # Lock held, execute critical section
 
     finally:
         # Always release lock
         if acquired and lock_handle:
+            if platform.system() != 'Windows':
+                # Unlink while still holding the lock, so nobody can lock this
+                # inode after release alongside a newcomer's fresh lock file
+                try:
+                    lock_file_path.unlink(missing_ok=True)
+                except Exception:  # noqa: S110
+                    # Best effort cleanup - lock file removal failures are non-critical
+                    pass
             try:
                 if platform.system() == 'Windows':
                     import msvcrt
@@ -79,10 +120,10 @@ def file_lock(file_path: Path, timeout: int = 5, retries: int = 3):
         if lock_handle:
             lock_handle.close()
 
-        # Remove lock file
-        try:
-            if lock_file_path.exists():
-                lock_file_path.unlink()
-        except Exception:  # noqa: S110
-            # Best effort cleanup - lock file removal failures are non-critical
-            pass
+        # Remove lock file (Windows cannot delete it while the handle is open)
+        if acquired and platform.system() == 'Windows':
+            try:
+                lock_file_path.unlink(missing_ok=True)
+            except Exception:  # noqa: S110
+                # Best effort cleanup - lock file removal failures are non-critical
+                pass
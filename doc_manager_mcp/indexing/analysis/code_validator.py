@@ -6,10 +6,19 @@ in multiple programming languages using TreeSitter parsers.
 
 from __future__ import annotations
 
+import hashlib
+import threading
 from typing import Any
 
 from .tree_sitter import SymbolIndexer
 
+# Syntax results keyed by (language, BLAKE2b digest of the snippet). Docs repeat
+# the same snippets across files and validate_docs runs, so unchanged snippets
+# skip TreeSitter parsing for the lifetime of the server process.
+_SYNTAX_RESULT_CACHE: dict[tuple[str, bytes], tuple[dict[str, Any], ...]] = {}
+_SYNTAX_RESULT_CACHE_MAX = 4096
+_SYNTAX_RESULT_CACHE_LOCK = threading.Lock()
+
 
 class CodeValidator:
     """Validate code syntax using TreeSitter parsers.
@@ -60,27 +69,38 @@ class CodeValidator:
                 "warning": f"Language '{language}' not supported for validation"
             }
 
-        # Parse code with TreeSitter
         source_bytes = code.encode("utf8")
-        tree = self.indexer.parsers[language].parse(source_bytes)
+        cache_key = (language, hashlib.blake2b(source_bytes, digest_size=16).digest())
+        cached = _SYNTAX_RESULT_CACHE.get(cache_key)
 
-        # Check for syntax errors
-        if tree.root_node.has_error:
-            errors = self._find_error_nodes(tree.root_node, source_bytes)
-            return {
-                "valid": False,
-                "errors": errors,
-                "warning": None
-            }
+        if cached is None:
+            # Parse code with TreeSitter
+            tree = self.indexer.parsers[language].parse(source_bytes)
+
+            # Check for syntax errors
+            if tree.root_node.has_error:
+                cached = tuple(self._find_error_nodes(tree.root_node, source_bytes))
+            else:
+                cached = ()
 
+            with _SYNTAX_RESULT_CACHE_LOCK:
+                if len(_SYNTAX_RESULT_CACHE) >= _SYNTAX_RESULT_CACHE_MAX:
+                    # Evict the oldest entry (dicts preserve insertion order)
+                    del _SYNTAX_RESULT_CACHE[next(iter(_SYNTAX_RESULT_CACHE))]
+                _SYNTAX_RESULT_CACHE[cache_key] = cached
+
+        # Hand out copies so callers can't alter the cached errors
         return {
-            "valid": True,
-            "errors": [],
+            "valid": not cached,
+            "errors": [dict(error) for error in cached],
             "warning": None
         }
 
     def _find_error_nodes(self, node: Any, source: bytes) -> list[dict[str, Any]]:
-        """Recursively find all ERROR nodes in the syntax tree.
+        """Find all ERROR and MISSING nodes in the syntax tree, in document order.
+
+        Only subtrees that report has_error are visited, so the walk touches the
+        paths to the errors rather than every node of the snippet.
 
         Args:
             node: TreeSitter node to search with byte offset positions
@@ -94,32 +114,37 @@ class CodeValidator:
             Must use bytes for slicing, then decode to string.
         """
         errors = []
-
-        # Check if this node is an error
-        if node.type == "ERROR" or node.is_missing:
-            # Extract error context using byte offsets
-            try:
-                error_text = source[node.start_byte:node.end_byte].decode("utf8")
-            except (UnicodeDecodeError, IndexError):
-                error_text = ""
-
-            # Build error message
-            if node.is_missing:
-                message = f"Missing {node.type}"
-            else:
-                message = "Syntax error"
-
-            errors.append({
-                "type": "syntax_error",
-                "line": node.start_point[0] + 1,  # 0-indexed to 1-indexed
-                "column": node.start_point[1] + 1,
-                "text": error_text[:50],  # Limit context length
-                "message": message
-            })
-
-        # Recursively check children
-        for child in node.children:
-            errors.extend(self._find_error_nodes(child, source))
+        stack = [node]
+
+        while stack:
+            node = stack.pop()
+
+            # Check if this node is an error
+            if node.type == "ERROR" or node.is_missing:
+                # Extract error context using byte offsets; 50 UTF-8 characters
+                # fit in 200 bytes, so large error spans aren't decoded in full
+                try:
+                    end_byte = min(node.end_byte, node.start_byte + 200)
+                    error_text = source[node.start_byte:end_byte].decode("utf8", "ignore")
+                except IndexError:
+                    error_text = ""
+
+                # Build error message
+                if node.is_missing:
+                    message = f"Missing {node.type}"
+                else:
+                    message = "Syntax error"
+
+                errors.append({
+                    "type": "syntax_error",
+                    "line": node.start_point[0] + 1,  # 0-indexed to 1-indexed
+                    "column": node.start_point[1] + 1,
+                    "text": error_text[:50],  # Limit context length
+                    "message": message
+                })
+
+            # Visit children with errors first-to-last (the stack pops in reverse)
+            stack.extend(child for child in reversed(node.children) if child.has_error or child.is_missing)
 
         return errors
 
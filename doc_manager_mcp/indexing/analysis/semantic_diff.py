@@ -18,18 +18,18 @@ This information can be used for:
 """
 
 import json
-import os
 import tempfile
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 
+from doc_manager_mcp.core.responses import write_json_file
 from doc_manager_mcp.core.security import file_lock
 
 from .tree_sitter import ConfigField, Symbol, SymbolType
 
 
-@dataclass
+@dataclass(slots=True)
 class SemanticChange:
     """Represents a semantic change detected in code symbols.
 
@@ -70,7 +70,7 @@ class SemanticChange:
     new_doc: str | None = None  # Task 3.3: Docstring change tracking
 
 
-@dataclass
+@dataclass(slots=True)
 class ConfigFieldChange:
     """Represents a change detected in a config field.
 
@@ -279,9 +279,7 @@ def save_symbol_baseline(
     )
 
     try:
-        with os.fdopen(temp_fd, "w", encoding="utf-8") as f:
-            json.dump(baseline_data, f, indent=2, ensure_ascii=False)
-            f.flush()
+        write_json_file(temp_fd, baseline_data)
 
         # Atomic rename with file locking to prevent concurrent write corruption
         # (overwrites existing file on POSIX, may not be atomic on Windows)
@@ -1,12 +1,19 @@
 """TreeSitter-based code symbol indexer for accurate AST parsing."""
 
+import hashlib
+import multiprocessing
+import os
+import re
 import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from doc_manager_mcp.core import load_config, matches_exclude_pattern
+from doc_manager_mcp.core import compile_exclude_matcher, load_config
 
 # TreeSitter imports (will be available after pip install)
 if TYPE_CHECKING:
@@ -45,6 +52,59 @@ except ImportError:
     )
 
 
+# Per-file symbol cache keyed by (relative path, content digest).
+# Extraction depends only on those two inputs, so unchanged files can skip
+# TreeSitter parsing entirely across index_project() calls in one server process.
+# The digest is never persisted, so a fast 128-bit BLAKE2b is used instead of SHA-256.
+_FILE_SYMBOL_CACHE: dict[tuple[str, bytes], tuple["Symbol", ...]] = {}
+_FILE_SYMBOL_CACHE_MAX = 4096
+# Indexers run in worker threads (asyncio.to_thread), so lookups, evictions
+# and inserts are serialized
+_FILE_SYMBOL_CACHE_LOCK = threading.Lock()
+
+# Projects with at least this many source files are indexed with a process pool
+_PARALLEL_INDEX_MIN_FILES = 200
+_PARALLEL_INDEX_MAX_WORKERS = 8
+
+# Source patterns of the form "**/*.ext", which a single directory walk can answer
+_RECURSIVE_SUFFIX_RE = re.compile(r'\*\*/\*(\.[A-Za-z0-9_]+)')
+
+# Per-thread TreeSitter parsers shared by all SymbolIndexer instances
+_THREAD_PARSERS = threading.local()
+
+# Config-marker alternations, compiled once so each node's text is scanned in a
+# single pass instead of one substring search per marker.
+_PY_ATTRS_DECORATOR_RE = re.compile(rb"@(?:attr\.s|attrs|define)")
+_PY_PYDANTIC_BASE_RE = re.compile(rb"BaseModel|BaseSettings")
+_GO_CONFIG_TAG_RE = re.compile(rb"(?:yaml|json):")
+_RUST_SERDE_DERIVE_RE = re.compile(rb"Serialize|Deserialize|serde::")
+
+# File-level hints: a file whose bytes contain none of these markers cannot hold
+# a config class/struct, so per-node config detection is skipped entirely
+_PY_CONFIG_HINT_RE = re.compile(rb"dataclass|attr|define|BaseModel|BaseSettings|TypedDict")
+_RUST_CONFIG_HINT_RE = re.compile(rb"Serialize|Deserialize|serde")
+
+# Field-level attribute parsers used while extracting config fields
+_PY_FIELD_DESCRIPTION_RE = re.compile(r'description\s*=\s*["\']([^"\']+)["\']')
+_GO_STRUCT_TAG_RE = re.compile(r'(\w+):"([^"]*)"')
+_RUST_SERDE_RENAME_RE = re.compile(r'rename\s*=\s*"([^"]+)"')
+_RUST_SERDE_SKIP_IF_RE = re.compile(r'skip_serializing_if\s*=\s*"([^"]+)"')
+
+# Source file extension -> parser language
+_EXTENSION_LANGUAGES = {
+    "go": "go",
+    "py": "python",
+    "js": "javascript",
+    "jsx": "javascript",
+    "ts": "typescript",
+    "tsx": "tsx",
+    "rs": "rust",
+}
+
+_GO_CONFIG_SUFFIXES = ("Config", "Settings", "Options")
+_TS_CONFIG_SUFFIXES = ("Config", "Options", "Settings", "Props")
+
+
 class SymbolType(str, Enum):
     """Types of code symbols that can be indexed."""
 
@@ -60,7 +120,7 @@ class SymbolType(str, Enum):
     CONFIG_FIELD = "config_field"  # Configuration field in config models
 
 
-@dataclass
+@dataclass(slots=True)
 class ConfigField:
     """Represents a configuration field in a config struct/class/model.
 
@@ -81,7 +141,7 @@ class ConfigField:
     doc: str | None = None  # Field docstring or description
 
 
-@dataclass
+@dataclass(slots=True)
 class Symbol:
     """Represents a code symbol found in the codebase."""
 
@@ -127,24 +187,46 @@ class SymbolIndexer:
         assert rust_language is not None
 
         self.parsers = {
-            "go": self._create_parser(go_language),
-            "python": self._create_parser(py_language),
-            "javascript": self._create_parser(js_language),
-            "typescript": self._create_parser(ts_language),
-            "tsx": self._create_parser(tsx_language),
-            "markdown": self._create_parser(md_language),
-            "bash": self._create_parser(bash_language),
-            "yaml": self._create_parser(yaml_language),
-            "rust": self._create_parser(rust_language),
+            "go": self._create_parser("go", go_language),
+            "python": self._create_parser("python", py_language),
+            "javascript": self._create_parser("javascript", js_language),
+            "typescript": self._create_parser("typescript", ts_language),
+            "tsx": self._create_parser("tsx", tsx_language),
+            "markdown": self._create_parser("markdown", md_language),
+            "bash": self._create_parser("bash", bash_language),
+            "yaml": self._create_parser("yaml", yaml_language),
+            "rust": self._create_parser("rust", rust_language),
+        }
+
+        # Per-language symbol extractors (dispatch table for _index_file)
+        self._extractors = {
+            "go": self._extract_go_symbols,
+            "python": self._extract_python_symbols,
+            "javascript": self._extract_js_symbols,
+            "typescript": self._extract_js_symbols,
+            "tsx": self._extract_js_symbols,
+            "rust": self._extract_rust_symbols,
         }
 
         # Symbol index: symbol_name -> list of Symbol objects
         # Multiple symbols can have same name (overloading, different files)
         self.index: dict[str, list[Symbol]] = {}
 
-    def _create_parser(self, language: Language) -> Parser:
-        """Create a TreeSitter parser for a language."""
-        parser = Parser(language)
+        # Symbols collected for the file currently being extracted
+        self._file_symbols: list[Symbol] | None = None
+
+    def _create_parser(self, name: str, language: Language) -> Parser:
+        """Get a TreeSitter parser for a language, reused across indexers.
+
+        Parsers are cached per thread: a Parser must not be used by two threads
+        at once, and validators run indexers concurrently via asyncio.to_thread.
+        """
+        parsers = getattr(_THREAD_PARSERS, "parsers", None)
+        if parsers is None:
+            parsers = _THREAD_PARSERS.parsers = {}
+        parser = parsers.get(name)
+        if parser is None:
+            parser = parsers[name] = Parser(language)
         return parser
 
     def index_project(self, project_path: Path, file_patterns: list[str] | None = None) -> dict[str, list[Symbol]]:
@@ -202,27 +284,40 @@ class SymbolIndexer:
             from doc_manager_mcp.core import parse_gitignore
             gitignore_spec = parse_gitignore(project_path)
 
+        is_excluded = compile_exclude_matcher(exclude_patterns)
+        suffixes = _recursive_suffixes(file_patterns)
+        if suffixes is not None:
+            # Default-style "**/*.ext" patterns: one walk instead of one glob per pattern
+            candidates = _walk_by_suffix(project_path, suffixes, exclude_patterns)
+        else:
+            candidates = (file_path for pattern in file_patterns for file_path in project_path.glob(pattern))
+
         source_files = []
-        for pattern in file_patterns:
-            for file_path in project_path.glob(pattern):
-                if not file_path.is_file():
-                    continue
+        for file_path in candidates:
+            # Get relative path for pattern matching
+            try:
+                relative_path = str(file_path.relative_to(project_path)).replace('\\', '/')
+            except ValueError:
+                continue
 
-                # Get relative path for pattern matching
-                try:
-                    relative_path = str(file_path.relative_to(project_path)).replace('\\', '/')
-                except ValueError:
-                    continue
+            # Check if excluded using proper pattern matching (user + defaults)
+            if is_excluded(relative_path):
+                continue
 
-                # Check if excluded using proper pattern matching (user + defaults)
-                if matches_exclude_pattern(relative_path, exclude_patterns):
-                    continue
+            # Check gitignore patterns (if enabled)
+            if gitignore_spec and gitignore_spec.match_file(relative_path):
+                continue
 
-                # Check gitignore patterns (if enabled)
-                if gitignore_spec and gitignore_spec.match_file(relative_path):
-                    continue
+            # Stat last so excluded trees (node_modules, venv, ...) cost no syscalls
+            if not file_path.is_file():
+                continue
 
-                source_files.append(file_path)
+            source_files.append(file_path)
+
+        # Large projects: extract uncached files across processes
+        if len(source_files) >= _PARALLEL_INDEX_MIN_FILES and (os.cpu_count() or 1) > 1:
+            self._index_files_parallel(source_files, project_path)
+            return self.index
 
         # Index each file
         for file_path in source_files:
@@ -236,51 +331,106 @@ class SymbolIndexer:
 
     def _index_file(self, file_path: Path, project_path: Path):
         """Index symbols in a single file."""
+        source = self._read_source(file_path, project_path)
+        if source is None:
+            return
+        language, relative_path, source_bytes = source
+
+        # Reuse symbols from a previous parse of identical content
+        cache_key = _symbol_cache_key(relative_path, source_bytes)
+        symbols = _get_cached_file_symbols(cache_key)
+        if symbols is None:
+            symbols = self._extract_symbols(source_bytes, language, relative_path)
+            _cache_file_symbols(cache_key, symbols)
+
+        for symbol in symbols:
+            self._add_symbol(symbol)
+
+    def _index_files_parallel(self, source_files: list[Path], project_path: Path):
+        """Index files, extracting uncached ones in a process pool.
+
+        Files are read and checked against the symbol cache here; only cache
+        misses are sent to worker processes. Symbols are added to the index in
+        source_files order, so the result matches serial indexing.
+        """
+        entries: list[tuple[Path, tuple[str, bytes], tuple[Symbol, ...] | None]] = []
+        misses: list[tuple[bytes, str, str]] = []
+        for file_path in source_files:
+            source = self._read_source(file_path, project_path)
+            if source is None:
+                continue
+            language, relative_path, source_bytes = source
+            cache_key = _symbol_cache_key(relative_path, source_bytes)
+            cached = _get_cached_file_symbols(cache_key)
+            entries.append((file_path, cache_key, cached))
+            if cached is None:
+                misses.append((source_bytes, language, relative_path))
+
+        results: list[tuple[tuple[Symbol, ...] | None, str | None]]
+        try:
+            max_workers = min(os.cpu_count() or 1, _PARALLEL_INDEX_MAX_WORKERS)
+            # spawn: forking a process that already runs threads is unsafe
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as executor:
+                results = list(executor.map(_extract_symbols_worker, misses, chunksize=16))
+        except (OSError, RuntimeError, BrokenProcessPool) as e:
+            print(f"Warning: Parallel indexing unavailable, indexing serially: {e}", file=sys.stderr)
+            results = [_extract_symbols_worker(miss, self) for miss in misses]
+
+        extracted = iter(results)
+        for file_path, cache_key, symbols in entries:
+            if symbols is None:
+                symbols, error = next(extracted)
+                if symbols is None:
+                    print(f"Warning: Failed to index {file_path}: {error}", file=sys.stderr)
+                    continue
+                _cache_file_symbols(cache_key, symbols)
+
+            for symbol in symbols:
+                self._add_symbol(symbol)
+
+    def _read_source(self, file_path: Path, project_path: Path) -> tuple[str, str, bytes] | None:
+        """Read a source file for indexing.
+
+        Returns:
+            (language, relative_path, source_bytes), or None if the file's
+            language is unsupported or it cannot be read
+        """
         # Determine language from extension
         ext = file_path.suffix.lstrip(".")
-        language = None
-
-        if ext == "go":
-            language = "go"
-        elif ext == "py":
-            language = "python"
-        elif ext in ("js", "jsx"):
-            language = "javascript"
-        elif ext == "ts":
-            language = "typescript"
-        elif ext == "tsx":
-            language = "tsx"
-        elif ext == "rs":
-            language = "rust"
-
+        language = _EXTENSION_LANGUAGES.get(ext)
         if not language or language not in self.parsers:
-            return
+            return None
 
         # Read file content
         try:
             with open(file_path, "rb") as f:
                 source_bytes = f.read()
         except Exception:
-            return
+            return None
 
-        # Parse with TreeSitter
-        parser = self.parsers[language]
-        tree = parser.parse(source_bytes)
-
-        # Extract symbols based on language
         relative_path = str(file_path.relative_to(project_path)).replace("\\", "/")
+        return language, relative_path, source_bytes
+
+    def _extract_symbols(self, source_bytes: bytes, language: str, relative_path: str) -> tuple[Symbol, ...]:
+        """Parse source with TreeSitter and extract its symbols (without indexing them)."""
+        tree = self.parsers[language].parse(source_bytes)
 
-        if language == "go":
-            self._extract_go_symbols(tree.root_node, source_bytes, relative_path)
-        elif language == "python":
-            self._extract_python_symbols(tree.root_node, source_bytes, relative_path)
-        elif language in ("javascript", "typescript", "tsx"):
-            self._extract_js_symbols(tree.root_node, source_bytes, relative_path)
-        elif language == "rust":
-            self._extract_rust_symbols(tree.root_node, source_bytes, relative_path)
+        # Extract symbols based on language; _add_symbol buffers them meanwhile
+        self._file_symbols = []
+        try:
+            self._extractors[language](tree.root_node, source_bytes, relative_path)
+            return tuple(self._file_symbols)
+        finally:
+            self._file_symbols = None
 
     def _extract_go_symbols(self, node: Any, source: bytes, file_path: str):
         """Extract symbols from Go AST."""
+        # Struct tags only need scanning if the file has any yaml/json tags
+        tag_hint = _GO_CONFIG_TAG_RE.search(source) is not None
+
         # Function declarations
         for func_node in self._find_nodes(node, "function_declaration"):
             name_node = self._find_child(func_node, "identifier")
@@ -354,7 +504,9 @@ class SymbolIndexer:
 
                         # T009: Extract config fields for Go structs
                         if symbol_type == SymbolType.STRUCT and struct_type_node:
-                            if self._is_go_config_struct(struct_type_node, source, name):
+                            if self._is_go_config_struct(
+                                struct_type_node, source, name, check_tags=tag_hint
+                            ):
                                 symbol.config_fields = self._extract_go_config_fields(
                                     struct_type_node, name, source, file_path
                                 )
@@ -370,80 +522,73 @@ class SymbolIndexer:
         # Track processed function nodes to prevent duplicates (Bug #1 fix)
         processed_func_nodes: set[int] = set()
 
+        # Skip config detection for files with no config markers at all
+        config_hint = _PY_CONFIG_HINT_RE.search(source) is not None
+
         # FIRST: Process classes and their methods
-        # Build a map of class node to (name, start_line, end_line) for parent attribution
-        class_info: dict[int, tuple[str, int, int]] = {}
+        # Walk the tree once and record (node, name, start_line, end_line) for
+        # parent attribution and processing
+        classes: list[tuple[Any, str, int, int]] = []
         for class_node in self._find_nodes(node, "class_definition"):
             name_node = self._find_child(class_node, "identifier")
             if name_node:
-                name = self._get_node_text(name_node, source)
-                start_line = class_node.start_point[0]
-                end_line = class_node.end_point[0]
-                class_info[id(class_node)] = (name, start_line, end_line)
+                classes.append((
+                    class_node,
+                    self._get_node_text(name_node, source),
+                    class_node.start_point[0],
+                    class_node.end_point[0],
+                ))
 
-        # Process each class
-        for class_node in self._find_nodes(node, "class_definition"):
-            name_node = self._find_child(class_node, "identifier")
-            if name_node:
-                name = self._get_node_text(name_node, source)
-                current_start = class_node.start_point[0]
-                current_end = class_node.end_point[0]
-
-                # Find parent class by checking if this class is within another class's range
-                parent_class_name = None
-                smallest_parent_range = float('inf')
-
-                for other_id, (other_name, other_start, other_end) in class_info.items():
-                    # Skip self
-                    if other_id == id(class_node):
-                        continue
-
-                    # Check if current class is within other class's range
-                    if other_start < current_start and current_end <= other_end:
-                        # This is a potential parent - choose the closest (smallest range)
-                        parent_range = other_end - other_start
-                        if parent_range < smallest_parent_range:
-                            smallest_parent_range = parent_range
-                            parent_class_name = other_name
+        # Process each class. Classes arrive in source (pre-)order, so the
+        # enclosing classes form a stack: pop scopes the current class is not
+        # within, and the innermost remaining scope is its parent.
+        scope_stack: list[tuple[str, int, int]] = []
+        for class_node, name, current_start, current_end in classes:
+            while scope_stack and not (
+                scope_stack[-1][1] < current_start and current_end <= scope_stack[-1][2]
+            ):
+                scope_stack.pop()
+            parent_class_name = scope_stack[-1][0] if scope_stack else None
+            scope_stack.append((name, current_start, current_end))
+
+            symbol = Symbol(
+                name=name,
+                type=SymbolType.CLASS,
+                file=file_path,
+                line=class_node.start_point[0] + 1,
+                column=class_node.start_point[1],
+                parent=parent_class_name,
+            )
 
-                symbol = Symbol(
-                    name=name,
-                    type=SymbolType.CLASS,
-                    file=file_path,
-                    line=class_node.start_point[0] + 1,
-                    column=class_node.start_point[1],
-                    parent=parent_class_name,
+            # T009: Extract config fields for Python config classes
+            config_type = self._is_python_config_class(class_node, source) if config_hint else None
+            if config_type:
+                symbol.config_fields = self._extract_python_config_fields(
+                    class_node, name, source, file_path, config_type
                 )
 
-                # T009: Extract config fields for Python config classes
-                config_type = self._is_python_config_class(class_node, source)
-                if config_type:
-                    symbol.config_fields = self._extract_python_config_fields(
-                        class_node, name, source, file_path, config_type
-                    )
-
-                self._add_symbol(symbol)
+            self._add_symbol(symbol)
 
-                # Extract methods within class (only direct methods, not from nested classes)
-                for method_node in self._find_direct_methods(class_node):
-                    # Mark this node as processed to prevent duplicate counting
-                    processed_func_nodes.add(id(method_node))
+            # Extract methods within class (only direct methods, not from nested classes)
+            for method_node in self._find_direct_methods(class_node):
+                # Mark this node as processed to prevent duplicate counting
+                processed_func_nodes.add(id(method_node))
 
-                    method_name_node = self._find_child(method_node, "identifier")
-                    if method_name_node:
-                        method_name = self._get_node_text(method_name_node, source)
-                        signature = self._get_node_text(method_node, source).split(":")[0].strip()
+                method_name_node = self._find_child(method_node, "identifier")
+                if method_name_node:
+                    method_name = self._get_node_text(method_name_node, source)
+                    signature = self._get_node_text(method_node, source).split(":")[0].strip()
 
-                        method_symbol = Symbol(
-                            name=method_name,
-                            type=SymbolType.METHOD,
-                            file=file_path,
-                            line=method_node.start_point[0] + 1,
-                            column=method_node.start_point[1],
-                            signature=signature,
-                            parent=name,
-                        )
-                        self._add_symbol(method_symbol)
+                    method_symbol = Symbol(
+                        name=method_name,
+                        type=SymbolType.METHOD,
+                        file=file_path,
+                        line=method_node.start_point[0] + 1,
+                        column=method_node.start_point[1],
+                        signature=signature,
+                        parent=name,
+                    )
+                    self._add_symbol(method_symbol)
 
         # SECOND: Process module-level functions (skip already-processed methods)
         for func_node in self._find_nodes(node, "function_definition"):
@@ -545,6 +690,9 @@ class SymbolIndexer:
 
     def _extract_rust_symbols(self, node: Any, source: bytes, file_path: str):
         """Extract symbols from Rust AST: fn, struct, impl, trait."""
+        # Skip serde detection for files that never mention serde
+        config_hint = _RUST_CONFIG_HINT_RE.search(source) is not None
+
         # Function declarations
         for func_node in self._find_nodes(node, "function_item"):
             name_node = self._find_child(func_node, "identifier")
@@ -578,7 +726,7 @@ class SymbolIndexer:
                 )
 
                 # T009: Extract config fields for Rust serde structs
-                if self._is_rust_config_struct(struct_node, source):
+                if config_hint and self._is_rust_config_struct(struct_node, source):
                     symbol.config_fields = self._extract_rust_config_fields(
                         struct_node, name, source, file_path
                     )
@@ -634,19 +782,19 @@ class SymbolIndexer:
         for node in nodes_to_check:
             for child in node.children:
                 if child.type == "decorator":
-                    decorator_text = self._get_node_text(child, source)
-                    if "@dataclass" in decorator_text:
+                    decorator_text = self._get_node_bytes(child, source)
+                    if b"@dataclass" in decorator_text:
                         return "dataclass"
-                    if "@attr.s" in decorator_text or "@attrs" in decorator_text or "@define" in decorator_text:
+                    if _PY_ATTRS_DECORATOR_RE.search(decorator_text):
                         return "attrs"
 
         # Check base classes for BaseModel, BaseSettings, TypedDict
         for child in class_node.children:
             if child.type == "argument_list":
-                bases_text = self._get_node_text(child, source)
-                if "BaseModel" in bases_text or "BaseSettings" in bases_text:
+                bases_text = self._get_node_bytes(child, source)
+                if _PY_PYDANTIC_BASE_RE.search(bases_text):
                     return "pydantic"
-                if "TypedDict" in bases_text:
+                if b"TypedDict" in bases_text:
                     return "typeddict"
 
         return None
@@ -660,8 +808,6 @@ class SymbolIndexer:
         config_type: str,
     ) -> list[ConfigField]:
         """Extract config fields from a Python config class."""
-        import re
-
         fields: list[ConfigField] = []
 
         # Find the class body (block node)
@@ -701,9 +847,11 @@ class SymbolIndexer:
                         default_value = self._get_node_text(subchild, source)
                         # Extract description from Field(description=...)
                         if "Field(" in default_value and "description=" in default_value:
-                            match = re.search(r'description\s*=\s*["\']([^"\']+)["\']', default_value)
-                            if match:
-                                doc = match.group(1)
+                            doc = self._get_python_field_description(subchild, source)
+                            if doc is None:
+                                match = _PY_FIELD_DESCRIPTION_RE.search(default_value)
+                                if match:
+                                    doc = match.group(1)
                         break
 
                 fields.append(ConfigField(
@@ -747,20 +895,70 @@ class SymbolIndexer:
 
         return fields
 
-    def _is_go_config_struct(self, struct_node: Any, source: bytes, struct_name: str) -> bool:
-        """Detect if struct has yaml/json field tags or config naming pattern."""
+    def _get_python_field_description(self, value_node: Any, source: bytes) -> str | None:
+        """Get the description= keyword from a Field(...) call node.
+
+        Reads the string_content nodes TreeSitter already split out, so quotes
+        inside the description (e.g. "It's") and triple-quoted or implicitly
+        concatenated strings are handled without re-scanning the text.
+        """
+        if value_node.type != "call":
+            return None
+        args = self._find_child(value_node, "argument_list")
+        if not args:
+            return None
+
+        for arg in args.children:
+            if arg.type != "keyword_argument":
+                continue
+            name_node = arg.child_by_field_name("name")
+            if not name_node or self._get_node_text(name_node, source) != "description":
+                continue
+            value = arg.child_by_field_name("value")
+            if value is None:
+                return None
+
+            if value.type == "string":
+                strings = [value]
+            elif value.type == "concatenated_string":
+                strings = [c for c in value.children if c.type == "string"]
+            else:
+                return None
+            # f-strings have no static text to report (interpolations would be dropped)
+            for string in strings:
+                start = self._find_child(string, "string_start")
+                if start is not None and "f" in self._get_node_text(start, source).lower():
+                    return None
+            return "".join(
+                self._get_node_text(part, source)
+                for string in strings
+                for part in string.children
+                if part.type == "string_content"
+            )
+        return None
+
+    def _is_go_config_struct(
+        self, struct_node: Any, source: bytes, struct_name: str, check_tags: bool = True
+    ) -> bool:
+        """Detect if struct has yaml/json field tags or config naming pattern.
+
+        check_tags=False skips the per-field tag scan (caller knows the file has
+        no yaml/json tags).
+        """
         # Check naming pattern
-        if any(struct_name.endswith(suffix) for suffix in ("Config", "Settings", "Options")):
+        if struct_name.endswith(_GO_CONFIG_SUFFIXES):
             return True
 
+        if not check_tags:
+            return False
+
         # Check if any field has yaml/json tags
         field_list = self._find_child(struct_node, "field_declaration_list")
         if field_list:
             for field in self._find_nodes(field_list, "field_declaration"):
                 tag_node = self._find_child(field, "raw_string_literal")
                 if tag_node:
-                    tag_text = self._get_node_text(tag_node, source)
-                    if "yaml:" in tag_text or "json:" in tag_text:
+                    if _GO_CONFIG_TAG_RE.search(self._get_node_bytes(tag_node, source)):
                         return True
 
         return False
@@ -800,8 +998,7 @@ class SymbolIndexer:
             if tag_node:
                 tag_text = self._get_node_text(tag_node, source).strip("`")
                 # Parse yaml:"name,omitempty" json:"name"
-                import re
-                for match in re.finditer(r'(\w+):"([^"]*)"', tag_text):
+                for match in _GO_STRUCT_TAG_RE.finditer(tag_text):
                     tags[match.group(1)] = match.group(2)
 
             is_optional = False
@@ -824,8 +1021,7 @@ class SymbolIndexer:
 
     def _is_ts_config_interface(self, interface_node: Any, source: bytes, interface_name: str) -> bool:
         """Detect if interface is config-like by name pattern."""
-        config_suffixes = ("Config", "Options", "Settings", "Props")
-        return any(interface_name.endswith(suffix) for suffix in config_suffixes)
+        return interface_name.endswith(_TS_CONFIG_SUFFIXES)
 
     def _extract_ts_config_fields(
         self,
@@ -879,33 +1075,18 @@ class SymbolIndexer:
     def _is_rust_config_struct(self, struct_node: Any, source: bytes) -> bool:
         """Detect if struct has serde derives or serde attributes."""
         # Look for attributes before the struct
-        # TreeSitter puts attributes as siblings before the struct_item
-        parent = struct_node.parent
-        if not parent:
-            return False
-
-        # Find attribute nodes that precede this struct
-        struct_index = -1
-        for i, child in enumerate(parent.children):
-            if child == struct_node:
-                struct_index = i
-                break
-
-        # Check preceding attribute items
-        for i in range(struct_index - 1, -1, -1):
-            child = parent.children[i]
-            if child.type != "attribute_item":
-                break
-            attr_text = self._get_node_text(child, source)
+        # TreeSitter puts attributes as siblings before the struct_item;
+        # walk them backwards instead of scanning the parent's children
+        child = struct_node.prev_sibling
+        while child is not None and child.type == "attribute_item":
+            attr_text = self._get_node_bytes(child, source)
             # Check for serde derives
-            if "#[derive(" in attr_text:
-                if "Serialize" in attr_text or "Deserialize" in attr_text:
-                    return True
-                if "serde::" in attr_text:
-                    return True
+            if b"#[derive(" in attr_text and _RUST_SERDE_DERIVE_RE.search(attr_text):
+                return True
             # Check for #[serde(...)]
-            if "#[serde(" in attr_text:
+            if b"#[serde(" in attr_text:
                 return True
+            child = child.prev_sibling
 
         return False
 
@@ -949,33 +1130,24 @@ class SymbolIndexer:
             # Parse serde attributes on the field
             tags: dict[str, str] = {}
             # Look for attribute items before this field
-            parent = field_node.parent
-            if parent:
-                field_index = -1
-                for i, child in enumerate(parent.children):
-                    if child == field_node:
-                        field_index = i
-                        break
-
-                for i in range(field_index - 1, -1, -1):
-                    child = parent.children[i]
-                    if child.type != "attribute_item":
-                        break
-                    attr_text = self._get_node_text(child, source)
-                    if "#[serde(" in attr_text:
-                        # Parse serde attributes
-                        import re
-                        # Handle rename = "name"
-                        match = re.search(r'rename\s*=\s*"([^"]+)"', attr_text)
-                        if match:
-                            tags["serde_rename"] = match.group(1)
-                        # Handle default
-                        if "default" in attr_text:
-                            tags["serde_default"] = "true"
-                        # Handle skip_serializing_if
-                        match = re.search(r'skip_serializing_if\s*=\s*"([^"]+)"', attr_text)
-                        if match:
-                            tags["serde_skip_if"] = match.group(1)
+            child = field_node.prev_sibling
+            while child is not None and child.type == "attribute_item":
+                attr_bytes = self._get_node_bytes(child, source)
+                if b"#[serde(" in attr_bytes:
+                    attr_text = attr_bytes.decode("utf8")
+                    # Parse serde attributes
+                    # Handle rename = "name"
+                    match = _RUST_SERDE_RENAME_RE.search(attr_text)
+                    if match:
+                        tags["serde_rename"] = match.group(1)
+                    # Handle default
+                    if "default" in attr_text:
+                        tags["serde_default"] = "true"
+                    # Handle skip_serializing_if
+                    match = _RUST_SERDE_SKIP_IF_RE.search(attr_text)
+                    if match:
+                        tags["serde_skip_if"] = match.group(1)
+                child = child.prev_sibling
 
             fields.append(ConfigField(
                 name=field_name,
@@ -992,16 +1164,19 @@ class SymbolIndexer:
         return fields
 
     def _find_nodes(self, node: Any, node_type: str) -> list[Any]:
-        """Recursively find all nodes of a specific type."""
-        nodes = []
+        """Find all nodes of a specific type (pre-order, including node itself).
 
-        def traverse(n):
+        Uses an explicit stack rather than Python recursion, which avoids a
+        frame per AST node and cannot hit the recursion limit on deep trees.
+        """
+        nodes = []
+        stack = [node]
+        while stack:
+            n = stack.pop()
             if n.type == node_type:
                 nodes.append(n)
-            for child in n.children:
-                traverse(child)
-
-        traverse(node)
+            # Push children reversed so they are visited in source order
+            stack.extend(reversed(n.children))
         return nodes
 
     def _find_direct_methods(self, class_node: Any, func_type: str = "function_definition") -> list[Any]:
@@ -1019,22 +1194,18 @@ class SymbolIndexer:
             List of function nodes that are direct methods of this class
         """
         methods = []
-
-        def traverse(n, inside_nested_class=False):
-            # If we encounter a nested class definition, mark that we're inside it
+        stack = [class_node]
+        while stack:
+            n = stack.pop()
+            # Stop at nested class boundaries; their methods belong to the nested class
             if n != class_node and n.type == "class_definition":
-                inside_nested_class = True
+                continue
 
-            # Only collect functions that are NOT inside nested classes
-            if n.type == func_type and not inside_nested_class:
+            if n.type == func_type:
                 methods.append(n)
 
-            # Continue traversal, passing the nested class flag
-            for child in n.children:
-                traverse(child, inside_nested_class)
+            stack.extend(reversed(n.children))
 
-        # Start traversal from class body
-        traverse(class_node)
         return methods
 
     def _find_child(self, node: Any, child_type: str) -> Any | None:
@@ -1060,8 +1231,19 @@ class SymbolIndexer:
         """
         return source[node.start_byte : node.end_byte].decode("utf8")
 
+    def _get_node_bytes(self, node: Any, source: bytes) -> bytes:
+        """Get the raw source bytes for a node.
+
+        Used for marker checks (decorators, tags, attributes) that don't
+        need the decoded text.
+        """
+        return source[node.start_byte : node.end_byte]
+
     def _add_symbol(self, symbol: Symbol):
-        """Add a symbol to the index."""
+        """Add a symbol to the index (or to the per-file buffer during extraction)."""
+        if self._file_symbols is not None:
+            self._file_symbols.append(symbol)
+            return
         if symbol.name not in self.index:
             self.index[symbol.name] = []
         self.index[symbol.name].append(symbol)
@@ -1138,13 +1320,8 @@ class SymbolIndexer:
         return code_blocks
 
     def _find_all_nodes(self, node: Any, node_type: str) -> list[Any]:
-        """Recursively find all nodes of a given type."""
-        results = []
-        if node.type == node_type:
-            results.append(node)
-        for child in node.children:
-            results.extend(self._find_all_nodes(child, node_type))
-        return results
+        """Find all nodes of a given type."""
+        return self._find_nodes(node, node_type)
 
     def _find_child_by_type(self, node: Any, child_type: str) -> Any | None:
         """Find first child node with given type."""
@@ -1152,3 +1329,106 @@ class SymbolIndexer:
             if child.type == child_type:
                 return child
         return None
+
+
+def _recursive_suffixes(file_patterns: list[str]) -> list[str] | None:
+    """Return the suffixes when every pattern is "**/*.ext", else None."""
+    suffixes = []
+    for pattern in file_patterns:
+        match = _RECURSIVE_SUFFIX_RE.fullmatch(pattern)
+        if match is None:
+            return None
+        suffixes.append(match.group(1))
+    return suffixes
+
+
+def _walk_by_suffix(project_path: Path, suffixes: list[str], exclude_patterns: list[str]) -> list[Path]:
+    """Find files ending in any suffix with one os.walk, in pattern order.
+
+    Matches what one ``project_path.glob("**/*" + suffix)`` per suffix would
+    return (symlinked directories are not followed). Directories are pruned only
+    when an exclude pattern covers everything beneath them: ``dir/**`` at the
+    project root, or ``**/name/**`` anywhere. Every other exclude is still
+    checked per file by the caller.
+    """
+    root_dirs: set[str] = set()
+    dir_names: set[str] = set()
+    for pattern in exclude_patterns:
+        normalized = pattern.replace('\\', '/')
+        if not normalized.endswith('/**') or any(c in normalized[:-3] for c in '*?['):
+            continue
+        if normalized.startswith('**/'):
+            if normalized[3:-3] and '/' not in normalized[3:-3]:
+                dir_names.add(normalized[3:-3])
+        elif normalized[:-3]:
+            root_dirs.add(normalized[:-3])
+
+    fold = str.lower if os.name == 'nt' else str
+    folded_suffixes = tuple({fold(suffix) for suffix in suffixes})
+    by_suffix: dict[str, list[Path]] = {fold(suffix): [] for suffix in suffixes}
+    root = str(project_path)
+    for dirpath, dirnames, filenames in os.walk(root):
+        relative_dir = dirpath[len(root):].lstrip(os.sep).replace(os.sep, '/')
+        prefix = f"{relative_dir}/" if relative_dir else ""
+        dirnames[:] = [
+            d for d in dirnames if d not in dir_names and f"{prefix}{d}" not in root_dirs
+        ]
+        for name in filenames:
+            folded_name = fold(name)
+            if not folded_name.endswith(folded_suffixes):
+                continue
+            file_path = Path(dirpath, name)
+            for suffix in folded_suffixes:
+                if folded_name.endswith(suffix):
+                    by_suffix[suffix].append(file_path)
+
+    return [file_path for suffix in suffixes for file_path in by_suffix[fold(suffix)]]
+
+
+def _symbol_cache_key(relative_path: str, source_bytes: bytes) -> tuple[str, bytes]:
+    """Build the _FILE_SYMBOL_CACHE key for a file."""
+    return relative_path, hashlib.blake2b(source_bytes, digest_size=16).digest()
+
+
+def _get_cached_file_symbols(cache_key: tuple[str, bytes]) -> tuple[Symbol, ...] | None:
+    """Return previously extracted symbols for a file, or None."""
+    with _FILE_SYMBOL_CACHE_LOCK:
+        return _FILE_SYMBOL_CACHE.get(cache_key)
+
+
+def _cache_file_symbols(cache_key: tuple[str, bytes], symbols: tuple[Symbol, ...]):
+    """Store extracted symbols, evicting the oldest entry when full."""
+    with _FILE_SYMBOL_CACHE_LOCK:
+        if len(_FILE_SYMBOL_CACHE) >= _FILE_SYMBOL_CACHE_MAX:
+            # Evict the oldest entry (dicts preserve insertion order)
+            _FILE_SYMBOL_CACHE.pop(next(iter(_FILE_SYMBOL_CACHE)), None)
+        _FILE_SYMBOL_CACHE[cache_key] = symbols
+
+
+# Indexer reused by a worker process across all files it is sent
+_worker_indexer: SymbolIndexer | None = None
+
+
+def _extract_symbols_worker(
+    task: tuple[bytes, str, str],
+    indexer: SymbolIndexer | None = None,
+) -> tuple[tuple[Symbol, ...] | None, str | None]:
+    """Extract symbols for one file in a pool worker.
+
+    Args:
+        task: (source_bytes, language, relative_path)
+        indexer: Indexer to use; defaults to a per-process instance
+
+    Returns:
+        (symbols, None) on success, (None, error message) on failure
+    """
+    global _worker_indexer
+    source_bytes, language, relative_path = task
+    try:
+        if indexer is None:
+            if _worker_indexer is None:
+                _worker_indexer = SymbolIndexer()
+            indexer = _worker_indexer
+        return indexer._extract_symbols(source_bytes, language, relative_path), None
+    except Exception as e:
+        return None, str(e)
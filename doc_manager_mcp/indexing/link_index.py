@@ -6,6 +6,7 @@ iterating through all markdown files or doing repeated file system operations.
 Performance improvement: O(M*L*M) -> O(M*L) where M=files, L=links per file.
 """
 
+import os
 from pathlib import Path
 
 
@@ -96,13 +97,11 @@ class LinkIndex:
         # These should be resolved relative to source_context
         if not url_without_anchor.startswith(('/', './', '../')) and docs_root:
             try:
-                import os
-                # Resolve relative to source context
-                full_path = source_context / url_without_anchor
-                normalized_path = os.path.normpath(str(full_path))
+                # Resolve relative to source context (string ops, no Path objects)
+                normalized_path = os.path.normpath(os.path.join(source_context, url_without_anchor))
 
                 # Get relative path from docs_root
-                normalized_docs = os.path.normpath(str(docs_root))
+                normalized_docs = os.path.normpath(docs_root)
 
                 if normalized_path.startswith(normalized_docs):
                     # Remove docs_root prefix and normalize separators
@@ -134,13 +133,11 @@ class LinkIndex:
             # Normalize relative path to docs_root
             try:
                 # Compute path and normalize using os.path (no file system I/O)
-                import os
-                full_path = source_context / url_without_anchor
-                normalized_path = os.path.normpath(str(full_path))
+                normalized_path = os.path.normpath(os.path.join(source_context, url_without_anchor))
 
                 # Get relative path from docs_root (string operation, no I/O)
                 try:
-                    normalized_docs = os.path.normpath(str(docs_root))
+                    normalized_docs = os.path.normpath(docs_root)
 
                     # Check if normalized_path starts with docs_root
                     if normalized_path.startswith(normalized_docs):
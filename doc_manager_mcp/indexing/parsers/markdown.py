@@ -30,11 +30,26 @@ class MarkdownParser:
         """Initialize the markdown parser."""
         self.md_parser = markdown_it.MarkdownIt()
 
-    def extract_headers(self, content: str) -> list[dict[str, Any]]:
+    def parse(self, content: str) -> list[Any]:
+        """Tokenize markdown content once for reuse across extract_* calls.
+
+        Args:
+            content: Markdown content as string
+
+        Returns:
+            markdown-it token stream; pass as ``tokens=`` to the extract methods
+            to avoid re-parsing the same content
+        """
+        return self.md_parser.parse(content)
+
+    def extract_headers(
+        self, content: str, tokens: list[Any] | None = None
+    ) -> list[dict[str, Any]]:
         """Extract markdown headers with level, text, and line number.
 
         Args:
             content: Markdown content as string
+            tokens: Pre-parsed tokens from parse() (parsed from content if None)
 
         Returns:
             List of dicts with keys: level, text, line
@@ -46,7 +61,8 @@ class MarkdownParser:
             [{'level': 1, 'text': 'Title', 'line': 1},
              {'level': 2, 'text': 'Subtitle', 'line': 2}]
         """
-        tokens = self.md_parser.parse(content)
+        if tokens is None:
+            tokens = self.md_parser.parse(content)
         headers = []
 
         for i, token in enumerate(tokens):
@@ -72,7 +88,9 @@ class MarkdownParser:
 
         return headers
 
-    def extract_links(self, content: str) -> list[dict[str, Any]]:
+    def extract_links(
+        self, content: str, tokens: list[Any] | None = None
+    ) -> list[dict[str, Any]]:
         """Extract all markdown links with text, URL, and line number.
 
         Extracts:
@@ -82,6 +100,7 @@ class MarkdownParser:
 
         Args:
             content: Markdown content as string
+            tokens: Pre-parsed tokens from parse() (parsed from content if None)
 
         Returns:
             List of dicts with keys: type, text, url, line
@@ -92,7 +111,8 @@ class MarkdownParser:
             >>> links
             [{'type': 'inline', 'text': 'Example', 'url': 'http://example.com', 'line': 1}]
         """
-        tokens = self.md_parser.parse(content)
+        if tokens is None:
+            tokens = self.md_parser.parse(content)
         links = []
 
         # Links are children of inline tokens, not top-level
@@ -131,11 +151,14 @@ class MarkdownParser:
 
         return links
 
-    def extract_code_blocks(self, content: str) -> list[dict[str, Any]]:
+    def extract_code_blocks(
+        self, content: str, tokens: list[Any] | None = None
+    ) -> list[dict[str, Any]]:
         """Extract fenced code blocks with language, content, and line number.
 
         Args:
             content: Markdown content as string
+            tokens: Pre-parsed tokens from parse() (parsed from content if None)
 
         Returns:
             List of dicts with keys: language, code, line
@@ -146,7 +169,8 @@ class MarkdownParser:
             >>> blocks
             [{'language': 'python', 'code': "print('hello')\\n", 'line': 1}]
         """
-        tokens = self.md_parser.parse(content)
+        if tokens is None:
+            tokens = self.md_parser.parse(content)
         code_blocks = []
 
         for token in tokens:
@@ -163,11 +187,14 @@ class MarkdownParser:
 
         return code_blocks
 
-    def extract_images(self, content: str) -> list[dict[str, Any]]:
+    def extract_images(
+        self, content: str, tokens: list[Any] | None = None
+    ) -> list[dict[str, Any]]:
         """Extract markdown images with alt text, src, and line number.
 
         Args:
             content: Markdown content as string
+            tokens: Pre-parsed tokens from parse() (parsed from content if None)
 
         Returns:
             List of dicts with keys: alt, src, line
@@ -178,7 +205,8 @@ class MarkdownParser:
             >>> images
             [{'alt': 'Alt text', 'src': 'image.png', 'line': 1}]
         """
-        tokens = self.md_parser.parse(content)
+        if tokens is None:
+            tokens = self.md_parser.parse(content)
         images = []
 
         # Images are children of inline tokens, like links
@@ -207,11 +235,14 @@ class MarkdownParser:
 
         return images
 
-    def extract_inline_code(self, content: str) -> list[dict[str, Any]]:
+    def extract_inline_code(
+        self, content: str, tokens: list[Any] | None = None
+    ) -> list[dict[str, Any]]:
         """Extract inline code spans with content and line number.
 
         Args:
             content: Markdown content as string
+            tokens: Pre-parsed tokens from parse() (parsed from content if None)
 
         Returns:
             List of dicts with keys: text, line
@@ -222,31 +253,28 @@ class MarkdownParser:
             >>> code
             [{'text': 'functionName()', 'line': 1}]
         """
-        tokens = self.md_parser.parse(content)
+        if tokens is None:
+            tokens = self.md_parser.parse(content)
         inline_codes = []
 
         # Need to traverse inline tokens within other tokens
-        def _extract_from_inline(token: Any, base_line: int | None) -> None:
-            """Recursively extract inline code from token children."""
-            if token.type == 'code_inline':
-                inline_codes.append({
-                    "text": token.content,
-                    "line": base_line
-                })
-
-            # Check children if present
-            if hasattr(token, 'children') and token.children:
-                for child in token.children:
-                    _extract_from_inline(child, base_line)
+        def _extract_from_children(children: list[Any], base_line: int | None) -> None:
+            """Recursively extract inline code from token children (e.g. image alt text)."""
+            for child in children:
+                if child.type == 'code_inline':
+                    inline_codes.append({
+                        "text": child.content,
+                        "line": base_line
+                    })
+                elif child.children:
+                    _extract_from_children(child.children, base_line)
 
         # Process all tokens
         for token in tokens:
-            line = token.map[0] + 1 if token.map else None
-
-            if token.type == 'inline':
-                # Inline tokens contain children that might be code_inline
-                if hasattr(token, 'children') and token.children:
-                    for child in token.children:
-                        _extract_from_inline(child, line)
+            # Inline tokens contain children that might be code_inline; a code span
+            # needs a backtick in the inline source, so most prose tokens are skipped
+            if token.type == 'inline' and token.children and '`' in token.content:
+                line = token.map[0] + 1 if token.map else None
+                _extract_from_children(token.children, line)
 
         return inline_codes
@@ -10,8 +10,6 @@ from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
 
-import frontmatter
-
 from ..parsers.markdown import MarkdownParser
 
 
@@ -48,6 +46,9 @@ def extract_frontmatter(content: str) -> tuple[dict[str, Any] | None, str]:
     if not content or not isinstance(content, str):
         return None, content or ""
 
+    # Deferred: python-frontmatter pulls in PyYAML and toml
+    import frontmatter
+
     try:
         post = frontmatter.loads(content)
 
@@ -99,6 +100,8 @@ def preserve_frontmatter(
     if format not in valid_formats:
         format = "yaml"
 
+    import frontmatter
+
     # Create a frontmatter Post object
     post = frontmatter.Post(content, **frontmatter_dict)
 
@@ -150,12 +153,17 @@ def slugify(text: str) -> str:
     return slug
 
 
-def generate_toc(content: str, max_depth: int = 3) -> str:
+def generate_toc(
+    content: str,
+    max_depth: int = 3,
+    headers: list[dict[str, Any]] | None = None
+) -> str:
     """Generate table of contents from markdown headers.
 
     Args:
         content: Markdown content
         max_depth: Maximum heading level to include (1-6)
+        headers: Headers already extracted from content (parsed if None)
 
     Returns:
         Markdown TOC as unordered list with anchor links
@@ -168,8 +176,8 @@ def generate_toc(content: str, max_depth: int = 3) -> str:
           - [Section 1](#section-1)
           - [Section 2](#section-2)
     """
-    parser = MarkdownParser()
-    headers = parser.extract_headers(content)
+    if headers is None:
+        headers = MarkdownParser().extract_headers(content)
 
     # Filter by max_depth
     headers = [h for h in headers if h['level'] <= max_depth]
@@ -260,7 +268,8 @@ def compute_link_mappings(
     file_path: Path,
     old_root: Path,
     new_root: Path,
-    project_path: Path
+    project_path: Path,
+    links: list[dict[str, Any]] | None = None
 ) -> dict[str, str]:
     """Compute link URL transformations when file moves from old_root to new_root.
 
@@ -273,6 +282,7 @@ def compute_link_mappings(
         old_root: Original documentation root
         new_root: New documentation root
         project_path: Project root (for resolving absolute paths)
+        links: Links already extracted from content (parsed if None)
 
     Returns:
         Dict mapping old URLs to new URLs
@@ -292,8 +302,8 @@ def compute_link_mappings(
     mappings = {}
 
     # Extract all links from content
-    parser = MarkdownParser()
-    links = parser.extract_links(content)
+    if links is None:
+        links = MarkdownParser().extract_links(content)
 
     # Calculate file's position in old vs new structure
     try:
@@ -355,7 +365,11 @@ def compute_link_mappings(
     return mappings
 
 
-def rewrite_links_in_content(content: str, mappings: dict[str, str]) -> str:
+def rewrite_links_in_content(
+    content: str,
+    mappings: dict[str, str],
+    code_blocks: list[dict[str, Any]] | None = None
+) -> str:
     """Apply link mappings to markdown content.
 
     Handles:
@@ -369,6 +383,7 @@ def rewrite_links_in_content(content: str, mappings: dict[str, str]) -> str:
     Args:
         content: Markdown content
         mappings: URL transformations (old -> new)
+        code_blocks: Code blocks already extracted from content (parsed if None)
 
     Returns:
         Content with rewritten links
@@ -383,8 +398,8 @@ def rewrite_links_in_content(content: str, mappings: dict[str, str]) -> str:
         return content
 
     # Extract code blocks to preserve them
-    parser = MarkdownParser()
-    code_blocks = parser.extract_code_blocks(content)
+    if code_blocks is None:
+        code_blocks = MarkdownParser().extract_code_blocks(content)
 
     # Create placeholder map for code blocks
     code_placeholders = {}
@@ -1,6 +1,8 @@
 """Pydantic models for doc-manager MCP server tool inputs."""
 
 import re
+import stat
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Literal
 
@@ -9,6 +11,9 @@ from pydantic import BaseModel, ConfigDict, Field, field_validator, model_valida
 from .constants import ChangeDetectionMode, DocumentationPlatform, QualityCriterion
 from .indexing.analysis.semantic_diff import SemanticChange
 
+SyncMode = Literal["check", "resync"]
+InitMode = Literal["existing", "bootstrap"]
+
 
 def _validate_project_path(v: str) -> str:
     """Shared validator for project_path fields (FR-001, FR-006).
@@ -43,15 +48,28 @@ def _validate_project_path(v: str) -> str:
             f"Got relative path: '{v}'"
         )
 
-    # Verify path exists
-    if not path.exists():
-        raise ValueError(f"Project path does not exist: {v}")
+    # Verify path exists (one stat answers this, the directory check and the cache key)
+    try:
+        st = path.stat()
+    except (OSError, ValueError):
+        raise ValueError(f"Project path does not exist: {v}") from None
 
     # Verify it's a directory
-    if not path.is_dir():
+    if not stat.S_ISDIR(st.st_mode):
         raise ValueError(f"Project path is not a directory: {v}")
 
-    return str(path.resolve())
+    return _resolve_directory(v, st.st_dev, st.st_ino, st.st_mtime_ns)
+
+
+@lru_cache(maxsize=256)
+def _resolve_directory(v: str, st_dev: int, st_ino: int, st_mtime_ns: int) -> str:
+    """Resolve a validated directory path, memoized on the directory's identity.
+
+    Every tool call validates the same project path; resolving walks each path
+    component. Keying on the directory's device, inode and mtime (not just the
+    string) means a path that now points at a different directory resolves again.
+    """
+    return str(Path(v).resolve())
 
 
 def _validate_relative_path(v: str | None, field_name: str = "path") -> str | None:
@@ -89,6 +107,10 @@ def _validate_relative_path(v: str | None, field_name: str = "path") -> str | No
     return str(path)
 
 
+# A group containing a quantifier (+, * or {) that is itself quantified
+_NESTED_QUANTIFIER_RE = re.compile(r'\([^)]*[+*{][^)]*\)[+*{]')
+
+
 def _validate_glob_pattern(pattern: str, field_name: str = "pattern") -> None:
     """Validate glob pattern to prevent ReDoS and enforce length limits (FR-007, FR-008).
 
@@ -107,21 +129,14 @@ def _validate_glob_pattern(pattern: str, field_name: str = "pattern") -> None:
             f"Maximum allowed: {max_pattern_length} characters"
         )
 
-    # Check for ReDoS-vulnerable patterns (FR-008)
-    # Detect nested quantifiers like (a+)+ or (a*)*
-    redos_patterns = [
-        r'\([^)]*[+*][^)]*\)[+*{]',  # Nested quantifiers: (a+)+ or (a*)*
-        r'\([^)]*[+*{][^)]*\)[+*{]',  # Nested quantifiers with braces
-        r'(\*\*){2,}',  # Multiple consecutive ** (globstar abuse)
-    ]
-
-    for redos_pattern in redos_patterns:
-        if re.search(redos_pattern, pattern):
-            raise ValueError(
-                f"Invalid {field_name}: pattern contains potentially dangerous nested quantifiers. "
-                f"This could cause Regular Expression Denial of Service (ReDoS). "
-                f"Pattern: '{pattern}'"
-            )
+    # Check for ReDoS-vulnerable patterns (FR-008): nested quantifiers like
+    # (a+)+, (a*)* or (a{2})+, and multiple consecutive ** (globstar abuse)
+    if '****' in pattern or _NESTED_QUANTIFIER_RE.search(pattern):
+        raise ValueError(
+            f"Invalid {field_name}: pattern contains potentially dangerous nested quantifiers. "
+            f"This could cause Regular Expression Denial of Service (ReDoS). "
+            f"Pattern: '{pattern}'"
+        )
 
 
 def _validate_pattern_list(
@@ -165,14 +180,24 @@ def _validate_pattern_list(
     return patterns
 
 
-class InitializeConfigInput(BaseModel):
-    """Input for initializing .doc-manager.yml configuration."""
+# Characters allowed in a git commit hash
+_HEX_DIGITS = frozenset('0123456789abcdefABCDEF')
+
+
+class _StrictModel(BaseModel):
+    """Shared config for tool input and convention models.
+
+    Strips whitespace from strings and rejects unknown fields.
+    """
     model_config = ConfigDict(
         str_strip_whitespace=True,
-        validate_assignment=True,
         extra='forbid'
     )
 
+
+class InitializeConfigInput(_StrictModel):
+    """Input for initializing .doc-manager.yml configuration."""
+
     project_path: str = Field(
         ...,
         description="Absolute path to project root directory (e.g., '/home/user/my-project', 'C:\\Users\\user\\project')",
@@ -234,13 +259,8 @@ class InitializeConfigInput(BaseModel):
         """Validate source patterns (FR-006, FR-007, FR-008) (T037)."""
         return _validate_pattern_list(v, field_name="sources", max_items=50)
 
-class InitializeMemoryInput(BaseModel):
+class InitializeMemoryInput(_StrictModel):
     """Input for initializing memory system."""
-    model_config = ConfigDict(
-        str_strip_whitespace=True,
-        validate_assignment=True,
-        extra='forbid'
-    )
 
     project_path: str = Field(
         ...,
@@ -254,13 +274,8 @@ class InitializeMemoryInput(BaseModel):
         """Validate project path using shared validator (FR-001, FR-006)."""
         return _validate_project_path(v)
 
-class DetectPlatformInput(BaseModel):
+class DetectPlatformInput(_StrictModel):
     """Input for platform detection."""
-    model_config = ConfigDict(
-        str_strip_whitespace=True,
-        validate_assignment=True,
-        extra='forbid'
-    )
 
     project_path: str = Field(
         ...,
@@ -268,13 +283,8 @@ class DetectPlatformInput(BaseModel):
         min_length=1
     )
 
-class AssessQualityInput(BaseModel):
+class AssessQualityInput(_StrictModel):
     """Input for quality assessment."""
-    model_config = ConfigDict(
-        str_strip_whitespace=True,
-        validate_assignment=True,
-        extra='forbid'
-    )
 
     project_path: str = Field(
         ...,
@@ -294,13 +304,8 @@ class AssessQualityInput(BaseModel):
         description="Include root README.md in quality assessment (Bug #4 fix: sync discrepancy)"
     )
 
-class ValidateDocsInput(BaseModel):
+class ValidateDocsInput(_StrictModel):
     """Input for documentation validation."""
-    model_config = ConfigDict(
-        str_strip_whitespace=True,
-        validate_assignment=True,
-        extra='forbid'
-    )
 
     project_path: str = Field(
         ...,
@@ -348,13 +353,8 @@ class ValidateDocsInput(BaseModel):
         description="Check external asset URLs for reachability (expensive, makes HTTP requests). Task 2.3"
     )
 
-class MapChangesInput(BaseModel):
+class MapChangesInput(_StrictModel):
     """Input for mapping code changes to documentation."""
-    model_config = ConfigDict(
-        str_strip_whitespace=True,
-        validate_assignment=True,
-        extra='forbid'
-    )
 
     project_path: str = Field(
         ...,
@@ -442,7 +442,7 @@ class MapChangesInput(BaseModel):
             return v
 
         # Validate format: 7-40 hexadecimal characters (short or full SHA)
-        if not re.match(r'^[0-9a-fA-F]{7,40}$', v):
+        if not (7 <= len(v) <= 40 and _HEX_DIGITS.issuperset(v)):
             raise ValueError(
                 f"Invalid git commit hash format: '{v}'. "
                 f"Expected 7-40 hexadecimal characters (e.g., 'abc1234' or full SHA). "
@@ -467,18 +467,13 @@ class MapChangesInput(BaseModel):
 
         return self
 
-class MapChangesOutput(BaseModel):
+class MapChangesOutput(_StrictModel):
     """Output model for map_changes tool JSON responses.
 
     This model represents the structured response when map_changes returns
     a dictionary (JSON format). It includes both file-level changes and
     optional semantic changes when include_semantic=True.
     """
-    model_config = ConfigDict(
-        str_strip_whitespace=True,
-        validate_assignment=True,
-        extra='forbid'
-    )
 
     analyzed_at: str = Field(
         ...,
@@ -513,13 +508,8 @@ class MapChangesOutput(BaseModel):
         description="Code-level semantic changes detected (function signatures, classes, methods). Only populated when include_semantic=True in the request"
     )
 
-class TrackDependenciesInput(BaseModel):
+class TrackDependenciesInput(_StrictModel):
     """Input for tracking code-to-docs dependencies."""
-    model_config = ConfigDict(
-        str_strip_whitespace=True,
-        validate_assignment=True,
-        extra='forbid'
-    )
 
     project_path: str = Field(
         ...,
@@ -532,13 +522,8 @@ class TrackDependenciesInput(BaseModel):
         min_length=1
     )
 
-class BootstrapInput(BaseModel):
+class BootstrapInput(_StrictModel):
     """Input for bootstrapping fresh documentation."""
-    model_config = ConfigDict(
-        str_strip_whitespace=True,
-        validate_assignment=True,
-        extra='forbid'
-    )
 
     project_path: str = Field(
         ...,
@@ -555,13 +540,13 @@ class BootstrapInput(BaseModel):
         min_length=1
     )
 
-class MigrateInput(BaseModel):
+    @field_validator('docs_path')
+    @classmethod
+    def validate_docs_path(cls, v: str | None) -> str | None:
+        return _validate_relative_path(v, field_name="docs_path")
+
+class MigrateInput(_StrictModel):
     """Input for migrating existing documentation."""
-    model_config = ConfigDict(
-        str_strip_whitespace=True,
-        validate_assignment=True,
-        extra='forbid'
-    )
 
     project_path: str = Field(
         ...,
@@ -599,23 +584,27 @@ class MigrateInput(BaseModel):
         description="Preview migration changes without modifying files. Shows what would be changed."
     )
 
-class SyncInput(BaseModel):
+    @field_validator('source_path')
+    @classmethod
+    def validate_source_path(cls, v: str | None) -> str | None:
+        return _validate_relative_path(v, field_name="source_path")
+
+    @field_validator('target_path')
+    @classmethod
+    def validate_target_path(cls, v: str | None) -> str | None:
+        return _validate_relative_path(v, field_name="target_path")
+
+class SyncInput(_StrictModel):
     """Input for synchronizing documentation."""
-    model_config = ConfigDict(
-        str_strip_whitespace=True,
-        validate_assignment=True,
-        extra='forbid'
-    )
 
     project_path: str = Field(
         ...,
         description="Absolute path to project root directory",
         min_length=1
     )
-    mode: str = Field(
+    mode: SyncMode = Field(
         default="check",
-        description="Sync mode: 'check' (read-only analysis) or 'resync' (update baselines + analysis)",
-        pattern="^(check|resync)$"
+        description="Sync mode: 'check' (read-only analysis) or 'resync' (update baselines + analysis)"
     )
     docs_path: str | None = Field(
         default=None,
@@ -623,12 +612,17 @@ class SyncInput(BaseModel):
         min_length=1
     )
 
+    @field_validator('docs_path')
+    @classmethod
+    def validate_docs_path(cls, v: str | None) -> str | None:
+        return _validate_relative_path(v, field_name="docs_path")
+
 
 # ============================================================================
 # New Input Models for Refactored Tools (002-tool-architecture-refactor)
 # ============================================================================
 
-class DocmgrInitInput(BaseModel):
+class DocmgrInitInput(_StrictModel):
     """Input for unified initialization tool (docmgr_init).
 
     Replaces: initialize_config, initialize_memory, bootstrap
@@ -637,21 +631,15 @@ class DocmgrInitInput(BaseModel):
     - mode="existing": Initialize config + baselines + dependencies for existing project
     - mode="bootstrap": Same as existing + create doc templates
     """
-    model_config = ConfigDict(
-        str_strip_whitespace=True,
-        validate_assignment=True,
-        extra='forbid'
-    )
 
     project_path: str = Field(
         ...,
         description="Absolute path to project root directory",
         min_length=1
     )
-    mode: str = Field(
+    mode: InitMode = Field(
         default="existing",
-        description="Init mode: 'existing' (config+baselines+deps) or 'bootstrap' (+ doc templates)",
-        pattern="^(existing|bootstrap)$"
+        description="Init mode: 'existing' (config+baselines+deps) or 'bootstrap' (+ doc templates)"
     )
     platform: DocumentationPlatform | None = Field(
         default=None,
@@ -702,18 +690,13 @@ class DocmgrInitInput(BaseModel):
         return _validate_pattern_list(v, field_name="sources")
 
 
-class DocmgrDetectChangesInput(BaseModel):
+class DocmgrDetectChangesInput(_StrictModel):
     """Input for pure read-only change detection (docmgr_detect_changes).
 
     Replaces: map_changes (in read-only mode)
 
     Key difference: NEVER writes to symbol-baseline.json
     """
-    model_config = ConfigDict(
-        str_strip_whitespace=True,
-        validate_assignment=True,
-        extra='forbid'
-    )
 
     project_path: str = Field(
         ...,
@@ -739,7 +722,7 @@ class DocmgrDetectChangesInput(BaseModel):
         return _validate_project_path(v)
 
 
-class DocmgrUpdateBaselineInput(BaseModel):
+class DocmgrUpdateBaselineInput(_StrictModel):
     """Input for updating all baseline files atomically (docmgr_update_baseline).
 
     Updates:
@@ -747,11 +730,6 @@ class DocmgrUpdateBaselineInput(BaseModel):
     - symbol-baseline.json (TreeSitter code symbols)
     - dependencies.json (code-to-doc mappings)
     """
-    model_config = ConfigDict(
-        str_strip_whitespace=True,
-        validate_assignment=True,
-        extra='forbid'
-    )
 
     project_path: str = Field(
         ...,
@@ -779,13 +757,8 @@ class DocmgrUpdateBaselineInput(BaseModel):
 # Documentation Conventions Models (chore/integrating-doc-conventions)
 # ============================================================================
 
-class TerminologyRule(BaseModel):
+class TerminologyRule(_StrictModel):
     """Single terminology rule with optional exceptions and context."""
-    model_config = ConfigDict(
-        str_strip_whitespace=True,
-        validate_assignment=True,
-        extra='forbid'
-    )
 
     word: str = Field(
         ...,
@@ -802,13 +775,8 @@ class TerminologyRule(BaseModel):
     )
 
 
-class PreferredTerminology(BaseModel):
+class PreferredTerminology(_StrictModel):
     """Preferred terminology definition for consistency checking."""
-    model_config = ConfigDict(
-        str_strip_whitespace=True,
-        validate_assignment=True,
-        extra='forbid'
-    )
 
     full_form: str = Field(
         ...,
@@ -825,13 +793,8 @@ class PreferredTerminology(BaseModel):
     )
 
 
-class StyleConventions(BaseModel):
+class StyleConventions(_StrictModel):
     """Style-related documentation conventions."""
-    model_config = ConfigDict(
-        str_strip_whitespace=True,
-        validate_assignment=True,
-        extra='forbid'
-    )
 
     class HeadingConfig(BaseModel):
         """Heading style configuration."""
@@ -886,13 +849,8 @@ class StyleConventions(BaseModel):
     )
 
 
-class StructureConventions(BaseModel):
+class StructureConventions(_StrictModel):
     """Structure-related documentation conventions."""
-    model_config = ConfigDict(
-        str_strip_whitespace=True,
-        validate_assignment=True,
-        extra='forbid'
-    )
 
     class TocConfig(BaseModel):
         """Table of contents configuration."""
@@ -928,13 +886,8 @@ class StructureConventions(BaseModel):
     )
 
 
-class QualityConventions(BaseModel):
+class QualityConventions(_StrictModel):
     """Quality-related documentation conventions."""
-    model_config = ConfigDict(
-        str_strip_whitespace=True,
-        validate_assignment=True,
-        extra='forbid'
-    )
 
     class SentenceConfig(BaseModel):
         """Sentence length configuration."""
@@ -1010,13 +963,8 @@ class QualityConventions(BaseModel):
     )
 
 
-class TerminologyConventions(BaseModel):
+class TerminologyConventions(_StrictModel):
     """Terminology-related documentation conventions."""
-    model_config = ConfigDict(
-        str_strip_whitespace=True,
-        validate_assignment=True,
-        extra='forbid'
-    )
 
     preferred: dict[str, PreferredTerminology] = Field(
         default_factory=dict,
@@ -1028,16 +976,11 @@ class TerminologyConventions(BaseModel):
     )
 
 
-class DocumentationConventions(BaseModel):
+class DocumentationConventions(_StrictModel):
     """Complete documentation conventions configuration.
 
     This model represents the schema for doc-conventions.yml files.
     """
-    model_config = ConfigDict(
-        str_strip_whitespace=True,
-        validate_assignment=True,
-        extra='forbid'
-    )
 
     style: StyleConventions = Field(
         default_factory=StyleConventions,
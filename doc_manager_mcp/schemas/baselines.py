@@ -81,6 +81,14 @@ class RepoBaseline(BaseModel):
     files: dict[str, str] = Field(
         description="Map of relative file paths to SHA-256 checksums"
     )
+    file_stats: dict[str, list[int]] | None = Field(
+        default=None,
+        description="Map of relative file paths to [size, mtime_ns, ctime_ns, inode] fingerprints"
+    )
+    file_stats_time_ns: int | None = Field(
+        default=None,
+        description="When file_stats were taken (ns since epoch); newer files are rehashed"
+    )
 
     # Optional fields
     description: str | None = Field(
@@ -109,6 +109,13 @@ class DocManagerConfig(BaseModel):
         description="Project name for CLI filtering (falls back to repo_name from baseline)"
     )
 
+    # Performance tuning
+    checksum_workers: int | None = Field(
+        default=None,
+        ge=1,
+        description="Threads used to hash files (default: CPU count + 4, max 32; use ~4 on HDDs)"
+    )
+
     # Project metadata
     metadata: ConfigMetadata | None = Field(
         default=None,
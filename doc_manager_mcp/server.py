@@ -36,8 +36,10 @@ from .models import (
     DocmgrDetectChangesInput,
     DocmgrInitInput,
     DocmgrUpdateBaselineInput,
+    InitMode,
     MigrateInput,
     SyncInput,
+    SyncMode,
     ValidateDocsInput,
 )
 
@@ -76,7 +78,7 @@ mcp = FastMCP("doc_manager_mcp")
 )
 async def tool_docmgr_init(
     project_path: str,
-    mode: str = "existing",
+    mode: InitMode = "existing",
     platform: str | None = None,
     exclude_patterns: list[str] | None = None,
     docs_path: str | None = None,
@@ -362,7 +364,7 @@ async def docmgr_migrate(
 )
 async def docmgr_sync(
     project_path: str,
-    mode: str = "check",
+    mode: SyncMode = "check",
     docs_path: str | None = None
 ) -> str | dict[str, Any]:
     """Orchestrate complete documentation sync: detect changes, validate, assess quality, optionally update baselines.
@@ -9,13 +9,40 @@ This module provides typed, validated access to baseline files:
 import json
 import sys
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal, overload
 
 from pydantic import ValidationError
 
 from doc_manager_mcp.schemas.baselines import RepoBaseline
 
 
+@overload
+def load_repo_baseline(
+    project_path: Path,
+    validate: Literal[True] = True,
+    check_version: bool = True,
+    required_version: str = "1.0.0",
+) -> RepoBaseline | None: ...
+
+
+@overload
+def load_repo_baseline(
+    project_path: Path,
+    validate: Literal[False],
+    check_version: bool = True,
+    required_version: str = "1.0.0",
+) -> dict[str, Any] | None: ...
+
+
+@overload
+def load_repo_baseline(
+    project_path: Path,
+    validate: bool = True,
+    check_version: bool = True,
+    required_version: str = "1.0.0",
+) -> RepoBaseline | dict[str, Any] | None: ...
+
+
 def load_repo_baseline(
     project_path: Path,
     validate: bool = True,
@@ -46,15 +73,13 @@ def load_repo_baseline(
     if not baseline_path.exists():
         return None
 
+    # When validating, pydantic-core parses the raw bytes itself; only the
+    # unvalidated path needs a json.loads() dict
+    raw = baseline_path.read_bytes()
     try:
-        with open(baseline_path, encoding="utf-8") as f:
-            data = json.load(f)
+        data = None if validate else json.loads(raw)
     except json.JSONDecodeError as e:
-        print(
-            f"Warning: repo-baseline.json contains invalid JSON: {e}. "
-            "Consider running docmgr_update_baseline to regenerate.",
-            file=sys.stderr
-        )
+        _warn_invalid_json(e)
         return None
 
     # Task 1.6: Check version compatibility if requested
@@ -69,8 +94,11 @@ def load_repo_baseline(
 
     if validate:
         try:
-            return RepoBaseline.model_validate(data)
+            return RepoBaseline.model_validate_json(raw)
         except ValidationError as e:
+            if any(error["type"] == "json_invalid" for error in e.errors()):
+                _warn_invalid_json(e)
+                return None
             print(
                 f"Warning: repo-baseline.json failed schema validation: {e}. "
                 "Consider running docmgr_update_baseline to regenerate.",
@@ -81,6 +109,15 @@ def load_repo_baseline(
     return data
 
 
+def _warn_invalid_json(error: Exception) -> None:
+    """Report a repo-baseline.json that is not valid JSON."""
+    print(
+        f"Warning: repo-baseline.json contains invalid JSON: {error}. "
+        "Consider running docmgr_update_baseline to regenerate.",
+        file=sys.stderr
+    )
+
+
 def get_baseline_version(project_path: Path) -> str | None:
     """Get the schema version from repo-baseline.json.
 
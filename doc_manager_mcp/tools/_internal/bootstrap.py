@@ -76,7 +76,7 @@ async def bootstrap(params: BootstrapInput) -> str | dict[str, Any]:
         lines.append("")
 
         from ...models import DetectPlatformInput
-        platform_result = await detect_platform(DetectPlatformInput(
+        platform_result = await detect_platform(DetectPlatformInput.model_construct(
             project_path=str(project_path)
         ))
 
@@ -93,7 +93,7 @@ async def bootstrap(params: BootstrapInput) -> str | dict[str, Any]:
         lines.append("")
 
         from ...models import InitializeConfigInput
-        config_result = await initialize_config(InitializeConfigInput(
+        config_result = await initialize_config(InitializeConfigInput.model_construct(
             project_path=str(project_path),
             platform=recommended_platform,
             exclude_patterns=None  # Let default_factory handle it, tools will merge with DEFAULT_EXCLUDE_PATTERNS
@@ -160,7 +160,7 @@ async def bootstrap(params: BootstrapInput) -> str | dict[str, Any]:
         lines.append("")
 
         from ...models import InitializeMemoryInput
-        memory_result = await initialize_memory(InitializeMemoryInput(
+        memory_result = await initialize_memory(InitializeMemoryInput.model_construct(
             project_path=str(project_path)
         ))
 
@@ -175,7 +175,7 @@ async def bootstrap(params: BootstrapInput) -> str | dict[str, Any]:
         lines.append("")
 
         from ...models import AssessQualityInput
-        quality_result = await assess_quality(AssessQualityInput(
+        quality_result = await assess_quality(AssessQualityInput.model_construct(
             project_path=str(project_path),
             docs_path=params.docs_path
         ))
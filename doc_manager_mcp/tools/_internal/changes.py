@@ -1,7 +1,6 @@
 """Change mapping tools for doc-manager."""
 
 import asyncio
-import json
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -17,11 +16,13 @@ from doc_manager_mcp.constants import (
     ChangeDetectionMode,
 )
 from doc_manager_mcp.core import (
-    calculate_checksum,
+    calculate_checksums_incremental,
+    compile_exclude_matcher,
     enforce_response_limit,
+    get_checksum_workers,
     handle_error,
     load_config,
-    matches_exclude_pattern,
+    read_json_file,
     run_git_command,
 )
 from doc_manager_mcp.core.patterns import categorize_file_change
@@ -55,8 +56,7 @@ def _load_baseline(project_path: Path) -> dict[str, Any] | None:
         return None
 
     try:
-        with open(baseline_path, encoding='utf-8') as f:
-            return json.load(f)
+        return read_json_file(baseline_path)
     except Exception as e:
         print(f"Warning: Failed to load baseline from {baseline_path}: {e}", file=sys.stderr)
         return None
@@ -74,10 +74,16 @@ def _get_changed_files_from_checksums(project_path: Path, baseline: dict[str, An
     exclude_patterns, gitignore_spec = build_exclude_patterns(project_path)
 
     # Check existing files for changes using shared scanner
-    for file_path in scan_project_files(project_path, max_files=MAX_FILES):
-        relative_path = str(file_path.relative_to(project_path)).replace('\\', '/')
-
-        current_checksum = calculate_checksum(file_path)
+    file_paths = list(scan_project_files(project_path, max_files=MAX_FILES))
+    relative_paths = [
+        str(file_path.relative_to(project_path)).replace('\\', '/') for file_path in file_paths
+    ]
+    # Files whose stat still matches the baseline's fingerprint are not rehashed
+    current_checksums, _, _ = calculate_checksums_incremental(
+        file_paths, relative_paths, baseline, get_checksum_workers(project_path)
+    )
+
+    for relative_path, current_checksum in zip(relative_paths, current_checksums, strict=True):
         baseline_checksum = baseline_checksums.get(relative_path)
 
         if baseline_checksum != current_checksum:
@@ -92,10 +98,16 @@ def _get_changed_files_from_checksums(project_path: Path, baseline: dict[str, An
                     "change_type": "added"
                 })
 
-    # Check for deleted files
+    # Check for deleted files. Anything the scan just yielded exists, so only
+    # baseline entries the scan didn't see need a stat.
+    scanned = set(relative_paths)
+    is_excluded = compile_exclude_matcher(exclude_patterns)
     for baseline_file in baseline_checksums.keys():
+        if baseline_file in scanned:
+            continue
+
         # Skip deleted files if they match exclude patterns (FR-027)
-        if matches_exclude_pattern(baseline_file, exclude_patterns):
+        if is_excluded(baseline_file):
             continue
 
         # Skip if matches gitignore patterns
@@ -142,6 +154,7 @@ async def _get_changed_files_from_git(project_path: Path, since_commit: str) ->
     if not output:
         return changed_files
 
+    is_excluded = compile_exclude_matcher(exclude_patterns)
     for line in output.split('\n'):
         if not line.strip():
             continue
@@ -154,7 +167,7 @@ async def _get_changed_files_from_git(project_path: Path, since_commit: str) ->
         file_path = parts[1]
 
         # Skip if matches exclude patterns (FR-027)
-        if matches_exclude_pattern(file_path, exclude_patterns):
+        if is_excluded(file_path):
             continue
 
         # Skip if matches gitignore patterns
@@ -376,7 +389,9 @@ async def _map_changes_impl(params: MapChangesInput) -> str | dict[str, Any]:
             if not baseline:
                 return enforce_response_limit(f"Error: No baseline found at {project_path}/.doc-manager/memory/repo-baseline.json. Run docmgr_initialize_memory first or use mode='git_diff' with since_commit parameter.")
 
-            changed_files = _get_changed_files_from_checksums(project_path, baseline)
+            changed_files = await asyncio.to_thread(
+                _get_changed_files_from_checksums, project_path, baseline
+            )
             baseline_info = baseline
 
         # Map changes to affected docs
@@ -5,11 +5,9 @@ from pathlib import Path
 from typing import Any
 
 from doc_manager_mcp.core import (
-    detect_platform_quick,
-    detect_project_language,
     enforce_response_limit,
-    find_docs_directory,
     handle_error,
+    probe_project,
     save_config,
 )
 from doc_manager_mcp.models import InitializeConfigInput
@@ -85,19 +83,22 @@ async def initialize_config(params: InitializeConfigInput) -> str | dict[str, An
         # Check if config already exists (allow overwrite)
         config_path = project_path / ".doc-manager.yml"
 
+        # One scan of the project root covers platform, language and docs detection
+        probe = probe_project(project_path)
+
         # Detect platform if not specified
         platform = params.platform
         if not platform:
-            platform = detect_platform_quick(project_path)
+            platform = probe.platform
 
         # Detect project language
-        language = detect_project_language(project_path)
+        language = probe.language
 
         # Find docs directory (use provided path or auto-detect)
         if params.docs_path:
             docs_path = params.docs_path
         else:
-            docs_dir = find_docs_directory(project_path)
+            docs_dir = probe.docs_dir
             docs_path = str(docs_dir.relative_to(project_path)) if docs_dir else "docs"
 
         # Use provided sources or empty list
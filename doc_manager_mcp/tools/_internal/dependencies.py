@@ -16,6 +16,7 @@ from doc_manager_mcp.core import (
     get_doc_relative_path,
     load_config,
     validate_path_boundary,
+    write_json_file,
 )
 from doc_manager_mcp.indexing import SymbolIndexer, SymbolType
 from doc_manager_mcp.indexing.parsers.markdown import MarkdownParser
@@ -37,6 +38,17 @@ HEADING_FUNCTION_PATTERN = re.compile(r'^#+\s+([a-z_][a-zA-Z0-9_]*)\s*\([^)]*\)'
 # NOTE: Inline code commands will be extracted via MarkdownParser, this pattern validates them
 COMMAND_PATTERN = re.compile(r'^([a-z][a-z0-9\-]+(?:\s+[a-z][a-z0-9\-]+)*(?:\s+--?[a-z][a-z0-9\-]*)*)$')
 
+# Classify inline code spans that aren't commands (run once per span)
+IDENTIFIER_PATTERN = re.compile(r'^[a-z_][a-zA-Z0-9_]+$')
+DOTTED_CONFIG_KEY_PATTERN = re.compile(r'^[a-z_][a-z0-9_]*(?:\.[a-z_][a-z0-9_]*)+$')
+COLON_CONFIG_KEY_PATTERN = re.compile(r'^([a-z_][a-z0-9_]{2,}):')
+SIMPLE_CONFIG_KEY_PATTERN = re.compile(r'^[a-z_][a-z0-9_]{2,}$')
+
+# Subcommand words and shell lines to skip when extracting commands from code blocks
+SUBCOMMAND_WORD_PATTERN = re.compile(r'^[a-z][a-z0-9\-]*$')
+ENV_ASSIGNMENT_PATTERN = re.compile(r'^[A-Z_]+=')
+SHELL_KEYWORD_PATTERN = re.compile(r'^\s*(if|then|else|elif|fi|for|while|do|done|case|esac)\b')
+
 # Extract commands from terminal prompts in raw content (still needed for non-inline-code cases)
 TERMINAL_COMMAND_PATTERN = re.compile(r'\$\s+([a-z][a-z0-9\-]+(?:\s+[a-z][a-z0-9\-]+)*(?:\s+--?[a-z][a-z0-9\-]*)*)')
 
@@ -78,17 +90,10 @@ def _detect_project_name(project_path: Path) -> str | None:
     Returns:
         Detected project name or None
     """
-    # Try .doc-manager.yml config
-    config_path = project_path / '.doc-manager.yml'
-    if config_path.exists():
-        try:
-            import yaml
-            with open(config_path, encoding='utf-8') as f:
-                config = yaml.safe_load(f)
-                if config and 'project_name' in config:
-                    return config['project_name']
-        except Exception:  # noqa: S110
-            pass  # Fail gracefully if yaml not available or file malformed
+    # Try .doc-manager.yml config (memoized; None if missing or malformed)
+    config = load_config(project_path)
+    if config and 'project_name' in config:
+        return config['project_name']
 
     # Try git repository name
     git_dir = project_path / '.git'
@@ -155,7 +160,7 @@ def _extract_subcommand(reference: str, project_name: str | None = None) -> str
             break
 
         # Check if word is a valid subcommand name (lowercase, alphanumeric, hyphens)
-        if re.match(r'^[a-z][a-z0-9\-]*$', word):
+        if SUBCOMMAND_WORD_PATTERN.match(word):
             subcommands.append(word)
         else:
             # Stop at first non-subcommand word (likely an argument)
@@ -199,8 +204,8 @@ def _extract_code_references(content: str, doc_file: str | Path, indexer: Symbol
             })
             continue
 
-        # Check if it's a function reference
-        if match := FUNCTION_PATTERN.match(code_text):
+        # Check if it's a function reference (only spans ending in "()" can match)
+        if code_text.endswith('()') and FUNCTION_PATTERN.match(code_text):
             references.append({
                 "type": "function",
                 "reference": code_text,
@@ -209,11 +214,11 @@ def _extract_code_references(content: str, doc_file: str | Path, indexer: Symbol
             })
             continue
 
-        # Check if it's a class reference
-        if match := CLASS_PATTERN.match(code_text):
+        # Check if it's a class reference (only spans starting uppercase can match)
+        if code_text[:1].isupper() and (match := CLASS_PATTERN.match(code_text)):
             class_name = match.group(1)
             # Exclude common words
-            if len(class_name) > 2 and class_name not in ['API', 'CLI', 'HTTP', 'HTTPS', 'URL', 'JSON', 'XML']:
+            if len(class_name) > 2 and class_name not in {'API', 'CLI', 'HTTP', 'HTTPS', 'URL', 'JSON', 'XML'}:
                 references.append({
                     "type": "class",
                     "reference": class_name,
@@ -227,7 +232,7 @@ def _extract_code_references(content: str, doc_file: str | Path, indexer: Symbol
             command = match.group(1)
             first_word = command.split()[0]
             # Filter out common prose words
-            if first_word not in ['the', 'and', 'for', 'with', 'from', 'this', 'that', 'your', 'you', 'a', 'an', 'in', 'on', 'at', 'to', 'of']:
+            if first_word not in {'the', 'and', 'for', 'with', 'from', 'this', 'that', 'your', 'you', 'a', 'an', 'in', 'on', 'at', 'to', 'of'}:
                 references.append({
                     "type": "command",
                     "reference": command,
@@ -239,7 +244,7 @@ def _extract_code_references(content: str, doc_file: str | Path, indexer: Symbol
         # Check if it's a function name (without parentheses) using symbol index
         # This catches references like `docmgr_init` that should be functions
         # Must happen BEFORE config_key check which would match the same pattern
-        if indexer and len(code_text) >= 3 and re.match(r'^[a-z_][a-zA-Z0-9_]+$', code_text):
+        if indexer and len(code_text) >= 3 and IDENTIFIER_PATTERN.match(code_text):
             # Look up in symbol index
             symbols = indexer.lookup(code_text)
             if symbols:
@@ -258,7 +263,7 @@ def _extract_code_references(content: str, doc_file: str | Path, indexer: Symbol
 
         # Check if it's a config key (dotted path, key:value, or simple key)
         # Dotted path: server.port
-        if '.' in code_text and re.match(r'^[a-z_][a-z0-9_]*(?:\.[a-z_][a-z0-9_]*)+$', code_text):
+        if '.' in code_text and DOTTED_CONFIG_KEY_PATTERN.match(code_text):
             references.append({
                 "type": "config_key",
                 "reference": code_text,
@@ -269,9 +274,9 @@ def _extract_code_references(content: str, doc_file: str | Path, indexer: Symbol
 
         # Config key with colon: platform: hugo
         if ':' in code_text:
-            if match := re.match(r'^([a-z_][a-z0-9_]{2,}):', code_text):
+            if match := COLON_CONFIG_KEY_PATTERN.match(code_text):
                 config_key = match.group(1)
-                if config_key not in ['the', 'and', 'for', 'with', 'from', 'this', 'that', 'your', 'you', 'file', 'path', 'name', 'type']:
+                if config_key not in {'the', 'and', 'for', 'with', 'from', 'this', 'that', 'your', 'you', 'file', 'path', 'name', 'type'}:
                     references.append({
                         "type": "config_key",
                         "reference": config_key,
@@ -281,8 +286,8 @@ def _extract_code_references(content: str, doc_file: str | Path, indexer: Symbol
             continue
 
         # Simple config key: platform, docs_path (at least 3 chars)
-        if len(code_text) >= 3 and re.match(r'^[a-z_][a-z0-9_]{2,}$', code_text):
-            if code_text not in ['the', 'and', 'for', 'with', 'from', 'this', 'that', 'your', 'you', 'file', 'path', 'name', 'type']:
+        if len(code_text) >= 3 and SIMPLE_CONFIG_KEY_PATTERN.match(code_text):
+            if code_text not in {'the', 'and', 'for', 'with', 'from', 'this', 'that', 'your', 'you', 'file', 'path', 'name', 'type'}:
                 references.append({
                     "type": "config_key",
                     "reference": code_text,
@@ -290,10 +295,15 @@ def _extract_code_references(content: str, doc_file: str | Path, indexer: Symbol
                     "line": line  # NEW
                 })
 
+    # Line numbers below advance a running newline count from the previous match
+    # (finditer yields matches in order) instead of recounting the whole prefix
+
     # Extract function signatures from markdown headings (doesn't use inline code)
+    line_num, scanned_to = 1, 0
     for match in HEADING_FUNCTION_PATTERN.finditer(content):
         func_name = match.group(1) + "()"
-        line_num = content[:match.start()].count('\n') + 1
+        line_num += content.count('\n', scanned_to, match.start())
+        scanned_to = match.start()
         references.append({
             "type": "function",
             "reference": func_name,
@@ -302,11 +312,13 @@ def _extract_code_references(content: str, doc_file: str | Path, indexer: Symbol
         })
 
     # Extract commands from terminal prompts in raw content (e.g., "$ command")
+    line_num, scanned_to = 1, 0
     for match in TERMINAL_COMMAND_PATTERN.finditer(content):
         command = match.group(1)
         first_word = command.split()[0]
-        if first_word not in ['the', 'and', 'for', 'with', 'from', 'this', 'that', 'your', 'you', 'a', 'an', 'in', 'on', 'at', 'to', 'of']:
-            line_num = content[:match.start()].count('\n') + 1
+        if first_word not in {'the', 'and', 'for', 'with', 'from', 'this', 'that', 'your', 'you', 'a', 'an', 'in', 'on', 'at', 'to', 'of'}:
+            line_num += content.count('\n', scanned_to, match.start())
+            scanned_to = match.start()
             references.append({
                 "type": "command",
                 "reference": command,
@@ -319,11 +331,13 @@ def _extract_code_references(content: str, doc_file: str | Path, indexer: Symbol
     seen_commands = set()
 
     for pattern in SEMANTIC_COMMAND_PATTERNS:
+        line_num, scanned_to = 1, 0
         for match in pattern.finditer(content):
             command_name = match.group(1).lower()
             if command_name not in command_stopwords and command_name not in seen_commands:
                 seen_commands.add(command_name)
-                line_num = content[:match.start()].count('\n') + 1
+                line_num += content.count('\n', scanned_to, match.start())
+                scanned_to = match.start()
                 references.append({
                     "type": "semantic_command",
                     "reference": command_name,
@@ -373,11 +387,11 @@ def _extract_commands_from_code_blocks(content: str, doc_file: str | Path, index
                     line = line[2:]
 
                 # Skip variable assignments (export FOO=bar, VAR=value)
-                if re.match(r'^[A-Z_]+=', line):
+                if ENV_ASSIGNMENT_PATTERN.match(line):
                     continue
 
                 # Skip control structures (if, for, while, etc.)
-                if re.match(r'^\s*(if|then|else|elif|fi|for|while|do|done|case|esac)\b', line):
+                if SHELL_KEYWORD_PATTERN.match(line):
                     continue
 
                 # Extract command (first word(s) before flags)
@@ -439,7 +453,7 @@ def _find_source_files(
         exclude_patterns: Exclude patterns (already merged: user > defaults)
         use_gitignore: Whether to respect .gitignore patterns
     """
-    from doc_manager_mcp.core import matches_exclude_pattern
+    from doc_manager_mcp.core import compile_exclude_matcher
 
     source_files = []
     file_count = 0
@@ -459,6 +473,7 @@ def _find_source_files(
     # Use provided exclude patterns or empty list
     if exclude_patterns is None:
         exclude_patterns = []
+    is_excluded = compile_exclude_matcher(exclude_patterns)
 
     # Parse .gitignore if enabled
     gitignore_spec = None
@@ -493,7 +508,7 @@ def _find_source_files(
                 continue
 
             # Check exclude patterns (user + defaults, correct priority)
-            if matches_exclude_pattern(relative_path_str, exclude_patterns):
+            if is_excluded(relative_path_str):
                 continue
 
             # Check gitignore patterns (if enabled)
@@ -635,17 +650,21 @@ def _search_file_for_pattern(
     source_file: Path,
     patterns: list[str],
     path_map: dict[Path, str],
-    file_cache: dict[Path, str | None]
+    file_cache: dict[Path, bytes | None],
+    required: bytes | None = None
 ) -> str | None:
     """Search a source file for pattern matches with caching.
 
-    Caches file contents to avoid redundant I/O when searching for multiple patterns.
+    Caches raw file contents to avoid redundant I/O when searching for multiple
+    patterns. Files are only decoded once they contain ``required``.
 
     Args:
         source_file: Path to source file
         patterns: List of regex patterns to search for
         path_map: Pre-computed mapping of Path → normalized relative path
-        file_cache: Cache dict mapping file paths to content (or None if unreadable)
+        file_cache: Cache dict mapping file paths to raw content (or None if unreadable)
+        required: UTF-8 literal every pattern contains; files without it are
+            skipped with a bytes substring check
 
     Returns:
         Relative file path if pattern matches, None otherwise
@@ -653,14 +672,25 @@ def _search_file_for_pattern(
     # Check cache first
     if source_file not in file_cache:
         try:
-            with open(source_file, encoding='utf-8') as f:
+            with open(source_file, 'rb') as f:
                 file_cache[source_file] = f.read()
         except Exception as e:
             print(f"Warning: Failed to read source file {source_file}: {e}", file=sys.stderr)
             file_cache[source_file] = None
 
-    content = file_cache[source_file]
-    if content is None:
+    raw = file_cache[source_file]
+    if raw is None:
+        return None
+
+    # Most files never mention the identifier: rule them out before decoding
+    if required is not None and required not in raw:
+        return None
+
+    try:
+        content = raw.decode('utf-8')
+    except UnicodeDecodeError as e:
+        print(f"Warning: Failed to read source file {source_file}: {e}", file=sys.stderr)
+        file_cache[source_file] = None
         return None
 
     # Search for any pattern match
@@ -736,7 +766,7 @@ def _match_references_to_sources(
         Dictionary mapping doc files to matched source files
     """
     dependencies = defaultdict(set)  # doc_file -> set[source_files]
-    file_cache = {}  # Cache for file contents during regex fallback searches
+    file_cache: dict[Path, bytes | None] = {}  # Raw file contents for regex fallback searches
 
     # Detect project name if not provided
     if project_name is None:
@@ -788,12 +818,15 @@ def _match_references_to_sources(
 
             # Fallback to regex-based text search if symbol index unavailable or no matches
             # Use language-specific patterns to avoid false positives
+            identifier_bytes = identifier.encode('utf-8')
             for source_file in source_files:
                 # Generate patterns based on file extension for more precise matching
                 file_extension = source_file.suffix
                 patterns = _get_language_specific_patterns(identifier, file_extension)
 
-                matched_path = _search_file_for_pattern(source_file, patterns, path_map, file_cache)
+                matched_path = _search_file_for_pattern(
+                    source_file, patterns, path_map, file_cache, identifier_bytes
+                )
                 if matched_path:
                     dependencies[doc_file].add(matched_path)
 
@@ -955,23 +988,18 @@ def load_dependencies(project_path: Path, validate: bool = True):
     if not dependency_file.exists():
         return None
 
-    try:
-        with open(dependency_file, encoding='utf-8') as f:
-            data = json.load(f)
-    except json.JSONDecodeError as e:
-        print(
-            f"Warning: dependencies.json contains invalid JSON: {e}. "
-            "Consider running docmgr_update_baseline to regenerate.",
-            file=sys.stderr
-        )
-        return None
+    raw = dependency_file.read_bytes()
 
     if validate:
         from pydantic import ValidationError
         from doc_manager_mcp.schemas.baselines import DependenciesBaseline
         try:
-            return DependenciesBaseline.model_validate(data)
+            # Parse and validate in a single pydantic-core pass
+            return DependenciesBaseline.model_validate_json(raw)
         except ValidationError as e:
+            if any(error["type"] == "json_invalid" for error in e.errors()):
+                _warn_invalid_dependencies_json(e)
+                return None
             print(
                 f"Warning: dependencies.json failed schema validation: {e}. "
                 "Consider running docmgr_update_baseline to regenerate.",
@@ -979,7 +1007,20 @@ def load_dependencies(project_path: Path, validate: bool = True):
             )
             return None
 
-    return data
+    try:
+        return json.loads(raw)
+    except json.JSONDecodeError as e:
+        _warn_invalid_dependencies_json(e)
+        return None
+
+
+def _warn_invalid_dependencies_json(error: Exception) -> None:
+    """Report a dependencies.json that is not valid JSON."""
+    print(
+        f"Warning: dependencies.json contains invalid JSON: {error}. "
+        "Consider running docmgr_update_baseline to regenerate.",
+        file=sys.stderr
+    )
 
 
 def get_reference_to_doc(all_references: dict[str, list[dict[str, Any]]]) -> dict[str, list[str]]:
@@ -1023,7 +1064,8 @@ def get_reference_to_doc(all_references: dict[str, list[dict[str, Any]]]) -> dic
 def _save_dependencies_to_memory(project_path: Path, dependencies: dict[str, list[str]],
                                  code_to_doc: dict[str, list[str]], unmatched_refs: dict[str, list[str]],
                                  all_references: list[dict[str, Any]] | None = None,
-                                 asset_to_docs: dict[str, list[str]] | None = None):
+                                 asset_to_docs: dict[str, list[str]] | None = None,
+                                 generated_at: str | None = None):
     """Save dependency graph to memory directory with separated file and reference mappings.
 
     Note: reference_index parameter removed in v1.2.0 - use get_reference_to_doc() helper instead.
@@ -1044,7 +1086,7 @@ def _save_dependencies_to_memory(project_path: Path, dependencies: dict[str, lis
 
     data = {
         "_meta": get_json_meta(),
-        "generated_at": datetime.now().isoformat(),
+        "generated_at": generated_at or datetime.now().isoformat(),
         "doc_to_code": dependencies,
         "code_to_doc": code_to_doc,  # ✓ ONLY real source files
         "unmatched_references": unmatched_refs  # ✓ SEPARATED
@@ -1073,8 +1115,7 @@ def _save_dependencies_to_memory(project_path: Path, dependencies: dict[str, lis
     try:
         # T066: Use file locking to prevent concurrent modification (FR-018)
         with file_lock(dependency_file):
-            with open(dependency_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+            write_json_file(dependency_file, data)
     except Exception as e:
         print(f"Warning: Failed to save dependencies to {dependency_file}: {e}", file=sys.stderr)
 
@@ -1082,10 +1123,11 @@ def _save_dependencies_to_memory(project_path: Path, dependencies: dict[str, lis
 def _format_dependency_report(dependencies: dict[str, list[str]], code_to_doc: dict[str, list[str]],
                               unmatched_refs: dict[str, list[str]], total_references: int,
                               all_references: list[dict[str, Any]],
-                              tree_sitter_stats: dict[str, Any] | None = None) -> dict[str, Any]:
+                              tree_sitter_stats: dict[str, Any] | None = None,
+                              generated_at: str | None = None) -> dict[str, Any]:
     """Format dependency tracking report with separated file and reference mappings."""
     report = {
-        "generated_at": datetime.now().isoformat(),
+        "generated_at": generated_at or datetime.now().isoformat(),
         "total_references": total_references,
         "total_doc_files": len(dependencies),
         "total_source_files": len(code_to_doc),  # ✓ ACCURATE: only real files
@@ -1246,10 +1288,15 @@ async def track_dependencies(params: TrackDependenciesInput) -> dict[str, Any]:
         # Build asset_to_docs mapping (asset path -> docs that reference it)
         asset_to_docs = _build_asset_to_docs_index(all_assets)
 
+        # One timestamp for both the saved graph and the report
+        generated_at = datetime.now().isoformat()
+
         # Save to memory
-        _save_dependencies_to_memory(project_path, dependencies, code_to_doc, unmatched_refs, all_references, asset_to_docs)
+        _save_dependencies_to_memory(project_path, dependencies, code_to_doc, unmatched_refs, all_references, asset_to_docs,
+                                     generated_at=generated_at)
 
-        return _format_dependency_report(dependencies, code_to_doc, unmatched_refs, len(all_references), all_references, tree_sitter_stats)
+        return _format_dependency_report(dependencies, code_to_doc, unmatched_refs, len(all_references), all_references, tree_sitter_stats,
+                                         generated_at=generated_at)
 
     except Exception as e:
         return {"error": str(e), "tool": "track_dependencies"}
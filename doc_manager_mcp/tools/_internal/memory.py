@@ -1,7 +1,6 @@
 """Memory system tools for doc-manager."""
 
 import asyncio
-import json
 import os
 from datetime import datetime
 from functools import wraps
@@ -13,17 +12,19 @@ if TYPE_CHECKING:
 
 from doc_manager_mcp.constants import MAX_FILES
 from doc_manager_mcp.core import (
-    calculate_checksum,
-    detect_project_language,
+    calculate_checksums_incremental,
+    compile_exclude_matcher,
     enforce_response_limit,
     file_lock,
-    find_docs_directory,
+    get_checksum_workers,
+    get_git_head_info,
     handle_error,
-    matches_exclude_pattern,
-    run_git_command,
+    probe_project,
     validate_path_boundary,
+    write_json_file,
 )
 from doc_manager_mcp.models import InitializeMemoryInput
+from doc_manager_mcp.tools._internal.baselines import load_repo_baseline
 
 
 async def scandir_async(path: Path):
@@ -95,16 +96,16 @@ async def initialize_memory(params: InitializeMemoryInput, ctx=None) -> str | di
             return enforce_response_limit(f"Error: Project path does not exist: {project_path}")
 
         memory_dir = project_path / ".doc-manager"
-        memory_dir.mkdir(parents=True, exist_ok=True)
-        (memory_dir / "memory").mkdir(exist_ok=True)
+        # parents=True creates .doc-manager/ along the way
+        (memory_dir / "memory").mkdir(parents=True, exist_ok=True)
 
         repo_name = project_path.name
-        language = detect_project_language(project_path)
-        docs_dir = find_docs_directory(project_path)
+        probe = probe_project(project_path)
+        language = probe.language
+        docs_dir = probe.docs_dir
         docs_exist = docs_dir is not None
 
-        git_commit_task = asyncio.create_task(run_git_command(project_path, "rev-parse", "HEAD"))
-        git_branch_task = asyncio.create_task(run_git_command(project_path, "rev-parse", "--abbrev-ref", "HEAD"))
+        git_info_task = asyncio.create_task(get_git_head_info(project_path))
 
         if ctx:
             await ctx.report_progress(progress=10, total=100)
@@ -118,8 +119,12 @@ async def initialize_memory(params: InitializeMemoryInput, ctx=None) -> str | di
             await ctx.report_progress(progress=20, total=100)
             await ctx.info("Scanning project files...")
 
-        checksums = {}
+        # Collect files during the walk, then hash them concurrently
+        files_to_hash: list[tuple[str, Path]] = []
         file_count = 0
+        is_excluded = compile_exclude_matcher(exclude_patterns)
+        # entry.path always starts with the root, so slice instead of relative_to()
+        root_prefix_len = len(os.path.join(os.fspath(project_path), ""))
 
         async def process_directory(current_path: Path):
             nonlocal file_count
@@ -127,23 +132,23 @@ async def initialize_memory(params: InitializeMemoryInput, ctx=None) -> str | di
                 if file_count >= MAX_FILES:
                     break
 
-                entry_path = Path(entry.path)
-                relative_path_str = str(entry_path.relative_to(project_path)).replace('\\', '/')
+                relative_path_str = entry.path[root_prefix_len:].replace('\\', '/')
 
                 # Check exclude patterns (user + defaults)
-                if matches_exclude_pattern(relative_path_str, exclude_patterns):
+                if is_excluded(relative_path_str):
                     continue
 
                 # Check gitignore patterns (if enabled)
                 if gitignore_spec and gitignore_spec.match_file(relative_path_str):
                     continue
 
+                entry_path = Path(entry.path)
                 if entry.is_dir():
                     await process_directory(entry_path)
                 elif entry.is_file():
                     try:
                         validate_path_boundary(entry_path, project_path)
-                        checksums[relative_path_str] = calculate_checksum(entry_path)
+                        files_to_hash.append((relative_path_str, entry_path))
                         file_count += 1
 
                         # Report progress every 10 files (20-80% range)
@@ -161,11 +166,25 @@ async def initialize_memory(params: InitializeMemoryInput, ctx=None) -> str | di
                 f"→ Consider processing a smaller directory or increasing the limit."
             )
 
+        # Reuse checksums from the previous baseline for files whose stat is unchanged
+        prior_baseline = load_repo_baseline(project_path, validate=False, check_version=False)
+        file_checksums, file_stats, file_stats_time_ns = await asyncio.to_thread(
+            calculate_checksums_incremental,
+            [path for _, path in files_to_hash],
+            [relative_path_str for relative_path_str, _ in files_to_hash],
+            prior_baseline,
+            get_checksum_workers(project_path),
+        )
+        checksums = {
+            relative_path_str: checksum
+            for (relative_path_str, _), checksum in zip(files_to_hash, file_checksums, strict=True)
+        }
+
         if ctx:
             await ctx.report_progress(progress=80, total=100)
             await ctx.info(f"Scanned {file_count} files, creating baseline...")
 
-        git_commit, git_branch = await asyncio.gather(git_commit_task, git_branch_task)
+        git_commit, git_branch = await git_info_task
 
         # Get auto-generated metadata
         from doc_manager_mcp.schemas.metadata import get_json_meta
@@ -184,13 +203,14 @@ async def initialize_memory(params: InitializeMemoryInput, ctx=None) -> str | di
             "timestamp": datetime.now().isoformat(),
             "version": "1.0.0",
             "file_count": file_count,
-            "files": checksums
+            "files": checksums,
+            "file_stats": file_stats,
+            "file_stats_time_ns": file_stats_time_ns
         }
 
         baseline_path = memory_dir / "memory" / "repo-baseline.json"
         with file_lock(baseline_path):
-            with open(baseline_path, 'w', encoding='utf-8') as f:
-                json.dump(baseline, f, indent=2)
+            write_json_file(baseline_path, baseline)
 
         # Generate documentation conventions YAML with opinionated defaults
         from doc_manager_mcp.schemas.metadata import get_yaml_header
@@ -305,9 +325,12 @@ terminology:
 """
 
         conventions_path = memory_dir / "memory" / "doc-conventions.yml"
-        if not conventions_path.exists():
-            with open(conventions_path, 'w', encoding='utf-8') as f:
+        # Exclusive create: writes only if missing, without a separate exists() check
+        try:
+            with open(conventions_path, 'x', encoding='utf-8') as f:
                 f.write(conventions_yaml)
+        except FileExistsError:
+            pass
 
         # NOTE: Asset-manifest.json has been deprecated.
         # Assets are now tracked in two places:
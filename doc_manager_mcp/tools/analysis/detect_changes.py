@@ -3,6 +3,7 @@
 Key difference from map_changes: NEVER writes to symbol-baseline.json
 """
 
+import asyncio
 from pathlib import Path
 from typing import Any
 
@@ -87,7 +88,9 @@ async def docmgr_detect_changes(params: DocmgrDetectChangesInput) -> dict[str, A
                     )
                 }
 
-            changed_files = _get_changed_files_from_checksums(project_path, baseline)
+            changed_files = await asyncio.to_thread(
+                _get_changed_files_from_checksums, project_path, baseline
+            )
 
             # Load typed baseline for additional metadata (with schema validation)
             repo_baseline_data = load_repo_baseline(project_path)
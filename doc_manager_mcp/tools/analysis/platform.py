@@ -1,6 +1,7 @@
 """Platform detection tools for doc-manager."""
 
 import json
+import os
 import sys
 from pathlib import Path
 from typing import Any
@@ -14,15 +15,57 @@ from doc_manager_mcp.constants import (
 from doc_manager_mcp.core import detect_project_language, enforce_response_limit, handle_error
 from doc_manager_mcp.models import DetectPlatformInput
 
-
-def _check_root_configs(project_path: Path) -> list[dict[str, Any]]:
+# Directory listings gathered during one detection run: normcased name -> is_dir
+_DirListings = dict[str, dict[str, bool]]
+
+
+def _list_directory(listings: _DirListings, directory: str) -> dict[str, bool]:
+    """List a directory once with os.scandir and cache the result."""
+    names = listings.get(directory)
+    if names is None:
+        names = {}
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        names[os.path.normcase(entry.name)] = entry.is_dir()
+                    except OSError:
+                        names[os.path.normcase(entry.name)] = False
+        except OSError:
+            pass
+        listings[directory] = names
+    return names
+
+
+def _path_exists(listings: _DirListings, base: str, relative: str, *, is_dir: bool = False) -> bool:
+    """Check whether base/relative exists using cached directory listings.
+
+    Each directory is scanned once, so probing many marker files costs one
+    scandir per directory instead of one stat per marker.
+    """
+    current = base
+    parts = relative.split("/")
+    for i, part in enumerate(parts):
+        names = _list_directory(listings, current)
+        entry_is_dir = names.get(os.path.normcase(part))
+        if entry_is_dir is None:
+            return False
+        if i < len(parts) - 1 or is_dir:
+            if not entry_is_dir:
+                return False
+        current = os.path.join(current, part)
+    return True
+
+
+def _check_root_configs(project_path: Path, listings: _DirListings) -> list[dict[str, Any]]:
     """Check root-level configuration files using configurable markers."""
     detected = []
+    root = os.fspath(project_path)
 
     for platform, markers in PLATFORM_MARKERS.items():
         root_configs = markers.get("root_configs", [])
         for config_file in root_configs:
-            if (project_path / config_file).exists():
+            if _path_exists(listings, root, config_file):
                 detected.append({
                     "platform": platform,
                     "confidence": "high",
@@ -33,20 +76,21 @@ def _check_root_configs(project_path: Path) -> list[dict[str, Any]]:
     return detected
 
 
-def _check_doc_directories(project_path: Path) -> list[dict[str, Any]]:
+def _check_doc_directories(project_path: Path, listings: _DirListings) -> list[dict[str, Any]]:
     """Check common documentation directories using configurable markers."""
     detected = []
+    root = os.fspath(project_path)
 
     for doc_dir in DOC_DIRECTORIES:
-        doc_path = project_path / doc_dir
-        if not doc_path.exists() or not doc_path.is_dir():
+        if not _path_exists(listings, root, doc_dir, is_dir=True):
             continue
+        doc_path = os.path.join(root, doc_dir)
 
         # Check each platform's subdirectory configs
         for platform, markers in PLATFORM_MARKERS.items():
             subdir_configs = markers.get("subdir_configs", [])
             for config_file in subdir_configs:
-                if (doc_path / config_file).exists():
+                if _path_exists(listings, doc_path, config_file):
                     detected.append({
                         "platform": platform,
                         "confidence": "high",
@@ -57,49 +101,65 @@ def _check_doc_directories(project_path: Path) -> list[dict[str, Any]]:
     return detected
 
 
-def _check_dependencies(project_path: Path) -> list[dict[str, Any]]:
+def _read_dependency_file(
+    contents: dict[str, Any], project_path: Path, dep_file: str
+) -> dict[str, Any] | str:
+    """Read a dependency file once per detection run.
+
+    Returns the merged dependency mapping for package.json, or the lowercased
+    text for other files. Several platforms share the same dependency files,
+    so the parsed result is cached in contents.
+    """
+    if dep_file not in contents:
+        with open(project_path / dep_file, encoding='utf-8') as f:
+            if dep_file == "package.json":
+                data = json.load(f)
+                contents[dep_file] = {**data.get("dependencies", {}), **data.get("devDependencies", {})}
+            else:
+                contents[dep_file] = f.read().lower()
+    return contents[dep_file]
+
+
+def _check_dependencies(project_path: Path, listings: _DirListings) -> list[dict[str, Any]]:
     """Parse dependency files to detect platforms using configurable markers."""
     detected = []
+    root = os.fspath(project_path)
+    # Parsed dependency files, shared across platforms
+    contents: dict[str, Any] = {}
 
     # Iterate through all platforms and check their dependency markers
     for platform, markers in PLATFORM_MARKERS.items():
         dependencies = markers.get("dependencies", {})
 
         for dep_file, dep_markers in dependencies.items():
-            dep_path = project_path / dep_file
-            if not dep_path.exists():
+            if not _path_exists(listings, root, dep_file):
                 continue
 
             try:
+                content = _read_dependency_file(contents, project_path, dep_file)
+
                 # Special handling for package.json (JSON parsing)
                 if dep_file == "package.json":
-                    with open(dep_path, encoding='utf-8') as f:
-                        data = json.load(f)
-                        deps = {**data.get("dependencies", {}), **data.get("devDependencies", {})}
-
-                        # Check if any of the markers are in dependencies
-                        if any(marker in deps for marker in dep_markers):
-                            detected.append({
-                                "platform": platform,
-                                "confidence": "medium",
-                                "evidence": [f"Found {platform} in package.json dependencies"]
-                            })
-                            break
+                    # Check if any of the markers are in dependencies
+                    if any(marker in content for marker in dep_markers):
+                        detected.append({
+                            "platform": platform,
+                            "confidence": "medium",
+                            "evidence": [f"Found {platform} in package.json dependencies"]
+                        })
+                        break
 
                 # Text-based dependency files (requirements.txt, go.mod, setup.py)
                 else:
-                    with open(dep_path, encoding='utf-8') as f:
-                        content = f.read().lower()
-
-                        # Check if any of the markers are in the file content
-                        if any(marker.lower() in content for marker in dep_markers):
-                            confidence = "low" if dep_file == "setup.py" else "medium"
-                            detected.append({
-                                "platform": platform,
-                                "confidence": confidence,
-                                "evidence": [f"Found {platform} in {dep_file}"]
-                            })
-                            break
+                    # Check if any of the markers are in the file content
+                    if any(marker.lower() in content for marker in dep_markers):
+                        confidence = "low" if dep_file == "setup.py" else "medium"
+                        detected.append({
+                            "platform": platform,
+                            "confidence": confidence,
+                            "evidence": [f"Found {platform} in {dep_file}"]
+                        })
+                        break
 
             except Exception as e:
                 print(f"Warning: Failed to parse {dep_file}: {e}", file=sys.stderr)
@@ -140,19 +200,21 @@ async def detect_platform(params: DetectPlatformInput) -> str | dict[str, Any]:
 
         # Multi-stage detection approach
         detected_platforms = []
+        # Shared across stages so each directory is scanned at most once
+        listings: _DirListings = {}
 
         # Stage 1: Check root-level configs (fast path)
-        root_detections = _check_root_configs(project_path)
+        root_detections = _check_root_configs(project_path, listings)
         detected_platforms.extend(root_detections)
 
         # Stage 2: Check common documentation directories (if nothing found)
         if not detected_platforms:
-            doc_dir_detections = _check_doc_directories(project_path)
+            doc_dir_detections = _check_doc_directories(project_path, listings)
             detected_platforms.extend(doc_dir_detections)
 
         # Stage 3: Parse dependency files (if still nothing found)
         if not detected_platforms:
-            dep_detections = _check_dependencies(project_path)
+            dep_detections = _check_dependencies(project_path, listings)
             detected_platforms.extend(dep_detections)
 
         # Determine recommendation using configurable mappings
@@ -5,16 +5,18 @@ from pathlib import Path
 from typing import Any
 
 from doc_manager_mcp.core.markdown_cache import MarkdownCache
+from doc_manager_mcp.indexing.analysis.tree_sitter import Symbol
 from doc_manager_mcp.indexing.parsers.markdown import MarkdownParser
 
-from .helpers import calculate_documentation_coverage
+from .helpers import _read_doc, calculate_documentation_coverage
 
 
 def assess_accuracy(
     project_path: Path,
     docs_path: Path,
     markdown_files: list[Path],
-    markdown_cache: MarkdownCache | None = None
+    markdown_cache: MarkdownCache | None = None,
+    public_symbols: list[Symbol] | None = None
 ) -> dict[str, Any]:
     """Assess if documentation reflects actual codebase and system behavior."""
     issues = []
@@ -27,11 +29,10 @@ def assess_accuracy(
 
     for md_file in markdown_files:
         try:
-            with open(md_file, encoding='utf-8') as f:
-                content = f.read()
+            content = _read_doc(md_file, markdown_cache)
 
             # Find code blocks using cache or parser
-            if markdown_cache:
+            if markdown_cache is not None:
                 parsed = markdown_cache.parse(md_file, content)
                 code_blocks = parsed.code_blocks
             else:
@@ -59,7 +60,7 @@ def assess_accuracy(
         })
 
     # Calculate documentation coverage
-    coverage_data = calculate_documentation_coverage(project_path, docs_path)
+    coverage_data = calculate_documentation_coverage(project_path, docs_path, markdown_cache, public_symbols)
     coverage_pct = coverage_data.get("coverage_percentage", 0.0)
 
     if coverage_pct > 0:
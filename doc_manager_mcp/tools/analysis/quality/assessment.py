@@ -27,6 +27,7 @@ from .helpers import (
     calculate_documentation_coverage,
     check_heading_case_consistency,
     check_list_formatting_consistency,
+    collect_public_symbols,
     detect_undocumented_apis,
 )
 from .purposefulness import assess_purposefulness
@@ -208,21 +209,35 @@ async def assess_quality(params: AssessQualityInput) -> str | dict[str, Any]:
         # Create markdown cache for performance (eliminates redundant parsing)
         markdown_cache = MarkdownCache()
 
+        # Read every file concurrently up front so analyzers share one read per file.
+        # Files that fail here are left out of the cache and reported by each analyzer.
+        await asyncio.gather(
+            *(asyncio.to_thread(markdown_cache.read, md_file) for md_file in markdown_files),
+            return_exceptions=True
+        )
+
+        # Index the project once; the accuracy analyzer and both coverage scans share
+        # its public symbols. If indexing fails, each of them retries and reports the error.
+        try:
+            public_symbols = await asyncio.to_thread(collect_public_symbols, project_path)
+        except Exception:
+            public_symbols = None
+
         # Run assessments in parallel (2-3x faster)
         analyzers = []
 
         for criterion in criteria_to_assess:
             if criterion == QualityCriterion.RELEVANCE:
                 analyzers.append(
-                    asyncio.to_thread(assess_relevance, project_path, docs_path, markdown_files)
+                    asyncio.to_thread(assess_relevance, project_path, docs_path, markdown_files, markdown_cache)
                 )
             elif criterion == QualityCriterion.ACCURACY:
                 analyzers.append(
-                    asyncio.to_thread(assess_accuracy, project_path, docs_path, markdown_files, markdown_cache)
+                    asyncio.to_thread(assess_accuracy, project_path, docs_path, markdown_files, markdown_cache, public_symbols)
                 )
             elif criterion == QualityCriterion.PURPOSEFULNESS:
                 analyzers.append(
-                    asyncio.to_thread(assess_purposefulness, project_path, docs_path, markdown_files)
+                    asyncio.to_thread(assess_purposefulness, project_path, docs_path, markdown_files, markdown_cache)
                 )
             elif criterion == QualityCriterion.UNIQUENESS:
                 analyzers.append(
@@ -241,14 +256,15 @@ async def assess_quality(params: AssessQualityInput) -> str | dict[str, Any]:
                     asyncio.to_thread(assess_structure, project_path, docs_path, markdown_files, markdown_cache)
                 )
 
-        # Run all analyzers concurrently
-        results = await asyncio.gather(*analyzers) if analyzers else []
-
-        # Calculate documentation coverage and other metadata
-        coverage_data = calculate_documentation_coverage(project_path, docs_path)
-        undocumented_apis = detect_undocumented_apis(project_path, docs_path)
-        list_formatting = check_list_formatting_consistency(docs_path)
-        heading_case = check_heading_case_consistency(docs_path)
+        # Run all analyzers and the coverage/formatting scans concurrently;
+        # the scans walk docs and index symbols independently of the analyzers
+        results, coverage_data, undocumented_apis, list_formatting, heading_case = await asyncio.gather(
+            asyncio.gather(*analyzers),
+            asyncio.to_thread(calculate_documentation_coverage, project_path, docs_path, markdown_cache, public_symbols),
+            asyncio.to_thread(detect_undocumented_apis, project_path, docs_path, markdown_cache, public_symbols),
+            asyncio.to_thread(check_list_formatting_consistency, docs_path, markdown_cache),
+            asyncio.to_thread(check_heading_case_consistency, docs_path, markdown_cache)
+        )
 
         # Task 3.3: Calculate docstring coverage from symbol baseline
         docstring_coverage = calculate_docstring_coverage(project_path)
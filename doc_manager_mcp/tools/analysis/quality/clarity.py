@@ -8,7 +8,7 @@ from typing import Any
 from doc_manager_mcp.core.markdown_cache import MarkdownCache
 from doc_manager_mcp.indexing.parsers.markdown import MarkdownParser
 
-from .helpers import check_terminology_compliance
+from .helpers import _read_doc, check_terminology_compliance
 
 
 def assess_clarity(
@@ -33,8 +33,7 @@ def assess_clarity(
 
     for md_file in markdown_files:
         try:
-            with open(md_file, encoding='utf-8') as f:
-                content = f.read()
+            content = _read_doc(md_file, markdown_cache)
 
             # Count words (rough estimate)
             word_count = len(content.split())
@@ -45,7 +44,7 @@ def assess_clarity(
                 files_with_toc += 1
 
             # Extract links and code blocks using cache or parser
-            if markdown_cache:
+            if markdown_cache is not None:
                 parsed = markdown_cache.parse(md_file, content)
                 links = parsed.links
                 code_blocks = parsed.code_blocks
@@ -89,7 +88,7 @@ def assess_clarity(
     # Check terminology compliance if conventions exist
     terminology_issues = []
     if conventions:
-        terminology_data = check_terminology_compliance(docs_path, conventions)
+        terminology_data = check_terminology_compliance(docs_path, conventions, markdown_cache)
 
         # Report avoided terms found
         avoided_terms = terminology_data.get("avoided_terms_found", [])
@@ -8,6 +8,8 @@ from typing import Any
 from doc_manager_mcp.core.markdown_cache import MarkdownCache
 from doc_manager_mcp.indexing.parsers.markdown import MarkdownParser
 
+from .helpers import _read_doc
+
 
 def assess_consistency(
     project_path: Path,
@@ -30,12 +32,11 @@ def assess_consistency(
 
     for md_file in markdown_files:
         try:
-            with open(md_file, encoding='utf-8') as f:
-                content = f.read()
+            content = _read_doc(md_file, markdown_cache)
 
             # Check code block language tags using cache or parser
             # This correctly counts only actual code blocks (not closing fences)
-            if markdown_cache:
+            if markdown_cache is not None:
                 parsed = markdown_cache.parse(md_file, content)
                 code_blocks = parsed.code_blocks
             else:
@@ -1,5 +1,8 @@
 """Helper functions for quality.py to prevent file bloat."""
 
+import re
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -9,6 +12,8 @@ from doc_manager_mcp.core import (
     is_public_symbol,
     load_config,
 )
+from doc_manager_mcp.core.markdown_cache import MarkdownCache
+from doc_manager_mcp.indexing.analysis.tree_sitter import Symbol
 from doc_manager_mcp.indexing.parsers.markdown import MarkdownParser
 
 
@@ -27,21 +32,45 @@ def _load_api_coverage_config(project_path: Path) -> ApiCoverageConfig:
     return ApiCoverageConfig()  # Return defaults
 
 
+# Unordered list item: optional indentation, then "-", "*" or "+" followed by
+# whitespace on the same line ("- item", "  * item", "+\titem")
+_LIST_MARKER_RE = re.compile(r'^[^\S\n]*([-*+])[^\S\n]', re.MULTILINE)
+
+
+def _find_doc_files(docs_path: Path, markdown_cache: MarkdownCache | None) -> list[Path]:
+    """List markdown files under docs_path, sharing the cache's listing when given."""
+    if markdown_cache is not None:
+        return markdown_cache.list_files(docs_path)
+    markdown_files = []
+    for pattern in ["**/*.md", "**/*.markdown"]:
+        markdown_files.extend(docs_path.glob(pattern))
+    return markdown_files
+
+
+def _read_doc(md_file: Path, markdown_cache: MarkdownCache | None) -> str:
+    """Read a markdown file, sharing the cache's copy when given."""
+    if markdown_cache is not None:
+        return markdown_cache.read(md_file)
+    with open(md_file, encoding='utf-8') as f:
+        return f.read()
+
+
 def check_list_formatting_consistency(
-    docs_path: Path
+    docs_path: Path,
+    markdown_cache: MarkdownCache | None = None
 ) -> dict[str, Any]:
     """Check consistency of list formatting across documentation.
 
     Detects if project uses - vs * vs + for unordered lists.
 
+    Args:
+        docs_path: Path to documentation directory
+        markdown_cache: Optional markdown cache; reuses reads and code blocks from other checks
+
     Returns:
         Dict with majority_marker, inconsistent_files, consistency_score
     """
-    import re
-
-    markdown_files = []
-    for pattern in ["**/*.md", "**/*.markdown"]:
-        markdown_files.extend(docs_path.glob(pattern))
+    markdown_files = _find_doc_files(docs_path, markdown_cache)
 
     if not markdown_files:
         return {
@@ -58,13 +87,21 @@ def check_list_formatting_consistency(
 
     for md_file in markdown_files:
         try:
-            with open(md_file, encoding='utf-8') as f:
-                content = f.read()
+            content = _read_doc(md_file, markdown_cache)
+
+            # Every list item needs a '-', '*' or '+' marker; skip files with none
+            if '-' not in content and '*' not in content and '+' not in content:
+                continue
 
             # Remove code blocks to avoid counting code examples
             # Use MarkdownParser for proper code block detection (handles indented blocks, nested fences, etc.)
-            lines = content.split('\n')
-            code_blocks = parser.extract_code_blocks(content)
+            if markdown_cache is not None:
+                code_blocks = markdown_cache.parse(md_file, content).code_blocks
+            elif '```' in content or '~~~' in content:
+                code_blocks = parser.extract_code_blocks(content)
+            else:
+                # Fenced blocks open with ``` or ~~~; nothing to parse without either
+                code_blocks = []
 
             # Build set of line ranges that are inside code blocks
             code_block_lines = set()
@@ -75,23 +112,22 @@ def check_list_formatting_consistency(
                 end_line = start_line + num_code_lines
                 code_block_lines.update(range(start_line, end_line + 2))  # +2 to include fence lines
 
-            # Pattern for unordered list items at start of line
-            # Match: "- item", "* item", "+ item" (with optional leading spaces)
+            # Unordered list items at start of line, found in one scan of the file
             file_marker_counts = {"-": 0, "*": 0, "+": 0}
+            line_num = 1
+            scanned_to = 0
 
-            for i, line in enumerate(lines, 1):
-                # Skip lines inside code blocks
-                if i in code_block_lines:
-                    continue
+            for match in _LIST_MARKER_RE.finditer(content):
+                # Skip lines inside code blocks (line numbers are only needed when there are any)
+                if code_block_lines:
+                    line_num += content.count('\n', scanned_to, match.start())
+                    scanned_to = match.start()
+                    if line_num in code_block_lines:
+                        continue
 
-                for marker in ["-", "*", "+"]:
-                    # Escape marker for regex if needed
-                    escaped_marker = re.escape(marker)
-                    # Match marker at start of line (with optional indentation) followed by space
-                    pattern = rf'^\s*{escaped_marker}\s+'
-                    if re.match(pattern, line):
-                        marker_counts[marker] += 1
-                        file_marker_counts[marker] += 1
+                marker = match.group(1)
+                marker_counts[marker] += 1
+                file_marker_counts[marker] += 1
 
             # Record which markers this file uses
             if sum(file_marker_counts.values()) > 0:
@@ -139,21 +175,24 @@ def check_list_formatting_consistency(
 
 
 def check_heading_case_consistency(
-    docs_path: Path
+    docs_path: Path,
+    markdown_cache: MarkdownCache | None = None
 ) -> dict[str, Any]:
     """Check consistency of heading capitalization style.
 
     Detects if project uses Title Case vs Sentence case.
 
+    Args:
+        docs_path: Path to documentation directory
+        markdown_cache: Optional markdown cache; reuses reads and headings from other checks
+
     Returns:
         Dict with majority_style, inconsistent_files, consistency_score
     """
     from ....indexing.parsers.markdown import MarkdownParser
 
     parser = MarkdownParser()
-    markdown_files = []
-    for pattern in ["**/*.md", "**/*.markdown"]:
-        markdown_files.extend(docs_path.glob(pattern))
+    markdown_files = _find_doc_files(docs_path, markdown_cache)
 
     if not markdown_files:
         return {
@@ -168,10 +207,12 @@ def check_heading_case_consistency(
 
     for md_file in markdown_files:
         try:
-            with open(md_file, encoding='utf-8') as f:
-                content = f.read()
+            content = _read_doc(md_file, markdown_cache)
 
-            headers = parser.extract_headers(content)
+            if markdown_cache is not None:
+                headers = markdown_cache.parse(md_file, content).headings
+            else:
+                headers = parser.extract_headers(content)
 
             if not headers:
                 continue
@@ -241,11 +282,21 @@ def check_heading_case_consistency(
     }
 
 
+# Articles and short words that should be lowercase in title case
+_TITLE_CASE_MINOR_WORDS = frozenset({
+    "a", "an", "the", "and", "but", "or", "for", "nor", "on", "at", "to", "by", "in", "of", "with"
+})
+
+
+@lru_cache(maxsize=4096)
 def _classify_heading_style(heading: str) -> str:
     """Classify a heading as title_case or sentence_case.
 
     Title case: Most major words are capitalized
     Sentence case: Only first word and proper nouns are capitalized
+
+    Cached because docs repeat the same headings ("Installation", "Usage",
+    "Configuration options") across files and assess_quality runs.
     """
     words = heading.split()
 
@@ -256,26 +307,17 @@ def _classify_heading_style(heading: str) -> str:
     capitalized_count = 0
     total_significant_words = 0
 
-    # Articles and short words that should be lowercase in title case
-    minor_words = {"a", "an", "the", "and", "but", "or", "for", "nor", "on", "at", "to", "by", "in", "of", "with"}
-
-    for i, word in enumerate(words):
-        # Skip first word (always capitalized in both styles)
-        if i == 0:
-            continue
+    # Skip first word (always capitalized in both styles)
+    for word in words[1:]:
+        # Clean word of punctuation for checking; most words are letters only already
+        clean_word = word if word.isalpha() else ''.join(c for c in word if c.isalpha())
 
         # Skip words without letters
-        if not any(c.isalpha() for c in word):
-            continue
-
-        # Clean word of punctuation for checking
-        clean_word = ''.join(c for c in word if c.isalpha())
-
         if not clean_word:
             continue
 
         # Skip minor words in the analysis (they can be lowercase in title case)
-        if clean_word.lower() in minor_words:
+        if clean_word.lower() in _TITLE_CASE_MINOR_WORDS:
             continue
 
         total_significant_words += 1
@@ -295,7 +337,8 @@ def _classify_heading_style(heading: str) -> str:
 
 
 def detect_multiple_h1s(
-    docs_path: Path
+    docs_path: Path,
+    markdown_cache: MarkdownCache | None = None
 ) -> list[dict[str, Any]]:
     """Detect files with multiple H1 headers.
 
@@ -303,30 +346,34 @@ def detect_multiple_h1s(
 
     Args:
         docs_path: Path to documentation directory
+        markdown_cache: Optional markdown cache; reuses reads and headings from other checks
 
     Returns:
         List of files with multiple H1s (file, h1_count, h1_texts)
     """
-    from ....indexing.parsers.markdown import MarkdownParser
-
     parser = MarkdownParser()
     issues = []
 
     # Find all markdown files
-    markdown_files = []
-    for pattern in ["**/*.md", "**/*.markdown"]:
-        markdown_files.extend(docs_path.glob(pattern))
+    markdown_files = _find_doc_files(docs_path, markdown_cache)
 
     for md_file in markdown_files:
         try:
-            with open(md_file, encoding='utf-8') as f:
-                content = f.read()
+            content = _read_doc(md_file, markdown_cache)
 
-            # Extract all headers
-            headers = parser.extract_headers(content)
+            # An H1 needs an ATX '#' or a setext '=' underline; without either
+            # marker the file has no H1 and there is nothing to parse
+            if '#' not in content and '=' not in content:
+                h1_headers = []
+            else:
+                # Extract all headers
+                if markdown_cache is not None:
+                    headers = markdown_cache.parse(md_file, content).headings
+                else:
+                    headers = parser.extract_headers(content)
 
-            # Filter for H1s only
-            h1_headers = [h for h in headers if h["level"] == 1]
+                # Filter for H1s only
+                h1_headers = [h for h in headers if h["level"] == 1]
 
             # Report files with 0 or >1 H1s
             if len(h1_headers) != 1:
@@ -343,27 +390,68 @@ def detect_multiple_h1s(
     return issues
 
 
-def detect_undocumented_apis(
-    project_path: Path,
-    docs_path: Path
-) -> list[dict[str, Any]]:
-    """Detect public APIs without documentation.
+# Symbol references in docs, shared by the coverage and undocumented-API scans:
+# `functionName()` / `ClassName.methodName()`, `ClassName`, and signature headings
+# like "## functionName(...)" or "### ClassName.methodName(...)"
+_DOC_FUNCTION_REF_RE = re.compile(r'^(?:([A-Z][a-zA-Z0-9]*)\.)?(([A-Z][a-zA-Z0-9]*)|([a-z_][a-zA-Z0-9_]*))\(\)$')
+_DOC_CLASS_REF_RE = re.compile(r'^([A-Z][a-zA-Z0-9]+)$')
+_DOC_HEADING_SIGNATURE_RE = re.compile(
+    r'^#+\s+(?:([A-Z][a-zA-Z0-9]*)\.)?(([A-Z][a-zA-Z0-9]*)|([a-z_][a-zA-Z0-9_]*))\s*\([^)]*\)',
+    re.MULTILINE
+)
+_DOC_CLASS_EXCLUDES = frozenset({'API', 'CLI', 'HTTP', 'HTTPS', 'URL', 'JSON', 'XML', 'HTML', 'CSS'})
 
-    Compares codebase public symbols against documented references.
-    Uses configurable conventions from .doc-manager.yml api_coverage section,
-    following industry standards from Sphinx, mkdocstrings, and pdoc.
+
+def _add_documented_references(
+    content: str,
+    inline_codes: list[dict[str, Any]],
+    documented_symbols: set[str]
+) -> None:
+    """Add symbol names referenced in inline code or signature headings.
+
+    Args:
+        content: Markdown content
+        inline_codes: Inline code spans extracted from content
+        documented_symbols: Set that referenced names are added to
+    """
+    for code_span in inline_codes:
+        code_text = code_span["text"]
+
+        # Match function references: functionName(), ClassName.MethodName()
+        if code_text.endswith('()') and (match := _DOC_FUNCTION_REF_RE.match(code_text)):
+            # Extract function/method name (group 2 is full match, group 3 or 4 is name)
+            documented_symbols.add(match.group(3) or match.group(4))
+
+        # Match class/type references: ClassName
+        elif code_text[:1].isupper() and (match := _DOC_CLASS_REF_RE.match(code_text)):
+            class_name = match.group(1)
+            # Exclude common acronyms
+            if len(class_name) > 2 and class_name not in _DOC_CLASS_EXCLUDES:
+                documented_symbols.add(class_name)
+
+    # Extract function signatures from markdown headings
+    if '#' in content:
+        for match in _DOC_HEADING_SIGNATURE_RE.finditer(content):
+            documented_symbols.add(match.group(3) or match.group(4))
+
+
+def collect_public_symbols(project_path: Path) -> list[Symbol]:
+    """Index the project and return the symbols that count as public API.
+
+    Uses configurable conventions from .doc-manager.yml api_coverage section.
+    Coverage and undocumented-API checks share the result, so a quality
+    assessment indexes the project once.
 
     Args:
         project_path: Root directory of the project
-        docs_path: Documentation directory path
 
     Returns:
-        List of undocumented symbols (name, type, file, line)
-    """
-    import re
+        Public symbols in index order
 
+    Raises:
+        Exception: Whatever SymbolIndexer raises if indexing fails
+    """
     from ....indexing import SymbolIndexer
-    from ....indexing.parsers.markdown import MarkdownParser
 
     # Load API coverage config
     api_config = _load_api_coverage_config(project_path)
@@ -371,17 +459,11 @@ def detect_undocumented_apis(
     include_patterns = api_config.include_symbols
     strategy = api_config.strategy
 
-    # Step 1: Get all symbols from codebase
-    try:
-        indexer = SymbolIndexer()
-        indexer.index_project(project_path)
-        all_symbols = indexer.get_all_symbols()
-    except Exception as e:
-        import sys
-        print(f"Warning: Failed to index project symbols: {e}", file=sys.stderr)
-        return []
-
-    # Step 1b: Extract __all__ from Python modules for accurate public API detection
+    indexer = SymbolIndexer()
+    indexer.index_project(project_path)
+    all_symbols = indexer.get_all_symbols()
+
+    # Extract __all__ from Python modules for accurate public API detection
     module_all_cache: dict[str, set[str] | None] = {}
 
     def get_module_all(file_path: str) -> set[str] | None:
@@ -407,45 +489,60 @@ def detect_undocumented_apis(
         ):
             public_symbols.append(symbol)
 
+    return public_symbols
+
+
+def detect_undocumented_apis(
+    project_path: Path,
+    docs_path: Path,
+    markdown_cache: MarkdownCache | None = None,
+    public_symbols: list[Symbol] | None = None
+) -> list[dict[str, Any]]:
+    """Detect public APIs without documentation.
+
+    Compares codebase public symbols against documented references.
+    Uses configurable conventions from .doc-manager.yml api_coverage section,
+    following industry standards from Sphinx, mkdocstrings, and pdoc.
+
+    Args:
+        project_path: Root directory of the project
+        docs_path: Documentation directory path
+        markdown_cache: Optional markdown cache; reuses reads and parsed spans from other checks
+        public_symbols: Pre-collected public symbols (from collect_public_symbols) or None to index
+
+    Returns:
+        List of undocumented symbols (name, type, file, line)
+    """
+    import sys
+
+    # Step 1: Get all public symbols from codebase
+    if public_symbols is None:
+        try:
+            public_symbols = collect_public_symbols(project_path)
+        except Exception as e:
+            print(f"Warning: Failed to index project symbols: {e}", file=sys.stderr)
+            return []
+
     # Step 2: Scan documentation for symbol references
     documented_symbols = set()
     parser = MarkdownParser()
 
     # Find all markdown files
-    markdown_files = []
-    for pattern in ["**/*.md", "**/*.markdown"]:
-        markdown_files.extend(docs_path.glob(pattern))
+    markdown_files = _find_doc_files(docs_path, markdown_cache)
 
     # Extract documented symbols from all markdown files
     for md_file in markdown_files:
         try:
-            with open(md_file, encoding='utf-8') as f:
-                content = f.read()
-
-            # Extract inline code references
-            inline_codes = parser.extract_inline_code(content)
-            for code_span in inline_codes:
-                code_text = code_span["text"]
-
-                # Match function references: functionName(), ClassName.MethodName()
-                if match := re.match(r'^(?:([A-Z][a-zA-Z0-9]*)\.)?(([A-Z][a-zA-Z0-9]*)|([a-z_][a-zA-Z0-9_]*))\(\)$', code_text):
-                    # Extract function/method name (group 2 is full match, group 3 or 4 is name)
-                    func_name = match.group(3) or match.group(4)
-                    documented_symbols.add(func_name)
-
-                # Match class/type references: ClassName
-                elif match := re.match(r'^([A-Z][a-zA-Z0-9]+)$', code_text):
-                    class_name = match.group(1)
-                    # Exclude common acronyms
-                    if len(class_name) > 2 and class_name not in ['API', 'CLI', 'HTTP', 'HTTPS', 'URL', 'JSON', 'XML', 'HTML', 'CSS']:
-                        documented_symbols.add(class_name)
-
-            # Extract function signatures from markdown headings
-            # Pattern: ## functionName(...) or ### ClassName.methodName(...)
-            heading_pattern = r'^#+\s+(?:([A-Z][a-zA-Z0-9]*)\.)?(([A-Z][a-zA-Z0-9]*)|([a-z_][a-zA-Z0-9_]*))\s*\([^)]*\)'
-            for match in re.finditer(heading_pattern, content, re.MULTILINE):
-                func_name = match.group(3) or match.group(4)
-                documented_symbols.add(func_name)
+            content = _read_doc(md_file, markdown_cache)
+
+            # Extract inline code references (spans need a backtick) and heading signatures
+            if markdown_cache is not None:
+                inline_codes = markdown_cache.parse(md_file, content).inline_code
+            elif '`' in content:
+                inline_codes = parser.extract_inline_code(content)
+            else:
+                inline_codes = []
+            _add_documented_references(content, inline_codes, documented_symbols)
 
         except Exception:  # noqa: S112
             continue  # Skip files that can't be read
@@ -464,9 +561,28 @@ def detect_undocumented_apis(
     return undocumented
 
 
+@dataclass(slots=True)
+class _TypeCounts:
+    """Per-symbol-type tallies, updated in place while counting coverage."""
+
+    total: int = 0
+    documented: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "total": self.total,
+            "documented": self.documented,
+            "coverage_percentage": round(
+                self.documented / self.total * 100 if self.total > 0 else 0.0, 1
+            ),
+        }
+
+
 def calculate_documentation_coverage(
     project_path: Path,
-    docs_path: Path
+    docs_path: Path,
+    markdown_cache: MarkdownCache | None = None,
+    public_symbols: list[Symbol] | None = None
 ) -> dict[str, Any]:
     """Calculate percentage of documented symbols.
 
@@ -476,62 +592,27 @@ def calculate_documentation_coverage(
     Args:
         project_path: Path to project root
         docs_path: Path to documentation directory
+        markdown_cache: Optional markdown cache; reuses reads and parsed spans from other checks
+        public_symbols: Pre-collected public symbols (from collect_public_symbols) or None to index
 
     Returns:
         Dict with total_symbols, documented_symbols, coverage_percentage, breakdown_by_type
     """
-    import re
     import sys
 
-    from ....indexing import SymbolIndexer
-    from ....indexing.parsers.markdown import MarkdownParser
-
-    # Load API coverage config
-    api_config = _load_api_coverage_config(project_path)
-    exclude_patterns = api_config.get_resolved_exclude_patterns()
-    include_patterns = api_config.include_symbols
-    strategy = api_config.strategy
-
-    # Index all symbols in the project
-    try:
-        indexer = SymbolIndexer()
-        indexer.index_project(project_path)
-        all_symbols = indexer.get_all_symbols()
-    except Exception as e:
-        print(f"Warning: Failed to index project symbols: {e}", file=sys.stderr)
-        return {
-            "error": str(e),
-            "total_symbols": 0,
-            "documented_symbols": 0,
-            "coverage_percentage": 0.0,
-            "breakdown_by_type": {}
-        }
-
-    # Extract __all__ from Python modules for accurate public API detection
-    module_all_cache: dict[str, set[str] | None] = {}
-
-    def get_module_all(file_path: str) -> set[str] | None:
-        """Get cached __all__ for a Python module."""
-        if file_path not in module_all_cache:
-            abs_path = project_path / file_path
-            if abs_path.suffix == '.py' and abs_path.exists():
-                module_all_cache[file_path] = extract_module_all(abs_path)
-            else:
-                module_all_cache[file_path] = None
-        return module_all_cache[file_path]
-
-    # Filter to only public symbols using configurable conventions
-    public_symbols = []
-    for symbol in all_symbols:
-        module_all = get_module_all(symbol.file)
-        if is_public_symbol(
-            symbol,
-            module_all=module_all,
-            exclude_patterns=exclude_patterns,
-            include_patterns=include_patterns,
-            strategy=strategy,
-        ):
-            public_symbols.append(symbol)
+    # Index all public symbols in the project
+    if public_symbols is None:
+        try:
+            public_symbols = collect_public_symbols(project_path)
+        except Exception as e:
+            print(f"Warning: Failed to index project symbols: {e}", file=sys.stderr)
+            return {
+                "error": str(e),
+                "total_symbols": 0,
+                "documented_symbols": 0,
+                "coverage_percentage": 0.0,
+                "breakdown_by_type": {}
+            }
 
     if not public_symbols:
         return {
@@ -545,75 +626,66 @@ def calculate_documentation_coverage(
     # Scan documentation for symbol references
     parser = MarkdownParser()
     documented_symbols = set()
+    example_code: list[str] = []
 
     # Find all markdown files
-    markdown_files = []
-    for pattern in ["**/*.md", "**/*.markdown"]:
-        markdown_files.extend(docs_path.glob(pattern))
+    markdown_files = _find_doc_files(docs_path, markdown_cache)
 
     for md_file in markdown_files:
         try:
-            with open(md_file, encoding='utf-8') as f:
-                content = f.read()
-
-            # Extract inline code references
-            inline_codes = parser.extract_inline_code(content)
-            for code_span in inline_codes:
-                code_text = code_span["text"]
-
-                # Match function references: functionName(), ClassName.MethodName()
-                if match := re.match(r'^(?:([A-Z][a-zA-Z0-9]*)\.)?(([A-Z][a-zA-Z0-9]*)|([a-z_][a-zA-Z0-9_]*))\(\)$', code_text):
-                    func_name = match.group(3) or match.group(4)
-                    documented_symbols.add(func_name)
-
-                # Match class/type references: ClassName
-                elif match := re.match(r'^([A-Z][a-zA-Z0-9]+)$', code_text):
-                    class_name = match.group(1)
-                    if len(class_name) > 2 and class_name not in ['API', 'CLI', 'HTTP', 'HTTPS', 'URL', 'JSON', 'XML', 'HTML', 'CSS']:
-                        documented_symbols.add(class_name)
-
-            # Extract function signatures from markdown headings
-            heading_pattern = r'^#+\s+(?:([A-Z][a-zA-Z0-9]*)\.)?(([A-Z][a-zA-Z0-9]*)|([a-z_][a-zA-Z0-9_]*))\s*\([^)]*\)'
-            for match in re.finditer(heading_pattern, content, re.MULTILINE):
-                func_name = match.group(3) or match.group(4)
-                documented_symbols.add(func_name)
-
-            # Extract code blocks (check for symbol usage in examples)
-            code_blocks = parser.extract_code_blocks(content)
-            for block in code_blocks:
-                # Simple token-based extraction - check if symbol name appears
-                for symbol in public_symbols:
-                    if symbol.name in block["code"]:
-                        documented_symbols.add(symbol.name)
+            content = _read_doc(md_file, markdown_cache)
+
+            # Inline code and fenced blocks, tokenized once (both need a backtick or tilde fence)
+            if markdown_cache is not None:
+                parsed = markdown_cache.parse(md_file, content)
+                inline_codes, code_blocks = parsed.inline_code, parsed.code_blocks
+            elif '`' in content or '~~~' in content:
+                tokens = parser.parse(content)
+                inline_codes = parser.extract_inline_code(content, tokens)
+                code_blocks = parser.extract_code_blocks(content, tokens)
+            else:
+                inline_codes, code_blocks = [], []
+
+            # Extract inline code references and heading signatures
+            _add_documented_references(content, inline_codes, documented_symbols)
+
+            # Collect code blocks (checked for symbol usage in examples below)
+            example_code.extend(block["code"] for block in code_blocks)
 
         except Exception:  # noqa: S112
             continue  # Skip files that can't be read
 
+    # Simple substring check of code examples: a symbol counts as documented if its
+    # name appears in any block. All blocks are joined once ('\0' never occurs in a
+    # name, so matches can't span blocks) and each distinct name is searched once.
+    if example_code:
+        all_example_code = '\0'.join(example_code)
+        for name in {symbol.name for symbol in public_symbols} - documented_symbols:
+            if name in all_example_code:
+                documented_symbols.add(name)
+
     # Match documented references to actual symbols
     documented_count = 0
-    breakdown = {}
+    type_counts: dict[str, _TypeCounts] = {}
 
     for symbol in public_symbols:
         symbol_type = str(symbol.type.value)
-        if symbol_type not in breakdown:
-            breakdown[symbol_type] = {"total": 0, "documented": 0}
+        counts = type_counts.get(symbol_type)
+        if counts is None:
+            counts = type_counts[symbol_type] = _TypeCounts()
 
-        breakdown[symbol_type]["total"] += 1
+        counts.total += 1
 
         if symbol.name in documented_symbols:
             documented_count += 1
-            breakdown[symbol_type]["documented"] += 1
+            counts.documented += 1
 
     # Calculate percentages
     total = len(public_symbols)
     coverage_pct = (documented_count / total * 100) if total > 0 else 0.0
 
     # Calculate percentages by type
-    for _type_name, counts in breakdown.items():
-        counts["coverage_percentage"] = round(
-            counts["documented"] / counts["total"] * 100 if counts["total"] > 0 else 0.0,
-            1
-        )
+    breakdown = {symbol_type: counts.as_dict() for symbol_type, counts in type_counts.items()}
 
     return {
         "total_symbols": total,
@@ -717,17 +789,17 @@ def calculate_docstring_coverage(
     }
 
 
-def check_terminology_compliance(docs_path, conventions):
+def check_terminology_compliance(docs_path, conventions, markdown_cache: MarkdownCache | None = None):
     """Check documentation against terminology conventions.
 
     Args:
         docs_path: Path to documentation directory
         conventions: DocumentationConventions object
+        markdown_cache: Optional markdown cache; reuses file reads from other checks
 
     Returns:
         Dict with avoided_terms_found and preferred_term_usage
     """
-    import re
     import sys
 
     if not conventions or not conventions.terminology:
@@ -736,17 +808,34 @@ def check_terminology_compliance(docs_path, conventions):
             "preferred_term_usage": {}
         }
 
-    markdown_files = []
-    for pattern in ["**/*.md", "**/*.markdown"]:
-        markdown_files.extend(docs_path.glob(pattern))
+    markdown_files = _find_doc_files(docs_path, markdown_cache)
+
+    # Read each file once; every term rule scans the same contents
+    file_contents = []
+    for md_file in markdown_files:
+        try:
+            content = _read_doc(md_file, markdown_cache)
+        except Exception as e:
+            print(f"Warning: Failed to check terminology in {md_file}: {e}", file=sys.stderr)
+            continue
+        file_contents.append((str(md_file.relative_to(docs_path)), content))
 
     avoided_terms_found = []
     preferred_term_usage = {}
+    prose_contents = []
+
+    if conventions.terminology.avoid:
+        # Remove code blocks once per file (line numbers are counted in the remaining text)
+        code_block_pattern = re.compile(r"^```.*?^```", re.MULTILINE | re.DOTALL)
+        prose_contents = [
+            (file_path, code_block_pattern.sub("", content)) for file_path, content in file_contents
+        ]
 
     # Check for avoided terms
     for term_rule in conventions.terminology.avoid:
         word = term_rule.word
         exceptions = term_rule.exceptions or []
+        word_pattern = re.compile(r"\b" + re.escape(word) + r"\b", re.IGNORECASE)
 
         # Build exception pattern (phrases that should not be flagged)
         exception_pattern = None
@@ -757,46 +846,40 @@ def check_terminology_compliance(docs_path, conventions):
                 re.IGNORECASE
             )
 
-        for md_file in markdown_files:
-            try:
-                with open(md_file, encoding='utf-8') as f:
-                    content = f.read()
-
-                # Remove code blocks
-                code_block_pattern = r"^```.*?^```"
-                content_without_code = re.sub(
-                    code_block_pattern, "", content,
-                    flags=re.MULTILINE | re.DOTALL
-                )
-
-                # Split into lines
-                lines = content_without_code.split("\n")
-
-                for i, line in enumerate(lines, 1):
-                    word_pattern = re.compile(
-                        r"\b" + re.escape(word) + r"\b",
-                        re.IGNORECASE
-                    )
-
-                    if word_pattern.search(line):
-                        if exception_pattern and exception_pattern.search(line):
-                            continue
-
-                        avoided_terms_found.append({
-                            "term": word,
-                            "file": str(md_file.relative_to(docs_path)),
-                            "line": i,
-                            "reason": term_rule.reason
-                        })
-
-            except Exception as e:
-                print(f"Warning: Failed to check terminology in {md_file}: {e}", file=sys.stderr)
-                continue
+        for file_path, text in prose_contents:
+            # Scan the whole text once, resolving each match to its line as we go
+            line_num = 1
+            scanned_to = 0
+            last_flagged_line = 0
+
+            for match in word_pattern.finditer(text):
+                start = match.start()
+                line_num += text.count('\n', scanned_to, start)
+                scanned_to = start
+
+                # Each line is reported (or excused) once, however many matches it has
+                if line_num == last_flagged_line:
+                    continue
+                last_flagged_line = line_num
+
+                if exception_pattern:
+                    line_start = text.rfind('\n', 0, start) + 1
+                    line_end = text.find('\n', start)
+                    if exception_pattern.search(text, line_start, len(text) if line_end == -1 else line_end):
+                        continue
+
+                avoided_terms_found.append({
+                    "term": word,
+                    "file": file_path,
+                    "line": line_num,
+                    "reason": term_rule.reason
+                })
 
     # Check preferred terminology usage
     for term_key, term_config in conventions.terminology.preferred.items():
-        full_form = term_config.full_form
+        full_form_pattern = re.compile(re.escape(term_config.full_form), re.IGNORECASE)
         abbreviation = term_config.abbreviation
+        abbreviation_pattern = re.compile(r"\b" + re.escape(abbreviation) + r"\b") if abbreviation else None
 
         usage = {
             "full_form_count": 0,
@@ -804,24 +887,16 @@ def check_terminology_compliance(docs_path, conventions):
             "files": []
         }
 
-        for md_file in markdown_files:
-            try:
-                with open(md_file, encoding='utf-8') as f:
-                    content = f.read()
-
-                full_form_count = len(re.findall(re.escape(full_form), content, re.IGNORECASE))
-                abbr_count = 0
-                if abbreviation:
-                    abbr_count = len(re.findall(r"\b" + re.escape(abbreviation) + r"\b", content))
+        for file_path, content in file_contents:
+            full_form_count = len(full_form_pattern.findall(content))
+            abbr_count = 0
+            if abbreviation_pattern:
+                abbr_count = len(abbreviation_pattern.findall(content))
 
-                if full_form_count > 0 or abbr_count > 0:
-                    usage["full_form_count"] += full_form_count
-                    usage["abbreviation_count"] += abbr_count
-                    usage["files"].append(str(md_file.relative_to(docs_path)))
-
-            except Exception as e:
-                print(f"Warning: Failed to check preferred terminology in {md_file}: {e}", file=sys.stderr)
-                continue
+            if full_form_count > 0 or abbr_count > 0:
+                usage["full_form_count"] += full_form_count
+                usage["abbreviation_count"] += abbr_count
+                usage["files"].append(file_path)
 
         if usage["full_form_count"] > 0 or usage["abbreviation_count"] > 0:
             preferred_term_usage[term_key] = usage
@@ -5,8 +5,17 @@ import sys
 from pathlib import Path
 from typing import Any
 
+from doc_manager_mcp.core.markdown_cache import MarkdownCache
 
-def assess_purposefulness(project_path: Path, docs_path: Path, markdown_files: list[Path]) -> dict[str, Any]:
+from .helpers import _read_doc
+
+
+def assess_purposefulness(
+    project_path: Path,
+    docs_path: Path,
+    markdown_files: list[Path],
+    markdown_cache: MarkdownCache | None = None
+) -> dict[str, Any]:
     """Assess if documents have clear goals and target audiences."""
     issues = []
     findings = []
@@ -33,8 +42,7 @@ def assess_purposefulness(project_path: Path, docs_path: Path, markdown_files: l
 
     for md_file in markdown_files:
         try:
-            with open(md_file, encoding='utf-8') as f:
-                content = f.read()
+            content = _read_doc(md_file, markdown_cache)
 
             # Check for H1 header
             if re.search(r'^# .+', content, re.MULTILINE):
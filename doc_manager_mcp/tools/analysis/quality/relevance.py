@@ -6,59 +6,75 @@ from pathlib import Path
 from typing import Any
 
 from doc_manager_mcp.core import get_doc_relative_path
+from doc_manager_mcp.core.markdown_cache import MarkdownCache
 
+from .helpers import _read_doc
 from .utils import remove_code_blocks
 
-
-def assess_relevance(project_path: Path, docs_path: Path, markdown_files: list[Path]) -> dict[str, Any]:
+# Deprecated/outdated markers, each counted separately (a phrase like
+# "deprecated in" intentionally scores under two patterns)
+_DEPRECATED_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'\b(deprecated|obsolete|outdated|legacy|old)\b',
+        r'\b(no longer supported|not supported)\b',
+        r'\b(removed in|deprecated in)\b',
+    )
+)
+
+# Context indicators that suggest documentation ABOUT deprecations (not deprecated docs).
+# Only presence matters, so the alternatives are scanned in a single pass.
+_MIGRATION_CONTEXT_RE = re.compile(
+    r'\b(migration|migrating|upgrade|upgrading)\b'
+    r'|\b(how to|guide to|documentation for)\b'
+    r'|\b(breaking changes?|changelog|release notes)\b',
+    re.IGNORECASE,
+)
+
+
+def assess_relevance(
+    project_path: Path,
+    docs_path: Path,
+    markdown_files: list[Path],
+    markdown_cache: MarkdownCache | None = None
+) -> dict[str, Any]:
     """Assess if documentation addresses current user needs and use cases."""
     issues = []
     findings = []
 
-    # Check for deprecated/outdated markers
-    deprecated_patterns = [
-        r'\b(deprecated|obsolete|outdated|legacy|old)\b',
-        r'\b(no longer supported|not supported)\b',
-        r'\b(removed in|deprecated in)\b'
-    ]
-
-    # Context indicators that suggest documentation ABOUT deprecations (not deprecated docs)
-    migration_context_patterns = [
-        r'\b(migration|migrating|upgrade|upgrading)\b',
-        r'\b(how to|guide to|documentation for)\b',
-        r'\b(breaking changes?|changelog|release notes)\b'
-    ]
-
     deprecated_count = 0
     files_with_deprecated = []
 
     for md_file in markdown_files:
         try:
-            with open(md_file, encoding='utf-8') as f:
-                content = f.read()
+            content = _read_doc(md_file, markdown_cache)
 
             # Remove code blocks to avoid counting code comments
             content_without_code = remove_code_blocks(content)
 
             # Check if this is migration/changelog documentation
-            is_migration_doc = any(
-                re.search(pattern, content_without_code, re.IGNORECASE)
-                for pattern in migration_context_patterns
-            ) or 'migration' in md_file.name.lower() or 'changelog' in md_file.name.lower()
+            file_name = md_file.name.lower()
+            is_migration_doc = (
+                'migration' in file_name
+                or 'changelog' in file_name
+                or _MIGRATION_CONTEXT_RE.search(content_without_code) is not None
+            )
 
             # Check for deprecated markers
-            for pattern in deprecated_patterns:
-                matches = list(re.finditer(pattern, content_without_code, re.IGNORECASE))
-                if matches:
-                    # If this is migration/changelog docs, reduce the weight
-                    if is_migration_doc:
-                        # Only count 10% of matches in migration docs
-                        deprecated_count += len(matches) * 0.1
-                    else:
-                        deprecated_count += len(matches)
-
-                    if str(md_file) not in files_with_deprecated:
-                        files_with_deprecated.append(get_doc_relative_path(md_file, docs_path, project_path))
+            file_matches = sum(
+                1
+                for pattern in _DEPRECATED_PATTERNS
+                for _ in pattern.finditer(content_without_code)
+            )
+            if file_matches:
+                # If this is migration/changelog docs, reduce the weight
+                if is_migration_doc:
+                    # Only count 10% of matches in migration docs
+                    deprecated_count += file_matches * 0.1
+                else:
+                    deprecated_count += file_matches
+
+                files_with_deprecated.append(get_doc_relative_path(md_file, docs_path, project_path))
 
         except Exception as e:
             print(f"Warning: Failed to read file {md_file}: {e}", file=sys.stderr)
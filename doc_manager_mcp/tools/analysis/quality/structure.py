@@ -7,7 +7,7 @@ from typing import Any
 from doc_manager_mcp.core.markdown_cache import MarkdownCache
 from doc_manager_mcp.indexing.parsers.markdown import MarkdownParser
 
-from .helpers import detect_multiple_h1s
+from .helpers import _read_doc, detect_multiple_h1s
 
 
 def assess_structure(
@@ -30,11 +30,10 @@ def assess_structure(
 
     for md_file in markdown_files:
         try:
-            with open(md_file, encoding='utf-8') as f:
-                content = f.read()
+            content = _read_doc(md_file, markdown_cache)
 
             # Extract all headings using cache or parser
-            if markdown_cache:
+            if markdown_cache is not None:
                 parsed = markdown_cache.parse(md_file, content)
                 headers = parsed.headings
             else:
@@ -55,7 +54,7 @@ def assess_structure(
             print(f"Warning: Failed to read file {md_file}: {e}", file=sys.stderr)
 
     # Check for multiple H1s using helper function
-    multiple_h1_issues = detect_multiple_h1s(docs_path)
+    multiple_h1_issues = detect_multiple_h1s(docs_path, markdown_cache)
 
     if heading_issues > 0:
         issues.append({
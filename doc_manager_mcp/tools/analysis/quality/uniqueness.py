@@ -8,6 +8,8 @@ from doc_manager_mcp.core import get_doc_relative_path
 from doc_manager_mcp.core.markdown_cache import MarkdownCache
 from doc_manager_mcp.indexing.parsers.markdown import MarkdownParser
 
+from .helpers import _read_doc
+
 
 def assess_uniqueness(
     project_path: Path,
@@ -24,11 +26,10 @@ def assess_uniqueness(
 
     for md_file in markdown_files:
         try:
-            with open(md_file, encoding='utf-8') as f:
-                content = f.read()
+            content = _read_doc(md_file, markdown_cache)
 
             # Extract headers using cache or parser
-            if markdown_cache:
+            if markdown_cache is not None:
                 parsed = markdown_cache.parse(md_file, content)
                 all_headers = parsed.headings
             else:
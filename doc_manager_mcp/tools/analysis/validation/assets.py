@@ -3,8 +3,10 @@
 Task 2.3: Use asset_to_docs from dependencies.json for comprehensive asset tracking.
 """
 
+import os
 import re
 import sys
+from functools import cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -19,6 +21,12 @@ from doc_manager_mcp.core import (
 from doc_manager_mcp.core.markdown_cache import MarkdownCache
 from doc_manager_mcp.indexing.parsers.markdown import MarkdownParser
 
+# Raw HTML images: <img src="..." alt="...">. The tag is matched once and its
+# attributes are read separately, so alt is found whichever order they appear in.
+_HTML_IMAGE_TAG_RE = re.compile(r'<img\s[^>]*>')
+_HTML_SRC_ATTR_RE = re.compile(r'(?<![\w-])src=["\']([^"\']+)["\']')
+_HTML_ALT_ATTR_RE = re.compile(r'(?<![\w-])alt=["\']([^"\']*)["\']')
+
 
 def extract_images(
     content: str,
@@ -28,8 +36,12 @@ def extract_images(
     """Extract all images from markdown content."""
     images = []
 
+    # Images need '![' (markdown) or '<img' (raw HTML); skip parsing files with neither
+    if '![' not in content and '<img' not in content:
+        return images
+
     # Extract markdown images using cache or parser
-    if markdown_cache:
+    if markdown_cache is not None:
         parsed = markdown_cache.parse(file_path, content)
         md_images = parsed.images
     else:
@@ -45,11 +57,22 @@ def extract_images(
         })
 
     # HTML images: <img src="..." alt="..."> (fallback for raw HTML)
-    html_image_pattern = r'<img\s+[^>]*src=["\']([^"\']+)["\'](?:[^>]*alt=["\']([^"\']*)["\'])?'
-    for match in re.finditer(html_image_pattern, content):
-        image_src = match.group(1)
-        alt_text = match.group(2) or ""
-        line_num = content[:match.start()].count('\n') + 1
+    # Most docs have no raw HTML images; a substring test skips the regex scan for them
+    if '<img' not in content:
+        return images
+
+    # Matches arrive in order, so line numbers only count newlines since the last match
+    line_num, scanned_to = 1, 0
+    for match in _HTML_IMAGE_TAG_RE.finditer(content):
+        tag = match.group()
+        src_match = _HTML_SRC_ATTR_RE.search(tag)
+        if src_match is None:
+            continue
+        image_src = src_match.group(1)
+        alt_match = _HTML_ALT_ATTR_RE.search(tag)
+        alt_text = alt_match.group(1) if alt_match else ""
+        line_num += content.count('\n', scanned_to, match.start())
+        scanned_to = match.start()
         images.append({
             "alt": alt_text,
             "src": image_src,
@@ -60,6 +83,27 @@ def extract_images(
     return images
 
 
+def _collect_existing_files(root: Path) -> set[str]:
+    """Collect normalized paths of every file under root in one directory walk.
+
+    Lets image checks use set membership instead of resolving and stat-ing
+    each reference. Symlinked directories are not descended into.
+    """
+    existing: set[str] = set()
+    pending = [os.path.normpath(root)]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file():
+                        existing.add(entry.path)
+        except OSError:
+            continue
+    return existing
+
+
 def validate_assets(
     docs_path: Path,
     project_path: Path,
@@ -77,12 +121,25 @@ def validate_assets(
             include_root_readme=include_root_readme
         )
 
+    # One walk of the docs tree answers most existence checks below
+    existing_files = _collect_existing_files(docs_path)
+    project_prefix = os.path.join(os.path.normpath(project_path), '')
+    # Fallback existence results, so an image referenced from many docs is stat'ed once
+    resolved_exists: dict[str, bool] = {}
+
+    # get_doc_relative_path resolve()s paths; memoize so each file is resolved at most once
+    doc_relative_path = cache(get_doc_relative_path)
+
     for md_file in markdown_files:
         try:
-            with open(md_file, encoding='utf-8') as f:
-                content = f.read()
+            if markdown_cache is not None:
+                content = markdown_cache.read(md_file)
+            else:
+                with open(md_file, encoding='utf-8') as f:
+                    content = f.read()
 
             images = extract_images(content, md_file, markdown_cache)
+            md_dir = os.path.dirname(md_file)
 
             for img in images:
                 # Check for missing alt text
@@ -90,7 +147,7 @@ def validate_assets(
                     issues.append({
                         "type": "missing_alt_text",
                         "severity": "warning",
-                        "file": get_doc_relative_path(md_file, docs_path, project_path),
+                        "file": doc_relative_path(md_file, docs_path, project_path),
                         "line": img['line'],
                         "message": f"Image missing alt text: {img['src']}",
                         "image_src": img['src']
@@ -101,18 +158,41 @@ def validate_assets(
                     # Remove anchor/query params
                     image_url = img['src'].split('#')[0].split('?')[0]
 
+                    # Plain string joins; a Path is only built for the fallback below
                     if image_url.startswith('/'):
-                        image_path = docs_path / image_url.lstrip('/')
+                        joined_path = os.path.join(docs_path, image_url.lstrip('/'))
                     else:
-                        image_path = md_file.parent / image_url
+                        joined_path = os.path.join(md_dir, image_url)
+                    normalized_path = os.path.normpath(joined_path)
+
+                    # Files seen during the walk exist; anything else (e.g. assets
+                    # outside the docs tree) falls through to a resolve and stat
+                    if normalized_path in existing_files:
+                        continue
+
+                    # Traversal out of the project is rejected from the string alone,
+                    # without probing the file system outside the project
+                    if not normalized_path.startswith(project_prefix):
+                        issues.append({
+                            "type": "invalid_asset_path",
+                            "severity": "error",
+                            "file": doc_relative_path(md_file, docs_path, project_path),
+                            "line": img['line'],
+                            "message": f"Image path escapes project root: {img['src']}",
+                            "image_src": img['src']
+                        })
+                        continue
 
                     try:
-                        image_path = safe_resolve(image_path)
-                        if not image_path.exists():
+                        exists = resolved_exists.get(joined_path)
+                        if exists is None:
+                            exists = safe_resolve(Path(joined_path)).exists()
+                            resolved_exists[joined_path] = exists
+                        if not exists:
                             issues.append({
                                 "type": "missing_asset",
                                 "severity": "error",
-                                "file": get_doc_relative_path(md_file, docs_path, project_path),
+                                "file": doc_relative_path(md_file, docs_path, project_path),
                                 "line": img['line'],
                                 "message": f"Image file not found: {img['src']}",
                                 "image_src": img['src']
@@ -122,7 +202,7 @@ def validate_assets(
                         issues.append({
                             "type": "invalid_asset_path",
                             "severity": "error",
-                            "file": get_doc_relative_path(md_file, docs_path, project_path),
+                            "file": doc_relative_path(md_file, docs_path, project_path),
                             "line": img['line'],
                             "message": f"Invalid image path: {img['src']}",
                             "image_src": img['src']
@@ -132,7 +212,7 @@ def validate_assets(
             issues.append({
                 "type": "read_error",
                 "severity": "error",
-                "file": get_doc_relative_path(md_file, docs_path, project_path),
+                "file": doc_relative_path(md_file, docs_path, project_path),
                 "line": 1,
                 "message": f"Failed to read file: {e!s}"
             })
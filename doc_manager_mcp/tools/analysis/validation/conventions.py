@@ -1,6 +1,7 @@
 """Documentation conventions validation."""
 
 import sys
+from functools import cache
 from pathlib import Path
 from typing import Any
 
@@ -9,6 +10,7 @@ from doc_manager_mcp.core import (
     get_doc_relative_path,
     validate_against_conventions,
 )
+from doc_manager_mcp.core.markdown_cache import MarkdownCache
 
 
 def validate_conventions(
@@ -16,7 +18,8 @@ def validate_conventions(
     project_path: Path,
     conventions,
     include_root_readme: bool = False,
-    markdown_files: list[Path] | None = None
+    markdown_files: list[Path] | None = None,
+    markdown_cache: MarkdownCache | None = None
 ) -> list[dict[str, Any]]:
     """Validate documentation files against conventions.
 
@@ -26,6 +29,7 @@ def validate_conventions(
         conventions: DocumentationConventions object
         include_root_readme: Whether to include root README.md
         markdown_files: Optional pre-filtered list of files (for incremental mode)
+        markdown_cache: Optional markdown cache holding already-read file contents
 
     Returns:
         List of convention violations
@@ -39,16 +43,22 @@ def validate_conventions(
             include_root_readme=include_root_readme
         )
 
+    # get_doc_relative_path resolve()s paths; memoize so each file is resolved at most once
+    doc_relative_path = cache(get_doc_relative_path)
+
     for md_file in markdown_files:
         try:
-            with open(md_file, encoding='utf-8') as f:
-                content = f.read()
+            if markdown_cache is not None:
+                content = markdown_cache.read(md_file)
+            else:
+                with open(md_file, encoding='utf-8') as f:
+                    content = f.read()
 
             # Validate against conventions
             violations = validate_against_conventions(
                 content,
                 conventions,
-                get_doc_relative_path(md_file, docs_path, project_path)
+                doc_relative_path(md_file, docs_path, project_path)
             )
 
             # Convert violations to issue format
@@ -56,7 +66,7 @@ def validate_conventions(
                 issues.append({
                     "type": "convention",
                     "severity": violation.get("severity", "warning"),
-                    "file": violation.get("file", get_doc_relative_path(md_file, docs_path, project_path)),
+                    "file": violation.get("file", doc_relative_path(md_file, docs_path, project_path)),
                     "line": violation.get("line"),
                     "rule": violation.get("rule"),
                     "message": violation.get("message")
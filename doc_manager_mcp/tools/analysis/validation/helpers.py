@@ -1,20 +1,43 @@
 """Helper functions for validation.py to prevent file bloat."""
 
+import hashlib
+import threading
 from pathlib import Path
 from typing import Any
 
 from doc_manager_mcp.constants import CLASS_EXCLUDES, CLASS_PATTERN, FUNCTION_PATTERN
 from doc_manager_mcp.core import get_doc_relative_path
+from doc_manager_mcp.core.markdown_cache import MarkdownCache
 from doc_manager_mcp.indexing.analysis.code_validator import CodeValidator
 from doc_manager_mcp.indexing.analysis.tree_sitter import Symbol, SymbolIndexer
 from doc_manager_mcp.indexing.parsers.markdown import MarkdownParser
 
+# Code example issues keyed by the doc's location and a BLAKE2b digest of its
+# content. Unchanged docs are re-validated on every validate_docs run; a hit
+# skips block extraction and TreeSitter parsing for the whole file.
+_CODE_EXAMPLE_CACHE: dict[tuple[bytes, str, str, str], tuple[dict[str, Any], ...]] = {}
+_CODE_EXAMPLE_CACHE_MAX = 4096
+_CODE_EXAMPLE_CACHE_LOCK = threading.Lock()
+
+# One CodeValidator per thread: its TreeSitter parsers must not be shared
+# across threads, and building one per doc file repeats the parser setup.
+_THREAD_VALIDATORS = threading.local()
+
+
+def _get_code_validator() -> CodeValidator:
+    """Get this thread's CodeValidator, creating it on first use."""
+    validator = getattr(_THREAD_VALIDATORS, "validator", None)
+    if validator is None:
+        validator = _THREAD_VALIDATORS.validator = CodeValidator()
+    return validator
+
 
 def validate_code_examples(
     content: str,
     file_path: Path,
     project_path: Path,
-    docs_path: Path
+    docs_path: Path,
+    markdown_cache: MarkdownCache | None = None
 ) -> list[dict[str, Any]]:
     """Validate code examples for semantic correctness.
 
@@ -25,16 +48,55 @@ def validate_code_examples(
         file_path: Path to markdown file
         project_path: Project root
         docs_path: Documentation directory path
+        markdown_cache: Optional markdown cache; reuses its fenced blocks instead of re-tokenizing
 
     Returns:
         List of issues found in code examples
     """
+    # Fenced blocks open with ``` or ~~~; skip parsing files with neither
+    if '```' not in content and '~~~' not in content:
+        return []
+
+    cache_key = (
+        hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest(),
+        str(file_path), str(project_path), str(docs_path)
+    )
+    cached = _CODE_EXAMPLE_CACHE.get(cache_key)
+    if cached is None:
+        cached = tuple(_find_code_example_issues(
+            content, file_path, project_path, docs_path, markdown_cache
+        ))
+        with _CODE_EXAMPLE_CACHE_LOCK:
+            if len(_CODE_EXAMPLE_CACHE) >= _CODE_EXAMPLE_CACHE_MAX:
+                # Evict the oldest entry (dicts preserve insertion order)
+                del _CODE_EXAMPLE_CACHE[next(iter(_CODE_EXAMPLE_CACHE))]
+            _CODE_EXAMPLE_CACHE[cache_key] = cached
+
+    # Hand out copies so callers can't alter the cached issues
+    return [dict(issue) for issue in cached]
+
+
+def _find_code_example_issues(
+    content: str,
+    file_path: Path,
+    project_path: Path,
+    docs_path: Path,
+    markdown_cache: MarkdownCache | None
+) -> list[dict[str, Any]]:
+    """Run the uncached syntax checks behind validate_code_examples."""
     issues = []
-    parser = MarkdownParser()
-    validator = CodeValidator()
 
-    # Extract code blocks from markdown
-    code_blocks = parser.extract_code_blocks(content)
+    # Extract code blocks from markdown (the cache shares one tokenization per file)
+    if markdown_cache is not None:
+        code_blocks = markdown_cache.parse(file_path, content).code_blocks
+    else:
+        code_blocks = MarkdownParser().extract_code_blocks(content)
+
+    if not code_blocks:
+        return issues
+
+    validator = _get_code_validator()
+    doc_file = None  # Resolved on the first issue, then reused for the rest
 
     for block in code_blocks:
         # Skip code blocks without language tags
@@ -55,11 +117,13 @@ def validate_code_examples(
 
         # Report syntax errors
         if not result["valid"] and result["errors"]:
+            if doc_file is None:
+                doc_file = get_doc_relative_path(file_path, docs_path, project_path)
             for error in result["errors"]:
                 issues.append({
                     "type": "code_syntax_error",
                     "severity": "warning",
-                    "file": get_doc_relative_path(file_path, docs_path, project_path),
+                    "file": doc_file,
                     "line": block["line"] + error["line"] - 1,  # Adjust line number
                     "message": f"{language}: {error['message']} at line {error['line']}, column {error['column']}",
                     "language": block["language"],
@@ -74,7 +138,8 @@ def validate_documented_symbols(
     file_path: Path,
     project_path: Path,
     symbol_index: dict[str, list[Symbol]] | None = None,
-    docs_path: Path | None = None
+    docs_path: Path | None = None,
+    markdown_cache: MarkdownCache | None = None
 ) -> list[dict[str, Any]]:
     """Validate that documented symbols exist in codebase.
 
@@ -86,12 +151,17 @@ def validate_documented_symbols(
         project_path: Project root
         symbol_index: Pre-built symbol index (from SymbolIndexer) or None to build
         docs_path: Documentation directory path (for relative path computation)
+        markdown_cache: Optional markdown cache; reuses its inline code spans instead of re-tokenizing
 
     Returns:
         List of issues for documented symbols that don't exist
     """
     issues = []
 
+    # Symbols are only referenced in inline code; without a backtick there is nothing to check
+    if '`' not in content:
+        return issues
+
     # Build symbol index if not provided
     indexer = None
     if symbol_index is None:
@@ -103,25 +173,29 @@ def validate_documented_symbols(
             # TreeSitter not available or indexing failed
             return []
 
-    # Extract inline code references using MarkdownParser
-    parser = MarkdownParser()
-    inline_codes = parser.extract_inline_code(content)
+    # Extract inline code references (the cache shares one tokenization per file)
+    if markdown_cache is not None:
+        inline_codes = markdown_cache.parse(file_path, content).inline_code
+    else:
+        inline_codes = MarkdownParser().extract_inline_code(content)
+    file_str = None  # Resolved on the first issue, then reused for the rest
 
     for code_span in inline_codes:
         code_text = code_span["text"]
         line = code_span["line"]
 
-        # Check if it's a function reference
-        if match := FUNCTION_PATTERN.match(code_text):
-            # Extract function name (without parentheses and namespace)
-            func_name = code_text.replace('()', '').split('.')[-1]
+        # Check if it's a function reference (only spans ending in "()" can match)
+        if code_text.endswith('()') and (match := FUNCTION_PATTERN.match(code_text)):
+            # Function name without parentheses and namespace (the pattern's last group)
+            func_name = match.group(3)
 
             # Look up in symbol index
-            symbols = symbol_index.get(func_name, [])
+            symbols = symbol_index.get(func_name)
 
             if not symbols:
                 # Use get_doc_relative_path if docs_path provided, otherwise fall back
-                file_str = get_doc_relative_path(file_path, docs_path, project_path) if docs_path else str(file_path.relative_to(project_path))
+                if file_str is None:
+                    file_str = get_doc_relative_path(file_path, docs_path, project_path) if docs_path else str(file_path.relative_to(project_path))
                 issues.append({
                     "type": "missing_symbol",
                     "severity": "warning",
@@ -132,8 +206,8 @@ def validate_documented_symbols(
                     "symbol_type": "function"
                 })
 
-        # Check if it's a class reference
-        elif match := CLASS_PATTERN.match(code_text):
+        # Check if it's a class reference (only spans starting uppercase can match)
+        elif code_text[:1].isupper() and (match := CLASS_PATTERN.match(code_text)):
             class_name = match.group(1)
 
             # Exclude common acronyms and short words
@@ -141,11 +215,12 @@ def validate_documented_symbols(
                 continue
 
             # Look up in symbol index
-            symbols = symbol_index.get(class_name, [])
+            symbols = symbol_index.get(class_name)
 
             if not symbols:
                 # Use get_doc_relative_path if docs_path provided, otherwise fall back
-                file_str = get_doc_relative_path(file_path, docs_path, project_path) if docs_path else str(file_path.relative_to(project_path))
+                if file_str is None:
+                    file_str = get_doc_relative_path(file_path, docs_path, project_path) if docs_path else str(file_path.relative_to(project_path))
                 issues.append({
                     "type": "missing_symbol",
                     "severity": "warning",
@@ -2,6 +2,7 @@
 
 import re
 import sys
+from functools import cache
 from pathlib import Path
 from typing import Any
 
@@ -14,6 +15,17 @@ from doc_manager_mcp.core.markdown_cache import MarkdownCache
 from doc_manager_mcp.indexing.link_index import build_link_index
 from doc_manager_mcp.indexing.parsers.markdown import MarkdownParser
 
+# Raw HTML links: <a href="url">
+_HTML_LINK_RE = re.compile(r'<a\s+[^>]*href=["\']([^"\']+)["\']')
+
+# Links that never point at a docs file:
+# - External schemes (web, mail, phone, inline data)
+# - Hugo shortcodes processed at build time: {{< relref "..." >}}, {{% ... %}}
+# - Anchor-only links (valid if they reference content in same file)
+_SKIPPED_LINK_PREFIXES = (
+    'http://', 'https://', 'mailto:', 'ftp://', 'tel:', 'data:', '{{<', '{{%', '#'
+)
+
 
 def extract_links(
     content: str,
@@ -23,8 +35,13 @@ def extract_links(
     """Extract all links from markdown content."""
     links = []
 
+    # Every link form needs '[' (inline/reference) or '<' (autolink/raw HTML);
+    # files with neither skip markdown parsing entirely
+    if '[' not in content and '<' not in content:
+        return links
+
     # Extract markdown links using cache or parser
-    if markdown_cache:
+    if markdown_cache is not None:
         parsed = markdown_cache.parse(file_path, content)
         md_links = parsed.links
     else:
@@ -40,10 +57,16 @@ def extract_links(
         })
 
     # HTML links: <a href="url"> (fallback for raw HTML)
-    html_link_pattern = r'<a\s+[^>]*href=["\']([^"\']+)["\']'
-    for match in re.finditer(html_link_pattern, content):
+    # Most docs have no raw HTML links; a substring test skips the regex scan for them
+    if '<a' not in content:
+        return links
+
+    # Matches arrive in order, so line numbers only count newlines since the last match
+    line_num, scanned_to = 1, 0
+    for match in _HTML_LINK_RE.finditer(content):
         link_url = match.group(1)
-        line_num = content[:match.start()].count('\n') + 1
+        line_num += content.count('\n', scanned_to, match.start())
+        scanned_to = match.start()
         links.append({
             "text": "HTML link",
             "url": link_url,
@@ -71,17 +94,8 @@ def check_internal_link(
     Returns:
         Error message if link is broken, None if valid
     """
-    # Skip external links and anchors
-    if link_url.startswith(('http://', 'https://', 'mailto:', 'ftp://')):
-        return None
-
-    # Skip Hugo shortcodes - these are processed at build time
-    # Common patterns: {{< relref "..." >}}, {{< ref "..." >}}, {{< ... >}}
-    if link_url.startswith(('{{<', '{{%')):
-        return None
-
-    # Handle anchor-only links (valid if they reference content in same file)
-    if link_url.startswith('#'):
+    # Skip external links, Hugo shortcodes and same-file anchors in one prefix check
+    if link_url.startswith(_SKIPPED_LINK_PREFIXES):
         return None
 
     # Remove anchor from URL
@@ -170,21 +184,35 @@ def check_broken_links(
     # Build link index once for O(1) lookups instead of O(M) file system checks
     link_index = build_link_index(docs_path)
 
+    # get_doc_relative_path resolve()s paths; memoize so each file is resolved at most once
+    doc_relative_path = cache(get_doc_relative_path)
+
     for md_file in markdown_files:
         try:
-            with open(md_file, encoding='utf-8') as f:
-                content = f.read()
+            if markdown_cache is not None:
+                content = markdown_cache.read(md_file)
+            else:
+                with open(md_file, encoding='utf-8') as f:
+                    content = f.read()
 
             links = extract_links(content, md_file, markdown_cache)
 
+            # Repeated targets in one file resolve identically; check each once
+            # but still report every occurrence with its own line
+            link_errors: dict[str, str | None] = {}
+
             for link in links:
                 # Check internal links only using link index
-                error = check_internal_link(link['url'], md_file, docs_path, link_index)
+                if link['url'] in link_errors:
+                    error = link_errors[link['url']]
+                else:
+                    error = check_internal_link(link['url'], md_file, docs_path, link_index)
+                    link_errors[link['url']] = error
                 if error:
                     issues.append({
                         "type": "broken_link",
                         "severity": "error",
-                        "file": get_doc_relative_path(md_file, docs_path, project_path),
+                        "file": doc_relative_path(md_file, docs_path, project_path),
                         "line": link['line'],
                         "message": error,
                         "link_text": link['text'],
@@ -195,7 +223,7 @@ def check_broken_links(
             issues.append({
                 "type": "read_error",
                 "severity": "error",
-                "file": get_doc_relative_path(md_file, docs_path, project_path),
+                "file": doc_relative_path(md_file, docs_path, project_path),
                 "line": 1,
                 "message": f"Failed to read file: {e!s}"
             })
@@ -1,5 +1,6 @@
 """Code snippet validation for documentation."""
 
+from functools import cache
 from pathlib import Path
 from typing import Any
 
@@ -20,8 +21,12 @@ def extract_code_blocks(
     """Extract code blocks from markdown content."""
     code_blocks = []
 
+    # Fenced blocks open with ``` or ~~~; skip parsing files with neither
+    if '```' not in content and '~~~' not in content:
+        return code_blocks
+
     # Extract fenced code blocks using cache or parser
-    if markdown_cache:
+    if markdown_cache is not None:
         parsed = markdown_cache.parse(file_path, content)
         blocks = parsed.code_blocks
     else:
@@ -85,10 +90,16 @@ def validate_code_snippets(
         elif normalized_primary == 'golang':
             normalized_primary = 'go'
 
+    # get_doc_relative_path resolve()s paths; memoize so each file is resolved at most once
+    doc_relative_path = cache(get_doc_relative_path)
+
     for md_file in markdown_files:
         try:
-            with open(md_file, encoding='utf-8') as f:
-                content = f.read()
+            if markdown_cache is not None:
+                content = markdown_cache.read(md_file)
+            else:
+                with open(md_file, encoding='utf-8') as f:
+                    content = f.read()
 
             code_blocks = extract_code_blocks(content, md_file, markdown_cache)
 
@@ -115,7 +126,7 @@ def validate_code_snippets(
                         issues.append({
                             "type": "syntax_error",
                             "severity": severity,
-                            "file": get_doc_relative_path(md_file, docs_path, project_path),
+                            "file": doc_relative_path(md_file, docs_path, project_path),
                             "line": block['line'] + error['line'] - 1,  # Adjust line number
                             "message": f"{error['message']} at line {error['line']}, column {error['column']}",
                             "language": block['language'],
@@ -126,7 +137,7 @@ def validate_code_snippets(
             issues.append({
                 "type": "read_error",
                 "severity": "error",
-                "file": get_doc_relative_path(md_file, docs_path, project_path),
+                "file": doc_relative_path(md_file, docs_path, project_path),
                 "line": 1,
                 "message": f"Failed to read file: {e!s}"
             })
@@ -8,6 +8,7 @@ from doc_manager_mcp.core import (
     find_markdown_files,
     get_doc_relative_path,
 )
+from doc_manager_mcp.core.markdown_cache import MarkdownCache
 from doc_manager_mcp.indexing.analysis.tree_sitter import SymbolIndexer
 
 from .helpers import validate_documented_symbols
@@ -18,7 +19,8 @@ def validate_symbols(
     project_path: Path,
     include_root_readme: bool = False,
     symbol_index=None,
-    markdown_files: list[Path] | None = None
+    markdown_files: list[Path] | None = None,
+    markdown_cache: MarkdownCache | None = None
 ) -> list[dict[str, Any]]:
     """Validate that documented symbols exist in codebase."""
     issues = []
@@ -43,11 +45,14 @@ def validate_symbols(
 
     for md_file in markdown_files:
         try:
-            with open(md_file, encoding='utf-8') as f:
-                content = f.read()
+            if markdown_cache is not None:
+                content = markdown_cache.read(md_file)
+            else:
+                with open(md_file, encoding='utf-8') as f:
+                    content = f.read()
 
             # Use validation_helpers function
-            file_issues = validate_documented_symbols(content, md_file, project_path, symbol_index, docs_path)
+            file_issues = validate_documented_symbols(content, md_file, project_path, symbol_index, docs_path, markdown_cache)
             issues.extend(file_issues)
 
         except Exception as e:
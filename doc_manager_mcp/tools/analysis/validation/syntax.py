@@ -7,6 +7,7 @@ from doc_manager_mcp.core import (
     find_markdown_files,
     get_doc_relative_path,
 )
+from doc_manager_mcp.core.markdown_cache import MarkdownCache
 
 from .helpers import validate_code_examples
 
@@ -15,7 +16,8 @@ def validate_code_syntax(
     docs_path: Path,
     project_path: Path,
     include_root_readme: bool = False,
-    markdown_files: list[Path] | None = None
+    markdown_files: list[Path] | None = None,
+    markdown_cache: MarkdownCache | None = None
 ) -> list[dict[str, Any]]:
     """Validate code example syntax using TreeSitter (semantic validation)."""
     issues = []
@@ -29,11 +31,14 @@ def validate_code_syntax(
 
     for md_file in markdown_files:
         try:
-            with open(md_file, encoding='utf-8') as f:
-                content = f.read()
+            if markdown_cache is not None:
+                content = markdown_cache.read(md_file)
+            else:
+                with open(md_file, encoding='utf-8') as f:
+                    content = f.read()
 
             # Use validation_helpers function
-            file_issues = validate_code_examples(content, md_file, project_path, docs_path)
+            file_issues = validate_code_examples(content, md_file, project_path, docs_path, markdown_cache)
             issues.extend(file_issues)
 
         except Exception as e:
@@ -52,7 +52,7 @@ async def docmgr_init(params: DocmgrInitInput, ctx=None) -> dict[str, Any]:
             if ctx:
                 await ctx.info("Step 1/3: Initializing configuration...")
 
-            config_result = await initialize_config(InitializeConfigInput(
+            config_result = await initialize_config(InitializeConfigInput.model_construct(
                 project_path=str(project_path),
                 platform=params.platform,
                 exclude_patterns=params.exclude_patterns,
@@ -66,7 +66,7 @@ async def docmgr_init(params: DocmgrInitInput, ctx=None) -> dict[str, Any]:
                 await ctx.info("Step 2/3: Initializing memory system...")
 
             memory_result = await initialize_memory(
-                InitializeMemoryInput(project_path=str(project_path)),
+                InitializeMemoryInput.model_construct(project_path=str(project_path)),
                 ctx
             )
 
@@ -78,7 +78,7 @@ async def docmgr_init(params: DocmgrInitInput, ctx=None) -> dict[str, Any]:
             if ctx:
                 await ctx.info("Step 3/3: Tracking dependencies...")
 
-            deps_result = await track_dependencies(TrackDependenciesInput(
+            deps_result = await track_dependencies(TrackDependenciesInput.model_construct(
                 project_path=str(project_path),
                 docs_path=params.docs_path
             ))
@@ -109,7 +109,7 @@ async def docmgr_init(params: DocmgrInitInput, ctx=None) -> dict[str, Any]:
             if ctx:
                 await ctx.info("Bootstrapping fresh documentation...")
 
-            bootstrap_result = await bootstrap(BootstrapInput(
+            bootstrap_result = await bootstrap(BootstrapInput.model_construct(
                 project_path=str(project_path),
                 platform=params.platform,
                 docs_path=params.docs_path or "docs"
@@ -119,7 +119,7 @@ async def docmgr_init(params: DocmgrInitInput, ctx=None) -> dict[str, Any]:
             if ctx:
                 await ctx.info("Tracking dependencies...")
 
-            deps_result = await track_dependencies(TrackDependenciesInput(
+            deps_result = await track_dependencies(TrackDependenciesInput.model_construct(
                 project_path=str(project_path),
                 docs_path=params.docs_path or "docs"
             ))
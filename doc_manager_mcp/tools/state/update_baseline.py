@@ -1,9 +1,10 @@
 """Comprehensive baseline update tool (T009)."""
 
+import asyncio
 from pathlib import Path
 from typing import Any
 
-from doc_manager_mcp.core import enforce_response_limit, handle_error
+from doc_manager_mcp.core import enforce_response_limit, handle_error, write_json_file
 from doc_manager_mcp.core.security import file_lock
 from doc_manager_mcp.models import DocmgrUpdateBaselineInput
 
@@ -99,28 +100,36 @@ async def docmgr_update_baseline(
         return enforce_response_limit(error_dict)
 
 
-def _calculate_file_checksums(project_path: Path) -> tuple[dict[str, str], int]:
+def _calculate_file_checksums(
+    project_path: Path,
+) -> tuple[dict[str, str], dict[str, list[int]], int, int]:
     """Calculate checksums for all project files.
 
+    Files whose stat fingerprint matches the current baseline keep their
+    recorded checksum instead of being rehashed.
+
     Args:
         project_path: Project root path
 
     Returns:
-        Tuple of (checksums dict, file count)
+        Tuple of (checksums dict, file stats dict, scan time in ns, file count)
     """
     from doc_manager_mcp.constants import MAX_FILES
-    from doc_manager_mcp.core import calculate_checksum
+    from doc_manager_mcp.core import calculate_checksums_incremental, get_checksum_workers
     from doc_manager_mcp.core.file_scanner import scan_project_files
+    from doc_manager_mcp.tools._internal.baselines import load_repo_baseline
 
-    checksums = {}
-    file_count = 0
-
-    for file_path in scan_project_files(project_path, max_files=MAX_FILES, use_walk=True):
-        relative_path = str(file_path.relative_to(project_path)).replace('\\', '/')
-        checksums[relative_path] = calculate_checksum(file_path)
-        file_count += 1
+    file_paths = list(scan_project_files(project_path, max_files=MAX_FILES, use_walk=True))
+    relative_paths = [
+        str(file_path.relative_to(project_path)).replace('\\', '/') for file_path in file_paths
+    ]
+    prior_baseline = load_repo_baseline(project_path, validate=False, check_version=False)
+    file_checksums, file_stats, file_stats_time_ns = calculate_checksums_incremental(
+        file_paths, relative_paths, prior_baseline, get_checksum_workers(project_path)
+    )
+    checksums = dict(zip(relative_paths, file_checksums, strict=True))
 
-    return checksums, file_count
+    return checksums, file_stats, file_stats_time_ns, len(file_paths)
 
 
 async def _get_git_metadata(project_path: Path) -> dict[str, str | None]:
@@ -132,10 +141,9 @@ async def _get_git_metadata(project_path: Path) -> dict[str, str | None]:
     Returns:
         Dict with git_commit and git_branch
     """
-    from doc_manager_mcp.core import run_git_command
+    from doc_manager_mcp.core import get_git_head_info
 
-    git_commit = await run_git_command(project_path, "rev-parse", "HEAD")
-    git_branch = await run_git_command(project_path, "rev-parse", "--abbrev-ref", "HEAD")
+    git_commit, git_branch = await get_git_head_info(project_path)
 
     return {
         "git_commit": git_commit,
@@ -146,6 +154,8 @@ async def _get_git_metadata(project_path: Path) -> dict[str, str | None]:
 def _build_baseline_structure(
     project_path: Path,
     checksums: dict[str, str],
+    file_stats: dict[str, list[int]],
+    file_stats_time_ns: int,
     file_count: int,
     git_metadata: dict[str, str | None]
 ) -> dict[str, Any]:
@@ -154,6 +164,8 @@ def _build_baseline_structure(
     Args:
         project_path: Project root path
         checksums: File checksums dict
+        file_stats: File [size, mtime_ns, ctime_ns, inode] fingerprints dict
+        file_stats_time_ns: When the fingerprints were taken (ns since epoch)
         file_count: Number of files tracked
         git_metadata: Git commit and branch info
 
@@ -162,11 +174,12 @@ def _build_baseline_structure(
     """
     from datetime import datetime
 
-    from doc_manager_mcp.core import detect_project_language, find_docs_directory
+    from doc_manager_mcp.core import probe_project
     from doc_manager_mcp.schemas.metadata import get_json_meta
 
-    language = detect_project_language(project_path)
-    docs_dir = find_docs_directory(project_path)
+    probe = probe_project(project_path)
+    language = probe.language
+    docs_dir = probe.docs_dir
 
     return {
         "_meta": get_json_meta(),
@@ -179,7 +192,9 @@ def _build_baseline_structure(
         "timestamp": datetime.now().isoformat(),
         "version": "1.0.0",
         "file_count": file_count,
-        "files": checksums
+        "files": checksums,
+        "file_stats": file_stats,
+        "file_stats_time_ns": file_stats_time_ns
     }
 
 
@@ -190,10 +205,8 @@ def _write_baseline_safely(baseline_path: Path, baseline: dict[str, Any]) -> Non
         baseline_path: Path to baseline file
         baseline: Baseline data structure
     """
-    import json
-
     with file_lock(baseline_path, timeout=10, retries=3):
-        baseline_path.write_text(json.dumps(baseline, indent=2))
+        write_json_file(baseline_path, baseline)
 
 
 async def _update_repo_baseline(project_path: Path) -> dict[str, Any]:
@@ -207,7 +220,9 @@ async def _update_repo_baseline(project_path: Path) -> dict[str, Any]:
     """
     try:
         # Calculate file checksums
-        checksums, file_count = _calculate_file_checksums(project_path)
+        checksums, file_stats, file_stats_time_ns, file_count = await asyncio.to_thread(
+            _calculate_file_checksums, project_path
+        )
 
         # Get git metadata
         git_metadata = await _get_git_metadata(project_path)
@@ -216,6 +231,8 @@ async def _update_repo_baseline(project_path: Path) -> dict[str, Any]:
         baseline = _build_baseline_structure(
             project_path,
             checksums,
+            file_stats,
+            file_stats_time_ns,
             file_count,
             git_metadata
         )
@@ -287,7 +304,7 @@ async def _update_dependencies(
         from doc_manager_mcp.tools._internal import track_dependencies
 
         # Reuse existing track_dependencies function
-        result = await track_dependencies(TrackDependenciesInput(
+        result = await track_dependencies(TrackDependenciesInput.model_construct(
             project_path=str(project_path),
             docs_path=docs_path
         ))
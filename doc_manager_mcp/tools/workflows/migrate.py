@@ -93,7 +93,7 @@ async def migrate(params: MigrateInput) -> str | dict[str, Any]:
         lines.append("")
 
         from ...models import AssessQualityInput
-        quality_result = await assess_quality(AssessQualityInput(
+        quality_result = await assess_quality(AssessQualityInput.model_construct(
             project_path=str(project_path),
             docs_path=params.source_path
         ))
@@ -109,7 +109,7 @@ async def migrate(params: MigrateInput) -> str | dict[str, Any]:
         lines.append("")
 
         from ...models import DetectPlatformInput
-        platform_result = await detect_platform(DetectPlatformInput(
+        platform_result = await detect_platform(DetectPlatformInput.model_construct(
             project_path=str(project_path)
         ))
 
@@ -149,8 +149,9 @@ async def migrate(params: MigrateInput) -> str | dict[str, Any]:
             # Process files based on git usage
             if use_git:
                 # Sequential processing (git mv must be sequential)
-                from .migrate_helpers import process_single_file
+                from .migrate_helpers import process_single_file, stage_git_renames
 
+                results = []
                 for old_file in files_to_process:
                     result = process_single_file(
                         old_file,
@@ -162,17 +163,29 @@ async def migrate(params: MigrateInput) -> str | dict[str, Any]:
                         use_git=use_git,
                         dry_run=params.dry_run
                     )
+                    results.append(result)
+
+                # Stage all markdown renames with batched git add / git rm
+                failed_stages = stage_git_renames(
+                    [(r["old_file"], r["new_file"]) for r in results if r["git_stage_pending"]],
+                    project_path
+                )
 
+                for result in results:
                     # Accumulate results
                     if result["links_rewritten"]:
                         links_rewritten += 1
                     if result["toc_generated"]:
                         tocs_generated += 1
 
+                    method = result["method"]
+                    if result["old_file"] in failed_stages:
+                        method = "copy"
+
                     moved_files.append({
                         "old": str(result["old_file"].relative_to(project_path)),
                         "new": str(result["new_file"].relative_to(project_path)),
-                        "method": result["method"]
+                        "method": method
                     })
             else:
                 # Parallel processing (3-4x faster for large migrations)
@@ -228,7 +241,7 @@ async def migrate(params: MigrateInput) -> str | dict[str, Any]:
 
             # Scan for broken links in new structure
             from ...models import ValidateDocsInput
-            validation_result = await validate_docs(ValidateDocsInput(
+            validation_result = await validate_docs(ValidateDocsInput.model_construct(
                 project_path=str(project_path),
                 docs_path=params.target_path,
                 check_links=True,
@@ -254,7 +267,7 @@ async def migrate(params: MigrateInput) -> str | dict[str, Any]:
             lines.append("## Step 5: Post-Migration Quality Assessment")
             lines.append("")
 
-            new_quality_result = await assess_quality(AssessQualityInput(
+            new_quality_result = await assess_quality(AssessQualityInput.model_construct(
                 project_path=str(project_path),
                 docs_path=params.target_path
             ))
@@ -1,10 +1,12 @@
 """Helper functions for documentation migration."""
 
+import os
 import shutil
 import subprocess
 from pathlib import Path
-from typing import TypedDict
+from typing import Any, TypedDict
 
+from doc_manager_mcp.indexing.parsers.markdown import MarkdownParser
 from doc_manager_mcp.indexing.transforms.links import (
     compute_link_mappings,
     extract_frontmatter,
@@ -14,12 +16,16 @@ from doc_manager_mcp.indexing.transforms.links import (
     update_or_insert_toc,
 )
 
+# Maximum paths per batched git invocation (keeps argv well under ARG_MAX)
+GIT_BATCH_SIZE = 1000
+
 
 class TransformResult(TypedDict):
     """Result from transforming a markdown file."""
     method: str
     links_rewritten: bool
     toc_generated: bool
+    git_stage_pending: bool
 
 
 class ProcessResult(TypedDict):
@@ -29,6 +35,7 @@ class ProcessResult(TypedDict):
     method: str
     links_rewritten: bool
     toc_generated: bool
+    git_stage_pending: bool
 
 
 def rewrite_links(
@@ -36,7 +43,8 @@ def rewrite_links(
     new_file: Path,
     existing_docs: Path,
     new_docs: Path,
-    project_path: Path
+    project_path: Path,
+    tokens: list[Any] | None = None
 ) -> tuple[str, bool]:
     """Rewrite links in markdown content.
 
@@ -46,37 +54,51 @@ def rewrite_links(
         existing_docs: Old documentation directory
         new_docs: New documentation directory
         project_path: Project root path
+        tokens: Pre-parsed markdown tokens for body (parsed if None)
 
     Returns:
         Tuple of (updated body, links_were_rewritten)
     """
+    parser = MarkdownParser()
+    if tokens is None:
+        tokens = parser.parse(body)
+
     link_mappings = compute_link_mappings(
         body,
         new_file,
         existing_docs,
         new_docs,
-        project_path
+        project_path,
+        links=parser.extract_links(body, tokens)
     )
 
     if link_mappings:
-        body = rewrite_links_in_content(body, link_mappings)
+        body = rewrite_links_in_content(
+            body, link_mappings, code_blocks=parser.extract_code_blocks(body, tokens)
+        )
         return body, True
 
     return body, False
 
 
-def add_toc(body: str, has_toc_marker: bool) -> tuple[str, bool]:
+def add_toc(
+    body: str,
+    has_toc_marker: bool,
+    tokens: list[Any] | None = None
+) -> tuple[str, bool]:
     """Add or regenerate table of contents.
 
     Args:
         body: Markdown content (without frontmatter)
         has_toc_marker: Whether content has <!-- TOC --> marker
+        tokens: Pre-parsed markdown tokens for body (parsed if None)
 
     Returns:
         Tuple of (updated body, toc_was_generated)
     """
     if has_toc_marker:
-        toc = generate_toc(body, max_depth=3)
+        headers = MarkdownParser().extract_headers(body, tokens)
+        toc = generate_toc(body, max_depth=3, headers=headers)
         body = update_or_insert_toc(body, toc)
         return body, True
 
@@ -109,75 +131,152 @@ def process_markdown_file(
         dry_run: Whether this is a dry run
 
     Returns:
-        Dict with keys: method (str), links_rewritten (bool), toc_generated (bool)
+        Dict with keys: method (str), links_rewritten (bool), toc_generated (bool),
+        git_stage_pending (bool). When git_stage_pending is True the caller must
+        stage the rename with stage_git_renames().
     """
-    content = old_file.read_text(encoding='utf-8')
-
-    # Extract frontmatter
-    frontmatter_dict, body = extract_frontmatter(content)
-
     # Track changes
     links_rewritten = False
     toc_generated = False
-
-    # Rewrite links if enabled
-    if rewrite_links_enabled:
-        body, links_rewritten = rewrite_links(
-            body,
-            new_file,
-            existing_docs,
-            new_docs,
-            project_path
-        )
-
-    # Regenerate TOC if enabled
-    if regenerate_toc:
-        has_toc_marker = '<!-- TOC -->' in content
-        body, toc_generated = add_toc(body, has_toc_marker)
-
-    # Reconstruct with frontmatter
-    if frontmatter_dict:
-        final_content = preserve_frontmatter(frontmatter_dict, body)
-    else:
-        final_content = body
+    final_content = None
+
+    # Only decode and re-render the file when a transformation is requested;
+    # otherwise it is copied byte-for-byte below
+    if rewrite_links_enabled or regenerate_toc:
+        content = old_file.read_text(encoding='utf-8')
+
+        # Extract frontmatter
+        frontmatter_dict, body = extract_frontmatter(content)
+
+        # Tokenize the body once; links, code blocks and headers all come
+        # from this token stream instead of separate markdown-it parses
+        has_toc_marker = regenerate_toc and '<!-- TOC -->' in content
+        tokens = None
+        if rewrite_links_enabled or has_toc_marker:
+            tokens = MarkdownParser().parse(body)
+
+        # Rewrite links if enabled
+        if rewrite_links_enabled:
+            body, links_rewritten = rewrite_links(
+                body,
+                new_file,
+                existing_docs,
+                new_docs,
+                project_path,
+                tokens=tokens
+            )
+            if links_rewritten:
+                # Body changed; headers must come from the rewritten text
+                tokens = None
+
+        # Regenerate TOC if enabled
+        if regenerate_toc:
+            body, toc_generated = add_toc(body, has_toc_marker, tokens=tokens)
+
+        # Reconstruct with frontmatter
+        if frontmatter_dict:
+            final_content = preserve_frontmatter(frontmatter_dict, body)
+        else:
+            final_content = body
 
     # Write file if not dry run
     method = "preview"  # Default for dry run
     if not dry_run:
-        new_file.write_text(final_content, encoding='utf-8')
-
-        # For markdown files with transformations, use git rm + git add
-        # (Git will detect this as a rename with modifications)
-        if use_git:
-            try:
-                # Stage new file
-                subprocess.run(  # noqa: S603
-                    ['git', 'add', str(new_file)],  # noqa: S607
-                    cwd=project_path,
-                    check=True,
-                    capture_output=True
-                )
-                # Remove old file from git
-                subprocess.run(  # noqa: S603
-                    ['git', 'rm', str(old_file)],  # noqa: S607
-                    cwd=project_path,
-                    check=True,
-                    capture_output=True
-                )
-                method = "git mv"
-            except subprocess.CalledProcessError:
-                # Git operations failed, but file is already copied
-                method = "copy"
+        if final_content is None:
+            shutil.copyfile(old_file, new_file)
         else:
-            method = "copy"
+            new_file.write_text(final_content, encoding='utf-8')
+
+        # For markdown files, git add + git rm lets git detect a rename with
+        # modifications. Staging is batched across files by stage_git_renames().
+        method = "git mv" if use_git else "copy"
+
+    git_stage_pending = use_git and not dry_run
 
     return {
         "method": method,
         "links_rewritten": links_rewritten,
-        "toc_generated": toc_generated
+        "toc_generated": toc_generated,
+        "git_stage_pending": git_stage_pending
     }
 
 
+def _run_git_batched(args: list[str], paths: list[Path], project_path: Path) -> None:
+    """Run a git command over paths in chunks of GIT_BATCH_SIZE.
+
+    Raises:
+        subprocess.CalledProcessError: If any chunk fails
+    """
+    for start in range(0, len(paths), GIT_BATCH_SIZE):
+        chunk = [str(p) for p in paths[start:start + GIT_BATCH_SIZE]]
+        subprocess.run(  # noqa: S603
+            ['git', *args, '--', *chunk],  # noqa: S607
+            cwd=project_path,
+            check=True,
+            capture_output=True
+        )
+
+
+def _tracked_paths(paths: list[Path], project_path: Path) -> set[Path] | None:
+    """Return which of paths are in the git index, or None if git can't tell."""
+    tracked: set[Path] = set()
+    for start in range(0, len(paths), GIT_BATCH_SIZE):
+        chunk = [str(p) for p in paths[start:start + GIT_BATCH_SIZE]]
+        try:
+            result = subprocess.run(  # noqa: S603
+                ['git', 'ls-files', '-z', '--', *chunk],  # noqa: S607
+                cwd=project_path,
+                check=True,
+                capture_output=True
+            )
+        except subprocess.CalledProcessError:
+            return None
+        tracked.update(
+            project_path / os.fsdecode(name) for name in result.stdout.split(b'\0') if name
+        )
+    return tracked
+
+
+def stage_git_renames(renames: list[tuple[Path, Path]], project_path: Path) -> set[Path]:
+    """Stage copied files as git renames (git add new + git rm old).
+
+    Runs one batched git add and one batched git rm for all renames instead of
+    two subprocesses per file. If a batch fails, falls back to staging each
+    rename individually so that one bad path only affects its own file.
+
+    Args:
+        renames: List of (old_file, new_file) pairs already copied on disk
+        project_path: Project root path (git working directory)
+
+    Returns:
+        Set of old_file paths whose git staging failed (left as plain copies)
+    """
+    if not renames:
+        return set()
+
+    try:
+        _run_git_batched(['add'], [new for _, new in renames], project_path)
+        _run_git_batched(['rm'], [old for old, _ in renames], project_path)
+        return set()
+    except subprocess.CalledProcessError:
+        pass
+
+    # Earlier chunks of the batch may already have succeeded; only retry git rm
+    # for old files that are still tracked
+    tracked = _tracked_paths([old for old, _ in renames], project_path)
+
+    failed: set[Path] = set()
+    for old_file, new_file in renames:
+        try:
+            _run_git_batched(['add'], [new_file], project_path)
+            if tracked is None or old_file in tracked or old_file.exists():
+                _run_git_batched(['rm'], [old_file], project_path)
+        except subprocess.CalledProcessError:
+            # Git operations failed, but file is already copied
+            failed.add(old_file)
+    return failed
+
+
 def process_single_file(
     old_file: Path,
     existing_docs: Path,
@@ -202,7 +301,8 @@ def process_single_file(
         dry_run: Whether this is a dry run
 
     Returns:
-        Dict with keys: old_file, new_file, method, links_rewritten, toc_generated
+        Dict with keys: old_file, new_file, method, links_rewritten, toc_generated,
+        git_stage_pending
     """
     relative_path = old_file.relative_to(existing_docs)
     new_file = new_docs / relative_path
@@ -227,11 +327,13 @@ def process_single_file(
         method = result["method"]
         links_rewritten = result["links_rewritten"]
         toc_generated = result["toc_generated"]
+        git_stage_pending = result["git_stage_pending"]
     else:
         # Non-markdown files: use git mv if preserving history, else copy
         method = "preview"
         links_rewritten = False
         toc_generated = False
+        git_stage_pending = False
 
         if not dry_run:
             if use_git:
@@ -257,5 +359,6 @@ def process_single_file(
         "new_file": new_file,
         "method": method,
         "links_rewritten": links_rewritten,
-        "toc_generated": toc_generated
+        "toc_generated": toc_generated,
+        "git_stage_pending": git_stage_pending
     }
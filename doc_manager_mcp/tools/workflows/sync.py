@@ -141,7 +141,7 @@ async def sync(params: SyncInput) -> dict[str, Any] | str:
 
         from doc_manager_mcp.constants import ChangeDetectionMode
         from doc_manager_mcp.models import DocmgrDetectChangesInput
-        changes_result = await docmgr_detect_changes(DocmgrDetectChangesInput(
+        changes_result = await docmgr_detect_changes(DocmgrDetectChangesInput.model_construct(
             project_path=str(project_path),
             mode=ChangeDetectionMode.CHECKSUM
         ))
@@ -183,13 +183,13 @@ async def sync(params: SyncInput) -> dict[str, Any] | str:
         # Step 3/4: Run validation and quality assessment in parallel
         if docs_path and docs_path.exists():
             # Create tasks for parallel execution
-            validation_task = validate_docs(ValidateDocsInput(
+            validation_task = validate_docs(ValidateDocsInput.model_construct(
                 project_path=str(project_path),
                 docs_path=str(docs_path.relative_to(project_path)),
                 include_root_readme=include_root_readme
             ))
 
-            quality_task = assess_quality(AssessQualityInput(
+            quality_task = assess_quality(AssessQualityInput.model_construct(
                 project_path=str(project_path),
                 docs_path=str(docs_path.relative_to(project_path)),
                 include_root_readme=include_root_readme
@@ -0,0 +1,32 @@
+"""Shared pytest fixtures."""
+
+import subprocess
+
+import pytest
+
+_GIT_IDENTITY = {
+    "GIT_AUTHOR_NAME": "Test User",
+    "GIT_AUTHOR_EMAIL": "test@example.com",
+    "GIT_COMMITTER_NAME": "Test User",
+    "GIT_COMMITTER_EMAIL": "test@example.com",
+}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def git_identity():
+    """Set a commit identity once per session instead of per-repo ``git config`` calls."""
+    with pytest.MonkeyPatch.context() as mp:
+        for name, value in _GIT_IDENTITY.items():
+            mp.setenv(name, value)
+        yield
+
+
+@pytest.fixture(scope="session")
+def git_project_template(tmp_path_factory, git_identity):
+    """A committed project with src/main.py, built once and copied into each test."""
+    project_path = tmp_path_factory.mktemp("git_project_template")
+    (project_path / "src").mkdir()
+    (project_path / "src" / "main.py").write_text("def hello(): pass\n")
+    for args in (["init"], ["add", "."], ["commit", "-m", "Initial commit"]):
+        subprocess.run(["git", *args], cwd=project_path, check=True, capture_output=True)  # noqa: S603, S607
+    return project_path
@@ -36,18 +36,6 @@ def project_with_git():
 
         # Initialize git
         subprocess.run(["git", "init"], cwd=project_path, check=True, capture_output=True)
-        subprocess.run(
-            ["git", "config", "user.email", "test@example.com"],
-            cwd=project_path,
-            check=True,
-            capture_output=True
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "Test User"],
-            cwd=project_path,
-            check=True,
-            capture_output=True
-        )
         subprocess.run(
             ["git", "add", "."],
             cwd=project_path,
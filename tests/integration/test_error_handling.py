@@ -1,5 +1,6 @@
 """Integration tests for error handling and propagation."""
 
+import shutil
 import tempfile
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
@@ -11,42 +12,14 @@ from doc_manager_mcp.tools.state.init import docmgr_init
 
 
 @pytest.fixture
-def temp_project():
+def temp_project(git_project_template):
     """Create a temporary project directory for testing."""
     with tempfile.TemporaryDirectory() as tmpdir:
         project_path = Path(tmpdir)
 
-        # Create minimal project structure
-        (project_path / "src").mkdir()
-        (project_path / "src" / "main.py").write_text("def hello(): pass\n")
-
-        # Initialize git repo (required for some operations)
-        import subprocess
-        subprocess.run(["git", "init"], cwd=project_path, check=True, capture_output=True)
-        subprocess.run(
-            ["git", "config", "user.email", "test@example.com"],
-            cwd=project_path,
-            check=True,
-            capture_output=True
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "Test User"],
-            cwd=project_path,
-            check=True,
-            capture_output=True
-        )
-        subprocess.run(
-            ["git", "add", "."],
-            cwd=project_path,
-            check=True,
-            capture_output=True
-        )
-        subprocess.run(
-            ["git", "commit", "-m", "Initial commit"],
-            cwd=project_path,
-            check=True,
-            capture_output=True
-        )
+        # Minimal committed git project (required for some operations), copied
+        # from a session template instead of re-running git init/add/commit
+        shutil.copytree(git_project_template, project_path, dirs_exist_ok=True)
 
         yield project_path
 
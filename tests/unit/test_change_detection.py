@@ -0,0 +1,45 @@
+"""Tests for checksum-based change detection."""
+
+import time
+from pathlib import Path
+
+from doc_manager_mcp.core import checksums as checksums_module
+from doc_manager_mcp.core.checksums import calculate_checksums_incremental
+from doc_manager_mcp.tools._internal.changes import _get_changed_files_from_checksums
+
+
+def _baseline_for(project_path: Path, relative_paths: list[str]) -> dict:
+    paths = [project_path / rel for rel in relative_paths]
+    checksums, file_stats, _ = calculate_checksums_incremental(paths, relative_paths, None)
+    return {
+        "files": dict(zip(relative_paths, checksums, strict=True)),
+        "file_stats": file_stats,
+        # As if the baseline was taken well after these files were written
+        "file_stats_time_ns": time.time_ns() + 2 * checksums_module._RACY_WINDOW_NS,
+    }
+
+
+def test_checksum_changes_reuse_baseline_fingerprints(tmp_path: Path):
+    """Unchanged files are trusted by fingerprint; edits, additions and deletions are found."""
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "same.py").write_text("x = 1\n")
+    (tmp_path / "src" / "edited.py").write_text("y = 1\n")
+    (tmp_path / "src" / "removed.py").write_text("z = 1\n")
+    baseline = _baseline_for(tmp_path, ["src/same.py", "src/edited.py", "src/removed.py"])
+
+    # A bogus recorded checksum is never compared when the fingerprint matches
+    baseline["files"]["src/same.py"] = "not-rehashed"
+    (tmp_path / "src" / "edited.py").write_text("y = 2  # edited\n")
+    (tmp_path / "src" / "removed.py").unlink()
+    (tmp_path / "src" / "added.py").write_text("w = 1\n")
+
+    changes = {
+        change["file"]: change["change_type"]
+        for change in _get_changed_files_from_checksums(tmp_path, baseline)
+    }
+
+    assert changes == {
+        "src/edited.py": "modified",
+        "src/added.py": "added",
+        "src/removed.py": "deleted",
+    }
@@ -0,0 +1,135 @@
+"""Tests for file checksum utilities."""
+
+import hashlib
+import os
+import time
+from pathlib import Path
+
+from doc_manager_mcp.core import checksums
+from doc_manager_mcp.core.checksums import (
+    _RACY_WINDOW_NS,
+    calculate_checksum,
+    calculate_checksums,
+    calculate_checksums_incremental,
+)
+
+
+def test_calculate_checksum_matches_sha256(tmp_path: Path):
+    """Checksums spanning several read blocks match a one-shot SHA-256."""
+    data = bytes(range(256)) * 10000
+    file_path = tmp_path / "data.bin"
+    file_path.write_bytes(data)
+
+    assert calculate_checksum(file_path) == hashlib.sha256(data).hexdigest()
+
+
+def test_calculate_checksum_small_file(tmp_path: Path):
+    """Files below one read block take the single-read path."""
+    file_path = tmp_path / "small.txt"
+    file_path.write_bytes(b"small file\n")
+
+    assert calculate_checksum(file_path) == hashlib.sha256(b"small file\n").hexdigest()
+
+
+def test_calculate_checksum_without_file_digest(tmp_path: Path, monkeypatch):
+    """The manual read loop (pre-3.11 fallback) produces the same checksum."""
+    data = bytes(range(256)) * 10000
+    file_path = tmp_path / "data.bin"
+    file_path.write_bytes(data)
+    monkeypatch.setattr(checksums, "_file_digest", None)
+
+    assert calculate_checksum(file_path) == hashlib.sha256(data).hexdigest()
+
+
+def test_calculate_checksum_retries_without_noatime(tmp_path: Path, monkeypatch):
+    """Files the caller doesn't own are reopened without O_NOATIME."""
+    file_path = tmp_path / "data.txt"
+    file_path.write_bytes(b"shared file\n")
+    monkeypatch.setattr(checksums, "_O_NOATIME", 0o1000000)
+    real_open = checksums.os.open
+
+    def fake_open(path, flags, *args):
+        if flags & 0o1000000:
+            raise PermissionError("EPERM")
+        return real_open(path, flags, *args)
+
+    monkeypatch.setattr(checksums.os, "open", fake_open)
+
+    assert calculate_checksum(file_path) == hashlib.sha256(b"shared file\n").hexdigest()
+
+
+def test_calculate_checksum_missing_file(tmp_path: Path):
+    """Unreadable files yield an empty checksum."""
+    assert calculate_checksum(tmp_path / "missing.txt") == ""
+
+
+def test_calculate_checksums_preserves_order(tmp_path: Path):
+    """Concurrent hashing returns checksums in input order."""
+    paths = []
+    for i in range(50):
+        path = tmp_path / f"file_{i}.txt"
+        path.write_text(f"content {i}\n")
+        paths.append(path)
+    paths.append(tmp_path / "missing.txt")
+
+    assert calculate_checksums(paths) == [calculate_checksum(path) for path in paths]
+
+
+def test_incremental_checksums_reuse_unchanged_files(tmp_path: Path):
+    """Files with a matching stat fingerprint keep their prior checksum."""
+    unchanged = tmp_path / "unchanged.txt"
+    changed = tmp_path / "changed.txt"
+    unchanged.write_text("same\n")
+    changed.write_text("before\n")
+    paths = [unchanged, changed]
+    rel_paths = ["unchanged.txt", "changed.txt"]
+
+    checksums, file_stats, _ = calculate_checksums_incremental(paths, rel_paths, None)
+    assert checksums == [calculate_checksum(path) for path in paths]
+
+    # A sentinel checksum proves the unchanged file was not rehashed
+    prior = {
+        "files": {"unchanged.txt": "sentinel", "changed.txt": checksums[1]},
+        "file_stats": file_stats,
+        # As if the baseline was taken well after these files were written
+        "file_stats_time_ns": time.time_ns() + 2 * _RACY_WINDOW_NS,
+    }
+    changed.write_text("after, with a different size\n")
+
+    checksums, _, _ = calculate_checksums_incremental(paths, rel_paths, prior)
+    assert checksums == ["sentinel", calculate_checksum(changed)]
+
+
+def test_incremental_checksums_catch_same_size_rewrite_with_restored_mtime(tmp_path: Path):
+    """A same-size edit whose mtime is put back is still rehashed."""
+    path = tmp_path / "config.txt"
+    path.write_text("port=8080\n")
+
+    first, file_stats, scan_time_ns = calculate_checksums_incremental([path], ["config.txt"], None)
+    prior = {"files": {"config.txt": first[0]}, "file_stats": file_stats, "file_stats_time_ns": scan_time_ns}
+
+    st = os.stat(path)
+    path.write_text("port=9090\n")
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert os.stat(path).st_size == st.st_size
+
+    second, _, _ = calculate_checksums_incremental([path], ["config.txt"], prior)
+    assert second == [calculate_checksum(path)]
+    assert second != first
+
+
+def test_incremental_checksums_rehash_files_touched_after_prior_scan(tmp_path: Path):
+    """Racily clean files (mtime at or after the prior scan) are rehashed despite a matching fingerprint."""
+    path = tmp_path / "notes.txt"
+    path.write_text("hello\n")
+
+    _, file_stats, scan_time_ns = calculate_checksums_incremental([path], ["notes.txt"], None)
+    prior = {"files": {"notes.txt": "sentinel"}, "file_stats": file_stats, "file_stats_time_ns": scan_time_ns}
+
+    result, _, _ = calculate_checksums_incremental([path], ["notes.txt"], prior)
+    assert result == [calculate_checksum(path)]
+
+    # Without a recorded scan time, fingerprints are not trusted at all
+    prior["file_stats_time_ns"] = None
+    result, _, _ = calculate_checksums_incremental([path], ["notes.txt"], prior)
+    assert result == [calculate_checksum(path)]
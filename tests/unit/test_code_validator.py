@@ -0,0 +1,51 @@
+"""Tests for CodeValidator syntax checking and its result cache."""
+
+from doc_manager_mcp.indexing.analysis import code_validator
+from doc_manager_mcp.indexing.analysis.code_validator import CodeValidator
+
+
+def test_reports_syntax_errors_with_location():
+    """Invalid snippets report the error line and column."""
+    result = CodeValidator().validate_syntax("python", "x = 1\nprint(1\n")
+
+    assert result["valid"] is False
+    assert result["errors"][0]["line"] == 2
+
+
+def test_unsupported_language_is_valid_with_warning():
+    """Languages without a parser are not validated."""
+    result = CodeValidator().validate_syntax("cobol", "DISPLAY 'HI'.")
+
+    assert result["valid"] is True
+    assert "not supported" in result["warning"]
+
+
+def test_repeated_snippet_is_not_reparsed():
+    """An identical snippet reuses the cached result instead of parsing again."""
+    code_validator._SYNTAX_RESULT_CACHE.clear()
+    first = CodeValidator().validate_syntax("python", "def broken(:\n    pass\n")
+
+    validator = CodeValidator()
+
+    class _FailingParser:
+        def parse(self, _source):
+            raise AssertionError("parser should not run for cached snippets")
+
+    validator.indexer.parsers["python"] = _FailingParser()
+    second = validator.validate_syntax("python", "def broken(:\n    pass\n")
+
+    assert second == first
+    second["errors"].clear()
+    assert validator.validate_syntax("python", "def broken(:\n    pass\n")["errors"]
+
+
+def test_errors_reported_in_document_order_with_short_context():
+    """Errors come back top to bottom, and their context text is capped at 50 characters."""
+    code_validator._SYNTAX_RESULT_CACHE.clear()
+    code = "ok = 1\nx = (\n" + "y = 'é中' + " * 40 + "\ndef broken(:\n    pass\n"
+
+    errors = CodeValidator().validate_syntax("python", code)["errors"]
+
+    assert errors
+    assert [e["line"] for e in errors] == sorted(e["line"] for e in errors)
+    assert all(len(e["text"]) <= 50 for e in errors)
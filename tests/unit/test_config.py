@@ -0,0 +1,112 @@
+"""Tests for .doc-manager.yml loading."""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from doc_manager_mcp.core.config import get_checksum_workers, load_config, save_config
+
+
+def test_load_config_picks_up_file_changes(tmp_path):
+    """Memoized configs are re-parsed when .doc-manager.yml changes."""
+    config_path = tmp_path / ".doc-manager.yml"
+    config_path.write_text("platform: mkdocs\nexclude:\n")
+    config = load_config(tmp_path)
+    assert config == {"platform": "mkdocs", "exclude": [], "sources": []}
+
+    # Cached result is returned as a copy
+    config["exclude"].append("mutated/**")
+    assert load_config(tmp_path)["exclude"] == []
+
+    config_path.write_text("platform: sphinx\nexclude:\n  - build/**\n")
+    config = load_config(tmp_path)
+    assert config["platform"] == "sphinx"
+    assert config["exclude"] == ["build/**"]
+
+
+def test_load_config_missing_file(tmp_path):
+    """A project without a config file yields None."""
+    assert load_config(tmp_path) is None
+
+
+def test_load_config_rejects_malformed_files(tmp_path):
+    """Unparseable or non-mapping configs load as None."""
+    config_path = tmp_path / ".doc-manager.yml"
+    config_path.write_text("platform: [unclosed\n")
+    assert load_config(tmp_path) is None
+
+    config_path.write_text("- just\n- a list\n")
+    assert load_config(tmp_path) is None
+
+
+def test_save_config_invalidates_cache(tmp_path):
+    """A save is visible even if the rewrite keeps the same size and mtime."""
+    save_config(tmp_path, {"platform": "mkdocs"})
+    config_path = tmp_path / ".doc-manager.yml"
+    stat = config_path.stat()
+    assert load_config(tmp_path)["platform"] == "mkdocs"
+
+    save_config(tmp_path, {"platform": "sphinx"})
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert config_path.stat().st_size == stat.st_size
+
+    assert load_config(tmp_path)["platform"] == "sphinx"
+
+
+def test_save_config_failure_keeps_existing_file(tmp_path, monkeypatch):
+    """A failed save leaves the previous config and no temp file behind."""
+    assert save_config(tmp_path, {"platform": "mkdocs"})
+    original = (tmp_path / ".doc-manager.yml").read_text()
+
+    def _fail(*_args):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", _fail)
+    assert not save_config(tmp_path, {"platform": "sphinx"})
+
+    assert (tmp_path / ".doc-manager.yml").read_text() == original
+    assert sorted(p.name for p in tmp_path.iterdir()) == [".doc-manager.yml"]
+
+
+def test_save_config_unexpected_error_returns_false(tmp_path, monkeypatch):
+    """Errors other than OSError are reported as a failed save, not raised."""
+    def _fail(*_args):
+        raise TypeError("unexpected")
+
+    monkeypatch.setattr(os, "replace", _fail)
+    assert not save_config(tmp_path, {"platform": "mkdocs"})
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_save_config_keeps_file_mode(tmp_path):
+    """Rewriting the config keeps its permission bits instead of the temp file's 0600."""
+    config_path = tmp_path / ".doc-manager.yml"
+    assert save_config(tmp_path, {"platform": "mkdocs"})
+    os.chmod(config_path, 0o640)
+
+    assert save_config(tmp_path, {"platform": "sphinx"})
+
+    assert config_path.stat().st_mode & 0o777 == 0o640
+
+
+def test_concurrent_saves_use_separate_temp_files(tmp_path):
+    """Overlapping saves each land a complete config and leave no temp files."""
+    configs = [{"platform": "mkdocs", "exclude": [f"pattern{i}/**"] * 200} for i in range(8)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda config: save_config(tmp_path, config), configs))
+
+    assert all(results)
+    assert sorted(p.name for p in tmp_path.iterdir()) == [".doc-manager.yml"]
+    assert load_config(tmp_path)["exclude"] in [config["exclude"] for config in configs]
+
+
+def test_get_checksum_workers(tmp_path):
+    """Only positive integer thread counts are honored."""
+    config_path = tmp_path / ".doc-manager.yml"
+    assert get_checksum_workers(tmp_path) is None
+
+    config_path.write_text("checksum_workers: 4\n")
+    assert get_checksum_workers(tmp_path) == 4
+
+    config_path.write_text("checksum_workers: 0\n")
+    assert get_checksum_workers(tmp_path) is None
@@ -12,22 +12,35 @@ def indexer():
     return SymbolIndexer()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def fixtures_path():
     """Path to config sample fixtures."""
     return Path(__file__).parent.parent / "fixtures" / "config_samples"
 
 
+@pytest.fixture(scope="module")
+def indexed_sample(fixtures_path):
+    """Index each config sample once per module; tests only read the result."""
+    indexers: dict[str, SymbolIndexer] = {}
+
+    def _indexed(file_name: str) -> SymbolIndexer:
+        if not (fixtures_path / file_name).exists():
+            pytest.skip("Fixture file not found")
+        if file_name not in indexers:
+            indexer = SymbolIndexer()
+            indexer.index_project(fixtures_path, file_patterns=[file_name])
+            indexers[file_name] = indexer
+        return indexers[file_name]
+
+    return _indexed
+
+
 class TestPythonConfigDetection:
     """Test Python config class detection (Pydantic, dataclass, TypedDict, attrs)."""
 
-    def test_pydantic_basemodel_detection(self, indexer, fixtures_path):
+    def test_pydantic_basemodel_detection(self, indexed_sample):
         """Test Pydantic BaseModel detection."""
-        file_path = fixtures_path / "pydantic_config.py"
-        if not file_path.exists():
-            pytest.skip("Fixture file not found")
-
-        indexer.index_project(fixtures_path, file_patterns=["pydantic_config.py"])
+        indexer = indexed_sample("pydantic_config.py")
 
         # Should find DatabaseConfig class
         symbols = indexer.lookup("DatabaseConfig")
@@ -42,13 +55,9 @@ class TestPythonConfigDetection:
         assert "port" in field_names
         assert "database" in field_names
 
-    def test_pydantic_field_types(self, indexer, fixtures_path):
+    def test_pydantic_field_types(self, indexed_sample):
         """Test field type extraction from Pydantic model."""
-        file_path = fixtures_path / "pydantic_config.py"
-        if not file_path.exists():
-            pytest.skip("Fixture file not found")
-
-        indexer.index_project(fixtures_path, file_patterns=["pydantic_config.py"])
+        indexer = indexed_sample("pydantic_config.py")
 
         symbols = indexer.lookup("DatabaseConfig")
         assert len(symbols) == 1
@@ -62,13 +71,30 @@ class TestPythonConfigDetection:
                 ssl_field = fields_by_name["ssl_enabled"]
                 assert ssl_field.is_optional is False  # bool = False is not optional
 
-    def test_dataclass_detection(self, indexer, fixtures_path):
-        """Test @dataclass decorator detection."""
-        file_path = fixtures_path / "dataclass_config.py"
-        if not file_path.exists():
-            pytest.skip("Fixture file not found")
+    def test_pydantic_field_description(self, indexer, tmp_path):
+        """Test Field(description=...) extraction, including embedded quotes."""
+        (tmp_path / "settings.py").write_text(
+            "from pydantic import BaseModel, Field\n\n"
+            "class ServerSettings(BaseModel):\n"
+            "    host: str = Field(default=\"localhost\", description=\"Server's bind address\")\n"
+            "    port: int = Field(8080, description=\"Listen \" \"port\")\n"
+            "    name: str = Field(description=\"\"\"Display name\"\"\")\n"
+            "    mode: str = Field(description=f\"One of {MODES}\")\n"
+        )
+
+        indexer.index_project(tmp_path, file_patterns=["settings.py"])
+
+        symbols = indexer.lookup("ServerSettings")
+        assert len(symbols) == 1
+        fields_by_name = {f.name: f for f in symbols[0].config_fields}
+        assert fields_by_name["host"].doc == "Server's bind address"
+        assert fields_by_name["port"].doc == "Listen port"
+        assert fields_by_name["name"].doc == "Display name"
+        assert fields_by_name["mode"].doc is None
 
-        indexer.index_project(fixtures_path, file_patterns=["dataclass_config.py"])
+    def test_dataclass_detection(self, indexed_sample):
+        """Test @dataclass decorator detection."""
+        indexer = indexed_sample("dataclass_config.py")
 
         symbols = indexer.lookup("ServerConfig")
         assert len(symbols) == 1
@@ -85,13 +111,9 @@ class TestPythonConfigDetection:
 class TestGoConfigDetection:
     """Test Go config struct detection with yaml/json tags."""
 
-    def test_go_struct_with_tags(self, indexer, fixtures_path):
+    def test_go_struct_with_tags(self, indexed_sample):
         """Test Go struct with yaml/json tags detection."""
-        file_path = fixtures_path / "go_config.go"
-        if not file_path.exists():
-            pytest.skip("Fixture file not found")
-
-        indexer.index_project(fixtures_path, file_patterns=["go_config.go"])
+        indexer = indexed_sample("go_config.go")
 
         symbols = indexer.lookup("AppConfig")
         assert len(symbols) == 1
@@ -104,13 +126,9 @@ class TestGoConfigDetection:
         assert "Name" in field_names
         assert "Version" in field_names
 
-    def test_go_field_tags_parsing(self, indexer, fixtures_path):
+    def test_go_field_tags_parsing(self, indexed_sample):
         """Test Go field tag parsing."""
-        file_path = fixtures_path / "go_config.go"
-        if not file_path.exists():
-            pytest.skip("Fixture file not found")
-
-        indexer.index_project(fixtures_path, file_patterns=["go_config.go"])
+        indexer = indexed_sample("go_config.go")
 
         symbols = indexer.lookup("AppConfig")
         if symbols and symbols[0].config_fields:
@@ -127,13 +145,9 @@ class TestGoConfigDetection:
 class TestTypeScriptConfigDetection:
     """Test TypeScript interface detection by name pattern."""
 
-    def test_ts_interface_with_config_suffix(self, indexer, fixtures_path):
+    def test_ts_interface_with_config_suffix(self, indexed_sample):
         """Test TypeScript interface with *Config name pattern."""
-        file_path = fixtures_path / "ts_config.ts"
-        if not file_path.exists():
-            pytest.skip("Fixture file not found")
-
-        indexer.index_project(fixtures_path, file_patterns=["ts_config.ts"])
+        indexer = indexed_sample("ts_config.ts")
 
         symbols = indexer.lookup("AppConfig")
         assert len(symbols) == 1
@@ -146,13 +160,9 @@ class TestTypeScriptConfigDetection:
         assert "name" in field_names
         assert "debug" in field_names
 
-    def test_ts_optional_properties(self, indexer, fixtures_path):
+    def test_ts_optional_properties(self, indexed_sample):
         """Test TypeScript optional property (?) detection."""
-        file_path = fixtures_path / "ts_config.ts"
-        if not file_path.exists():
-            pytest.skip("Fixture file not found")
-
-        indexer.index_project(fixtures_path, file_patterns=["ts_config.ts"])
+        indexer = indexed_sample("ts_config.ts")
 
         symbols = indexer.lookup("AppConfig")
         if symbols and symbols[0].config_fields:
@@ -166,13 +176,9 @@ class TestTypeScriptConfigDetection:
 class TestRustConfigDetection:
     """Test Rust config struct detection with serde derives."""
 
-    def test_rust_serde_struct(self, indexer, fixtures_path):
+    def test_rust_serde_struct(self, indexed_sample):
         """Test Rust struct with #[derive(Serialize, Deserialize)]."""
-        file_path = fixtures_path / "rust_config.rs"
-        if not file_path.exists():
-            pytest.skip("Fixture file not found")
-
-        indexer.index_project(fixtures_path, file_patterns=["rust_config.rs"])
+        indexer = indexed_sample("rust_config.rs")
 
         symbols = indexer.lookup("AppConfig")
         assert len(symbols) == 1
@@ -185,13 +191,9 @@ class TestRustConfigDetection:
         assert "name" in field_names
         assert "debug" in field_names
 
-    def test_rust_serde_attributes(self, indexer, fixtures_path):
+    def test_rust_serde_attributes(self, indexed_sample):
         """Test Rust serde attribute parsing."""
-        file_path = fixtures_path / "rust_config.rs"
-        if not file_path.exists():
-            pytest.skip("Fixture file not found")
-
-        indexer.index_project(fixtures_path, file_patterns=["rust_config.rs"])
+        indexer = indexed_sample("rust_config.rs")
 
         symbols = indexer.lookup("AppConfig")
         if symbols and symbols[0].config_fields:
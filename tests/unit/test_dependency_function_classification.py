@@ -7,7 +7,10 @@ import pytest
 
 from doc_manager_mcp.indexing import SymbolIndexer
 from doc_manager_mcp.indexing.analysis.tree_sitter import Symbol, SymbolType
-from doc_manager_mcp.tools._internal.dependencies import _extract_code_references
+from doc_manager_mcp.tools._internal.dependencies import (
+    _extract_code_references,
+    _search_file_for_pattern,
+)
 
 
 @pytest.fixture
@@ -162,3 +165,43 @@ def test_class_in_index_not_matched_as_function():
 
     assert len(class_refs) > 0, "Should find reference"
     assert class_refs[0]["type"] == "class", "Should be classified as class"
+
+
+def test_regex_fallback_skips_files_without_identifier(tmp_path, capsys):
+    """Files lacking the identifier are ruled out on raw bytes, without decoding."""
+    match = tmp_path / "match.py"
+    match.write_text("def process_data(items):\n    return items\n")
+    binary = tmp_path / "blob.py"
+    binary.write_bytes(b"\xff\xfe not utf-8 \x80")
+    path_map = {match: "match.py", binary: "blob.py"}
+    file_cache: dict = {}
+    patterns = [r'\bdef\s+process_data\s*\(']
+
+    assert _search_file_for_pattern(
+        match, patterns, path_map, file_cache, b"process_data"
+    ) == "match.py"
+    assert _search_file_for_pattern(binary, patterns, path_map, file_cache, b"process_data") is None
+    assert capsys.readouterr().err == ""
+
+
+def test_raw_content_references_report_their_lines():
+    """Heading, terminal and semantic command references carry their own line numbers."""
+    content = (
+        "# setup(path)\n"
+        "\n"
+        "Run it:\n"
+        "$ mytool build\n"
+        "\n"
+        "## teardown(path)\n"
+        "Use the deploy command.\n"
+        "$ mytool clean\n"
+    )
+
+    references = _extract_code_references(content, Path("test.md"), indexer=None)
+    lines = {(r["type"], r["reference"]): r["line"] for r in references}
+
+    assert lines[("function", "setup()")] == 1
+    assert lines[("function", "teardown()")] == 6
+    assert lines[("command", "mytool build")] == 4
+    assert lines[("command", "mytool clean")] == 8
+    assert lines[("semantic_command", "deploy")] == 7
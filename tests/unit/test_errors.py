@@ -0,0 +1,28 @@
+"""Tests for handle_error formatting."""
+
+from doc_manager_mcp.core import handle_error
+
+
+def test_message_includes_type_and_context():
+    msg = handle_error(ValueError("bad value"), "docmgr_sync", log_to_stderr=False)
+    assert msg == "Error: ValueError in docmgr_sync: bad value"
+
+
+def test_paths_are_sanitized():
+    msg = handle_error(
+        OSError(r"cannot open /home/user/project/file.md or C:\Users\me\file.md"),
+        log_to_stderr=False,
+    )
+    assert msg.startswith("Error: OSError: cannot open [path]")
+    assert "/home/user" not in msg
+    assert "Users" not in msg
+
+
+def test_error_is_logged_to_stderr(capsys):
+    msg = handle_error(RuntimeError("boom"), "docmgr_init")
+    assert msg in capsys.readouterr().err
+
+
+def test_logging_can_be_disabled(capsys):
+    handle_error(RuntimeError("boom"), log_to_stderr=False)
+    assert capsys.readouterr().err == ""
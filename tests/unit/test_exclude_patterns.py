@@ -0,0 +1,110 @@
+"""Tests for exclude pattern matching."""
+
+import pytest
+
+from doc_manager_mcp.constants import DEFAULT_EXCLUDE_PATTERNS
+from doc_manager_mcp.core.patterns import (
+    build_exclude_patterns,
+    compile_exclude_matcher,
+    matches_exclude_pattern,
+)
+
+
+@pytest.mark.parametrize(
+    ("path", "pattern", "expected"),
+    [
+        # **/ prefix matches at the root and at any depth
+        ("node_modules", "**/node_modules", True),
+        ("web/node_modules", "**/node_modules", True),
+        ("web/node_modules_extra", "**/node_modules", False),
+        ("a/b/app.log", "**/*.log", True),
+        # /** suffix matches the directory itself and everything beneath it
+        ("docs", "docs/**", True),
+        ("docs/guide/intro.md", "docs/**", True),
+        ("docsite/index.md", "docs/**", False),
+        # Plain globs follow fnmatch, where * also crosses directory separators
+        ("README.md", "*.md", True),
+        ("docs/README.md", "*.md", True),
+        ("src/pkg/gen.py", "src/*/gen.py", True),
+        ("src/gen.py", "src/*/gen.py", False),
+    ],
+)
+def test_matches_exclude_pattern(path, pattern, expected):
+    """Each pattern form keeps its glob semantics."""
+    assert matches_exclude_pattern(path, [pattern]) is expected
+
+
+def test_compiled_matcher_checks_all_patterns():
+    """A compiled matcher excludes a path if any pattern matches."""
+    is_excluded = compile_exclude_matcher(["**/*.log", "build/**", "*.tmp"])
+
+    assert is_excluded("logs/app.log")
+    assert is_excluded("build/out/main.js")
+    assert is_excluded("scratch.tmp")
+    assert not is_excluded("src/main.py")
+
+
+def test_compiled_matcher_with_no_patterns():
+    """An empty pattern list excludes nothing."""
+    assert not compile_exclude_matcher([])("anything/at/all.py")
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        ("src/main.py", False),
+        ("environment/setup.md", False),
+        # **/name, **/name/** and **/*suffix forms
+        ("node_modules", True),
+        ("web/node_modules/lib/index.js", True),
+        ("pkg/__pycache__/mod.cpython-312.pyc", True),
+        ("logs/server.log", True),
+        # Globs handled by the regex fallback
+        ("cmake-build-debug/CMakeCache.txt", True),
+        ("app/.env.local", True),
+        ("my_pkg.egg-info/PKG-INFO", True),
+        ("docs/.vitepress/dist/index.html", True),
+    ],
+)
+def test_compiled_default_patterns(path, expected):
+    """The default exclude list matches through both fast-path and regex forms."""
+    assert compile_exclude_matcher(list(DEFAULT_EXCLUDE_PATTERNS))(path) is expected
+
+
+def test_build_exclude_patterns_picks_up_config_changes(tmp_path):
+    """Memoized patterns are rebuilt when .doc-manager.yml changes."""
+    config_path = tmp_path / ".doc-manager.yml"
+    config_path.write_text("exclude:\n  - first/**\n")
+    patterns, _ = build_exclude_patterns(tmp_path)
+    assert "first/**" in patterns
+
+    # Cached result is returned as a copy
+    patterns.append("mutated/**")
+    assert "mutated/**" not in build_exclude_patterns(tmp_path)[0]
+
+    config_path.write_text("exclude:\n  - second/**\n  - third/**\n")
+    patterns, _ = build_exclude_patterns(tmp_path)
+    assert "second/**" in patterns
+    assert "first/**" not in patterns
+
+
+@pytest.mark.parametrize(
+    ("pattern", "rejected"),
+    [
+        ("(a+)+", True),
+        ("(a*)*", True),
+        ("(x{2})+", True),
+        ("src/****/tmp", True),
+        ("**/node_modules/**", False),
+        ("(a)+", False),
+        ("a+(b)", False),
+    ],
+)
+def test_glob_pattern_validation_rejects_nested_quantifiers(pattern, rejected):
+    from doc_manager_mcp.models import _validate_glob_pattern
+
+    if rejected:
+        with pytest.raises(ValueError, match="nested quantifiers"):
+            _validate_glob_pattern(pattern)
+    else:
+        _validate_glob_pattern(pattern)
@@ -0,0 +1,97 @@
+"""Tests for file_lock contention handling."""
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from doc_manager_mcp.core.security import file_lock
+
+
+def test_waiter_acquires_lock_after_release(tmp_path: Path):
+    """A second locker blocks until the holder releases, then proceeds in order."""
+    target = tmp_path / "baseline.json"
+    held = threading.Event()
+    release = threading.Event()
+    waiter_acquired = threading.Event()
+    order: list[str] = []
+
+    def holder():
+        with file_lock(target):
+            order.append("holder")
+            held.set()
+            release.wait(timeout=5)
+
+    def waiter():
+        with file_lock(target):
+            order.append("waiter")
+            waiter_acquired.set()
+
+    first = threading.Thread(target=holder)
+    first.start()
+    assert held.wait(timeout=5)
+
+    second = threading.Thread(target=waiter)
+    second.start()
+    assert not waiter_acquired.wait(0.2)
+
+    release.set()
+    assert waiter_acquired.wait(timeout=5)
+    first.join(timeout=5)
+    second.join(timeout=5)
+
+    assert order == ["holder", "waiter"]
+
+
+def test_waiter_and_newcomer_never_hold_lock_together(tmp_path: Path):
+    """After a release, a polling waiter and a fresh locker take turns."""
+    target = tmp_path / "baseline.json"
+    held = threading.Event()
+    release = threading.Event()
+    guard = threading.Lock()
+    active: list[str] = []
+    overlaps: list[tuple[str, ...]] = []
+
+    def holder():
+        with file_lock(target):
+            held.set()
+            release.wait(timeout=5)
+
+    def contender(name: str):
+        with file_lock(target):
+            with guard:
+                active.append(name)
+                if len(active) > 1:
+                    overlaps.append(tuple(active))
+            time.sleep(0.1)
+            with guard:
+                active.remove(name)
+
+    first = threading.Thread(target=holder)
+    first.start()
+    assert held.wait(timeout=5)
+
+    waiter = threading.Thread(target=contender, args=("waiter",))
+    waiter.start()
+    time.sleep(0.05)  # let the waiter open the lock file and start polling
+
+    release.set()
+    first.join(timeout=5)
+    newcomer = threading.Thread(target=contender, args=("newcomer",))
+    newcomer.start()
+    waiter.join(timeout=5)
+    newcomer.join(timeout=5)
+
+    assert not waiter.is_alive() and not newcomer.is_alive()
+    assert overlaps == []
+    assert not target.with_suffix(".json.lock").exists()
+
+
+def test_lock_times_out_while_held(tmp_path: Path):
+    """Contended acquisition gives up once the timeout and retries are spent."""
+    target = tmp_path / "baseline.json"
+    with file_lock(target):
+        with pytest.raises(TimeoutError):
+            with file_lock(target, timeout=0, retries=2):
+                pass
@@ -75,6 +75,18 @@ def test_scan_project_files_with_walk(temp_project):
     assert len(files_walk) >= len(files_rglob) - 2  # Allow small difference
 
 
+def test_scan_project_files_walk_matches_rglob_exactly(temp_project):
+    """The scandir walk prunes hidden trees without dropping visible files."""
+    (temp_project / "src" / ".cache").mkdir()
+    (temp_project / "src" / ".cache" / "blob.py").write_text("x = 1")
+
+    files_rglob = set(scan_project_files(temp_project, use_walk=False))
+    files_walk = set(scan_project_files(temp_project, use_walk=True))
+
+    assert files_walk == files_rglob
+    assert temp_project / "src" / "utils.py" in files_walk
+
+
 def test_scan_project_files_max_limit(temp_project):
     """Test file count limit enforcement."""
     with pytest.raises(ValueError, match="File count limit exceeded"):
@@ -0,0 +1,50 @@
+"""Tests for git command helpers."""
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from doc_manager_mcp.core import git
+from doc_manager_mcp.core.git import get_git_head_info, run_git_command
+
+
+@pytest.mark.asyncio
+async def test_get_git_head_info(tmp_path: Path):
+    """Commit hash and branch come back from one rev-parse call."""
+    subprocess.run(['git', 'init', '-b', 'main'], cwd=tmp_path, check=True, capture_output=True)  # noqa: S607
+    subprocess.run(
+        ['git', 'commit', '--allow-empty', '-m', 'init'],  # noqa: S607
+        cwd=tmp_path, check=True, capture_output=True
+    )
+    expected_commit = subprocess.run(
+        ['git', 'rev-parse', 'HEAD'], cwd=tmp_path, check=True, capture_output=True, text=True  # noqa: S607
+    ).stdout.strip()
+
+    assert await get_git_head_info(tmp_path) == (expected_commit, "main")
+
+
+@pytest.mark.asyncio
+async def test_get_git_head_info_outside_repo(tmp_path: Path):
+    """Non-git directories yield no commit or branch."""
+    assert await get_git_head_info(tmp_path) == (None, None)
+
+
+@pytest.mark.asyncio
+async def test_git_lookup_happens_once(tmp_path: Path, monkeypatch):
+    """PATH is only searched for git until it has been found."""
+    monkeypatch.setattr(git, "_git_found", False)
+    real_which = shutil.which
+    calls = []
+
+    def counting_which(name):
+        calls.append(name)
+        return real_which(name)
+
+    monkeypatch.setattr(shutil, "which", counting_which)
+
+    await run_git_command(tmp_path, "--version")
+    await run_git_command(tmp_path, "--version")
+
+    assert calls == ["git"]
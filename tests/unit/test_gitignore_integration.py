@@ -56,18 +56,6 @@ Thumbs.db
         # Initialize git repo
         import subprocess
         subprocess.run(["git", "init"], cwd=project_path, check=True, capture_output=True)
-        subprocess.run(
-            ["git", "config", "user.email", "test@example.com"],
-            cwd=project_path,
-            check=True,
-            capture_output=True
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "Test User"],
-            cwd=project_path,
-            check=True,
-            capture_output=True
-        )
         subprocess.run(
             ["git", "add", "."],
             cwd=project_path,
@@ -62,6 +62,29 @@ print('test')
         assert len(cache) == 1  # Cache size unchanged
 
 
+def test_cache_tokenizes_content_once(monkeypatch):
+    """Test that all components come from a single markdown-it parse."""
+    from doc_manager_mcp.indexing.parsers.markdown import MarkdownParser
+
+    calls = []
+    original_parse = MarkdownParser.parse
+
+    def counting_parse(self, content):
+        calls.append(content)
+        return original_parse(self, content)
+
+    monkeypatch.setattr(MarkdownParser, "parse", counting_parse)
+
+    content = "# Title\n\n[Link](page.md) ![Img](a.png)\n\n```python\nx = 1\n```\n"
+    parsed = MarkdownCache().parse(Path("doc.md"), content)
+
+    assert len(calls) == 1
+    assert parsed.headings[0]["text"] == "Title"
+    assert parsed.links[0]["url"] == "page.md"
+    assert parsed.images[0]["src"] == "a.png"
+    assert parsed.code_blocks[0]["language"] == "python"
+
+
 def test_cache_extracts_headings():
     """Test that cache correctly extracts headings."""
     cache = MarkdownCache()
@@ -269,3 +292,72 @@ def test_cache_performance_benefit():
         # Cached should be much faster (practically instant)
         assert time2 < time1 * 0.1  # At least 10x faster
         assert parsed1 is parsed2  # Same object
+
+
+def test_cache_reads_file_once(tmp_path):
+    """Test that read() returns cached content without reopening the file."""
+    cache = MarkdownCache()
+    file_path = tmp_path / "doc.md"
+    file_path.write_text("# Original\n", encoding='utf-8')
+
+    assert cache.read(file_path) == "# Original\n"
+
+    file_path.write_text("# Changed\n", encoding='utf-8')
+    assert cache.read(file_path) == "# Original\n"
+
+    cache.clear()
+    assert cache.read(file_path) == "# Changed\n"
+
+
+def test_cache_read_errors_are_not_cached(tmp_path):
+    """Test that a failed read raises and is retried on the next call."""
+    cache = MarkdownCache()
+    file_path = tmp_path / "late.md"
+
+    with pytest.raises(FileNotFoundError):
+        cache.read(file_path)
+
+    file_path.write_text("# Late\n", encoding='utf-8')
+    assert cache.read(file_path) == "# Late\n"
+
+
+def test_parse_includes_inline_code():
+    """Inline code spans come from the same tokenization as the other components."""
+    cache = MarkdownCache()
+
+    parsed = cache.parse(Path("doc.md"), "# Title\n\nCall `run()` or `stop()`.\n")
+
+    assert [span["text"] for span in parsed.inline_code] == ["run()", "stop()"]
+
+
+def test_inline_code_found_in_headings_paragraphs_and_image_alt():
+    """Inline code is extracted wherever markdown-it emits it, with its block's line."""
+    from doc_manager_mcp.indexing.parsers.markdown import MarkdownParser
+
+    content = (
+        "# The `Title`\n\nPlain prose.\n\n"
+        "Call it:\nthen `cell()`.\n\n"
+        "![see `alt()`](img.png)\n"
+    )
+
+    spans = MarkdownParser().extract_inline_code(content)
+
+    assert [(s["text"], s["line"]) for s in spans] == [("Title", 1), ("cell()", 5), ("alt()", 8)]
+
+
+def test_list_files_globs_each_directory_once(tmp_path, monkeypatch):
+    """Repeated listings reuse the first glob and hand out independent lists."""
+    (tmp_path / "a.md").write_text("# A\n", encoding='utf-8')
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "b.markdown").write_text("# B\n", encoding='utf-8')
+    cache = MarkdownCache()
+    calls = []
+    original_glob = Path.glob
+    monkeypatch.setattr(Path, "glob", lambda self, pattern: calls.append(pattern) or original_glob(self, pattern))
+
+    first = cache.list_files(tmp_path)
+    first.clear()
+    second = cache.list_files(tmp_path)
+
+    assert sorted(p.name for p in second) == ["a.md", "b.markdown"]
+    assert calls == ["**/*.md", "**/*.markdown"]
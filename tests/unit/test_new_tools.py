@@ -1,5 +1,6 @@
 """Unit tests for new refactored tools (docmgr_init, docmgr_detect_changes, docmgr_update_baseline)."""
 
+import shutil
 import tempfile
 from pathlib import Path
 
@@ -16,42 +17,14 @@ from doc_manager_mcp.tools.state.update_baseline import docmgr_update_baseline
 
 
 @pytest.fixture
-def temp_project():
+def temp_project(git_project_template):
     """Create a temporary project directory for testing."""
     with tempfile.TemporaryDirectory() as tmpdir:
         project_path = Path(tmpdir)
 
-        # Create minimal project structure
-        (project_path / "src").mkdir()
-        (project_path / "src" / "main.py").write_text("def hello(): pass\n")
-
-        # Initialize git repo (required for some operations)
-        import subprocess
-        subprocess.run(["git", "init"], cwd=project_path, check=True, capture_output=True)
-        subprocess.run(
-            ["git", "config", "user.email", "test@example.com"],
-            cwd=project_path,
-            check=True,
-            capture_output=True
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "Test User"],
-            cwd=project_path,
-            check=True,
-            capture_output=True
-        )
-        subprocess.run(
-            ["git", "add", "."],
-            cwd=project_path,
-            check=True,
-            capture_output=True
-        )
-        subprocess.run(
-            ["git", "commit", "-m", "Initial commit"],
-            cwd=project_path,
-            check=True,
-            capture_output=True
-        )
+        # Minimal committed git project (required for some operations), copied
+        # from a session template instead of re-running git init/add/commit
+        shutil.copytree(git_project_template, project_path, dirs_exist_ok=True)
 
         yield project_path
 
@@ -246,3 +219,70 @@ async def test_docmgr_update_baseline_success(temp_project):
     assert "repo-baseline.json" in updated_files
     assert "symbol-baseline.json" in updated_files
     assert "dependencies.json" in updated_files
+
+
+def test_project_path_resolution_follows_retargeted_symlink(tmp_path):
+    """Memoized resolution is keyed on the directory, so a retargeted link resolves anew."""
+    first, second = tmp_path / "first", tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    link = tmp_path / "link"
+    link.symlink_to(first)
+
+    assert DocmgrDetectChangesInput(project_path=str(link)).project_path == str(first.resolve())
+    assert DocmgrDetectChangesInput(project_path=str(link)).project_path == str(first.resolve())
+
+    link.unlink()
+    link.symlink_to(second)
+
+    assert DocmgrDetectChangesInput(project_path=str(link)).project_path == str(second.resolve())
+
+
+@pytest.mark.parametrize(
+    ("since_commit", "valid"),
+    [
+        ("abc1234", True),
+        ("ABCDEF0123456789abcdef0123456789abcdef01", True),
+        ("abc123", False),
+        ("a" * 41, False),
+        ("abc1234g", False),
+        ("HEAD~3", False),
+        ("abc1234; rm -rf /", False),
+        ("abc\uff11\uff12\uff13\uff14", False),  # fullwidth digits
+    ],
+)
+def test_commit_hash_validation(temp_project, since_commit, valid):
+    """Only 7-40 ASCII hex characters are accepted as a commit hash."""
+    from pydantic import ValidationError
+
+    from doc_manager_mcp.models import MapChangesInput
+
+    if valid:
+        assert MapChangesInput(project_path=str(temp_project), since_commit=since_commit).since_commit == since_commit
+    else:
+        with pytest.raises(ValidationError, match="Invalid git commit hash"):
+            MapChangesInput(project_path=str(temp_project), since_commit=since_commit)
+
+
+@pytest.mark.parametrize(
+    ("model_name", "field"),
+    [
+        ("SyncInput", "docs_path"),
+        ("BootstrapInput", "docs_path"),
+        ("MigrateInput", "source_path"),
+        ("MigrateInput", "target_path"),
+    ],
+)
+@pytest.mark.parametrize("bad_path", ["../outside", "/etc"])
+def test_workflow_inputs_reject_paths_outside_project(temp_project, model_name, field, bad_path):
+    """Workflow tools validate relative paths before handing them to internal calls."""
+    from pydantic import ValidationError
+
+    from doc_manager_mcp import models
+
+    fields = {"project_path": str(temp_project), field: bad_path}
+    if model_name == "MigrateInput" and field != "source_path":
+        fields["source_path"] = "docs"
+
+    with pytest.raises(ValidationError, match=f"Invalid {field}"):
+        getattr(models, model_name)(**fields)
@@ -0,0 +1,45 @@
+"""Tests for documentation platform detection."""
+
+from pathlib import Path
+
+import pytest
+
+from doc_manager_mcp.models import DetectPlatformInput
+from doc_manager_mcp.tools.analysis.platform import detect_platform
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("files", "expected"),
+    [
+        ({"mkdocs.yml": ""}, "mkdocs"),
+        ({"docs/conf.py": ""}, "sphinx"),
+        ({".vitepress/config.ts": ""}, "vitepress"),
+        ({"docsite/hugo.toml": ""}, "hugo"),
+        ({"docs/.vitepress/config.js": ""}, "vitepress"),
+        ({"package.json": '{"devDependencies": {"@docusaurus/core": "3"}}'}, "docusaurus"),
+        ({"requirements.txt": "Sphinx==7.0\n"}, "sphinx"),
+    ],
+)
+async def test_detect_platform_markers(tmp_path: Path, files, expected):
+    """Root, docs-directory, and dependency markers are each detected."""
+    for relative, content in files.items():
+        path = tmp_path / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+    result = await detect_platform(DetectPlatformInput(project_path=str(tmp_path)))
+
+    assert result["recommendation"] == expected
+    assert result["detected_platforms"]
+
+
+@pytest.mark.asyncio
+async def test_detect_platform_skips_non_directory_docs_path(tmp_path: Path):
+    """A file named like a docs directory is not searched for configs."""
+    (tmp_path / "docs").write_text("not a directory")
+    (tmp_path / "site").mkdir()
+
+    result = await detect_platform(DetectPlatformInput(project_path=str(tmp_path)))
+
+    assert result["detected_platforms"] == []
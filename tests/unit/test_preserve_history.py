@@ -5,6 +5,7 @@ uses git mv instead of shutil.copy2 to preserve git history for migrated files.
 """
 
 import json
+import shutil
 import subprocess
 import tempfile
 from pathlib import Path
@@ -15,32 +16,42 @@ from doc_manager_mcp.models import MigrateInput
 from doc_manager_mcp.tools.workflows.migrate import migrate
 
 
-@pytest.fixture
-def git_project():
-    """Create a temporary git repository with documentation for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        project_path = Path(tmpdir)
+@pytest.fixture(scope="module")
+def git_project_docs_template(tmp_path_factory, git_identity):
+    """A committed repository with documentation, built once per module."""
+    project_path = tmp_path_factory.mktemp("git_docs_template")
 
-        # Initialize git repo
-        subprocess.run(['git', 'init'], cwd=project_path, check=True, capture_output=True)
-        subprocess.run(['git', 'config', 'user.email', 'test@example.com'], cwd=project_path, check=True, capture_output=True)
-        subprocess.run(['git', 'config', 'user.name', 'Test User'], cwd=project_path, check=True, capture_output=True)
+    # Initialize git repo
+    subprocess.run(['git', 'init'], cwd=project_path, check=True, capture_output=True)
 
-        # Create old docs structure
-        old_docs = project_path / "documentation"
-        old_docs.mkdir()
+    # Create old docs structure
+    old_docs = project_path / "documentation"
+    old_docs.mkdir()
+
+    # Create sample markdown files
+    (old_docs / "README.md").write_text("# Old Documentation\n\nSome content.", encoding='utf-8')
+    (old_docs / "guide.md").write_text("# Guide\n\nStep by step.", encoding='utf-8')
+
+    # Create subdirectory with file
+    (old_docs / "reference").mkdir()
+    (old_docs / "reference" / "api.md").write_text("# API Reference\n", encoding='utf-8')
+
+    # Add and commit files to git
+    subprocess.run(['git', 'add', '.'], cwd=project_path, check=True, capture_output=True)
+    subprocess.run(['git', 'commit', '-m', 'Initial docs'], cwd=project_path, check=True, capture_output=True)
+
+    return project_path
 
-        # Create sample markdown files
-        (old_docs / "README.md").write_text("# Old Documentation\n\nSome content.", encoding='utf-8')
-        (old_docs / "guide.md").write_text("# Guide\n\nStep by step.", encoding='utf-8')
 
-        # Create subdirectory with file
-        (old_docs / "reference").mkdir()
-        (old_docs / "reference" / "api.md").write_text("# API Reference\n", encoding='utf-8')
+@pytest.fixture
+def git_project(git_project_docs_template):
+    """Create a temporary git repository with documentation for testing."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        project_path = Path(tmpdir)
 
-        # Add and commit files to git
-        subprocess.run(['git', 'add', '.'], cwd=project_path, check=True, capture_output=True)
-        subprocess.run(['git', 'commit', '-m', 'Initial docs'], cwd=project_path, check=True, capture_output=True)
+        # Tests migrate and commit in place, so each gets its own copy of the
+        # module template instead of re-running git init/add/commit
+        shutil.copytree(git_project_docs_template, project_path, dirs_exist_ok=True)
 
         yield project_path
 
@@ -221,3 +232,78 @@ async def test_git_mv_method_reported_in_moved_files(git_project):
         # At least some files should use "git mv" method
         git_mv_count = len([f for f in migrated_files if f.get("method") == "git mv"])
         assert git_mv_count > 0, "Should report 'git mv' method for some files"
+
+
+@pytest.mark.asyncio
+async def test_untransformed_markdown_copied_byte_for_byte(non_git_project):
+    """Without link rewriting or TOC regeneration, files are copied unchanged."""
+    project_path = non_git_project
+    original = b"---\ntitle:   'Spaced'\ntags: [a, b]\n---\r\n# Title\r\n\r\nBody\n"
+    (project_path / "documentation" / "guide.md").write_bytes(original)
+
+    await migrate(MigrateInput(
+        project_path=str(project_path),
+        source_path="documentation",
+        target_path="docs",
+        rewrite_links=False,
+        regenerate_toc=False,
+        dry_run=False
+    ))
+
+    assert (project_path / "docs" / "guide.md").read_bytes() == original
+
+
+def test_stage_git_renames_falls_back_per_file(git_project):
+    """A file git can't stage is reported as failed without affecting the rest."""
+    from doc_manager_mcp.tools.workflows.migrate_helpers import stage_git_renames
+
+    project_path = git_project
+    old_docs = project_path / "documentation"
+    new_docs = project_path / "docs"
+    new_docs.mkdir()
+
+    # Untracked file: git rm will reject it
+    (old_docs / "untracked.md").write_text("# Untracked\n", encoding='utf-8')
+
+    renames = []
+    for name in ["README.md", "guide.md", "untracked.md"]:
+        (new_docs / name).write_bytes((old_docs / name).read_bytes())
+        renames.append((old_docs / name, new_docs / name))
+
+    failed = stage_git_renames(renames, project_path)
+
+    assert failed == {old_docs / "untracked.md"}
+    status = subprocess.run(
+        ['git', 'status', '--porcelain'],
+        cwd=project_path, check=True, capture_output=True, text=True
+    ).stdout
+    assert "R  documentation/README.md -> docs/README.md" in status
+    assert "R  documentation/guide.md -> docs/guide.md" in status
+
+
+def test_stage_git_renames_keeps_renames_from_partly_applied_batch(git_project, monkeypatch):
+    """Files already removed by an earlier git rm chunk are not retried and reported as failed."""
+    from doc_manager_mcp.tools.workflows import migrate_helpers
+
+    project_path = git_project
+    old_docs = project_path / "documentation"
+    new_docs = project_path / "docs"
+    new_docs.mkdir()
+    (old_docs / "untracked.md").write_text("# Untracked\n", encoding='utf-8')
+
+    renames = []
+    for name in ["README.md", "guide.md", "untracked.md"]:
+        (new_docs / name).write_bytes((old_docs / name).read_bytes())
+        renames.append((old_docs / name, new_docs / name))
+
+    # One path per chunk: README.md and guide.md are removed before untracked.md fails
+    monkeypatch.setattr(migrate_helpers, "GIT_BATCH_SIZE", 1)
+    failed = migrate_helpers.stage_git_renames(renames, project_path)
+
+    assert failed == {old_docs / "untracked.md"}
+    status = subprocess.run(
+        ['git', 'status', '--porcelain'],  # noqa: S607
+        cwd=project_path, check=True, capture_output=True, text=True
+    ).stdout
+    assert "R  documentation/README.md -> docs/README.md" in status
+    assert "R  documentation/guide.md -> docs/guide.md" in status
@@ -0,0 +1,94 @@
+"""Tests for single-scan project probing."""
+
+from pathlib import Path
+
+import pytest
+
+from doc_manager_mcp.constants import DocumentationPlatform
+from doc_manager_mcp.core.project import (
+    detect_platform_quick,
+    detect_project_language,
+    find_docs_directory,
+    find_markdown_files,
+    probe_project,
+)
+
+
+@pytest.mark.parametrize(
+    ("files", "language", "docs_dir", "platform"),
+    [
+        ([], "Unknown", None, DocumentationPlatform.UNKNOWN),
+        (
+            ["go.mod", "package.json", "docs/index.md", "mkdocs.yml"],
+            "Go", "docs", DocumentationPlatform.MKDOCS,
+        ),
+        (
+            ["requirements.txt", "setup.py", "conf.py", "doc/index.rst"],
+            "Python", "doc", DocumentationPlatform.SPHINX,
+        ),
+        (
+            ["Cargo.toml", "website/docs/intro.md", "docusaurus.config.js"],
+            "Rust", "website/docs", DocumentationPlatform.DOCUSAURUS,
+        ),
+        (
+            ["build.gradle.kts", "docsite/hugo.yaml", "docsite/content/_index.md"],
+            "Kotlin", "docsite", DocumentationPlatform.HUGO,
+        ),
+        # A plain file named like a docs directory is not a docs directory
+        (["docs", "website/index.html", "hugo.toml"], "Unknown", None, DocumentationPlatform.HUGO),
+    ],
+)
+def test_probe_matches_individual_detectors(tmp_path: Path, files, language, docs_dir, platform):
+    """One root scan yields the same answers as the per-marker detectors."""
+    for relative in files:
+        path = tmp_path / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("")
+    expected_docs = tmp_path / docs_dir if docs_dir else None
+
+    probe = probe_project(tmp_path)
+
+    assert probe.language == detect_project_language(tmp_path) == language
+    assert probe.docs_dir == find_docs_directory(tmp_path) == expected_docs
+    assert probe.platform == detect_platform_quick(tmp_path) == platform
+
+
+def test_detectors_handle_missing_project(tmp_path: Path):
+    """A nonexistent root is treated as an empty project."""
+    missing = tmp_path / "missing"
+
+    assert detect_project_language(missing) == "Unknown"
+    assert find_docs_directory(missing) is None
+
+
+def test_find_markdown_files_single_walk(tmp_path: Path):
+    """Both markdown suffixes are found in nested dirs; other entries are ignored."""
+    docs = tmp_path / "docs"
+    (docs / "guide" / "deep").mkdir(parents=True)
+    (docs / "index.md").write_text("# Index\n")
+    (docs / "guide" / "intro.markdown").write_text("# Intro\n")
+    (docs / "guide" / "deep" / "page.md").write_text("# Page\n")
+    (docs / "guide" / "notes.txt").write_text("notes\n")
+    (docs / "folder.md").mkdir()
+
+    found = find_markdown_files(docs, project_path=tmp_path)
+
+    assert found == sorted([
+        docs / "guide" / "deep" / "page.md",
+        docs / "guide" / "intro.markdown",
+        docs / "index.md",
+    ])
+
+
+def test_probe_matches_markers_case_insensitively(tmp_path: Path, monkeypatch):
+    """Where normcase folds case (Windows), marker names match regardless of casing."""
+    (tmp_path / "GO.MOD").write_text("")
+    (tmp_path / "MkDocs.yml").write_text("")
+    (tmp_path / "Docs").mkdir()
+    monkeypatch.setattr("os.path.normcase", str.lower)
+
+    probe = probe_project(tmp_path)
+
+    assert probe.language == "Go"
+    assert probe.docs_dir == tmp_path / "docs"
+    assert probe.platform == DocumentationPlatform.MKDOCS
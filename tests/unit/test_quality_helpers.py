@@ -0,0 +1,233 @@
+"""Tests for the assess_quality tool and its documentation scan helpers."""
+
+from pathlib import Path
+
+import pytest
+
+from doc_manager_mcp.core.markdown_cache import MarkdownCache
+from doc_manager_mcp.models import AssessQualityInput
+from doc_manager_mcp.tools.analysis.quality.assessment import assess_quality
+from doc_manager_mcp.tools.analysis.quality.helpers import (
+    _classify_heading_style,
+    detect_multiple_h1s,
+)
+
+
+def _write(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding='utf-8')
+
+
+@pytest.mark.asyncio
+async def test_assess_quality_reports_formatting_scans(tmp_path):
+    """List marker and heading case scans are included alongside the criteria."""
+    _write(tmp_path / "docs" / "index.md", "# Index\n\n## Getting started\n\n- one\n- two\n")
+    _write(tmp_path / "docs" / "other.md", "# Other\n\n* three\n")
+
+    result = await assess_quality(AssessQualityInput(project_path=str(tmp_path), docs_path="docs"))
+
+    assert isinstance(result, dict), result
+    assert len(result["criteria"]) == 7
+    assert result["list_formatting"]["majority_marker"] == "-"
+    assert result["list_formatting"]["inconsistent_files"][0]["file"] == "other.md"
+    assert result["heading_case"]["majority_style"] == "sentence_case"
+
+
+@pytest.mark.parametrize(("heading", "style"), [
+    ("Getting Started With The API", "title_case"),
+    ("Getting started with the API", "sentence_case"),
+    ("Install (Step-By-Step)", "title_case"),
+    ("Overview", "sentence_case"),
+    ("Release 2.0 of the tool", "sentence_case"),
+    ("Notes: v2 & 3.1", "sentence_case"),
+])
+def test_classify_heading_style(heading, style):
+    """The first word, minor words and letterless words don't count toward the style."""
+    assert _classify_heading_style(heading) == style
+
+
+def test_detect_multiple_h1s_counts_atx_and_setext(tmp_path):
+    """Files with zero or several H1s are reported; '#' in code fences is ignored."""
+    _write(tmp_path / "one.md", "# One\n\n```bash\n# comment\n```\n")
+    _write(tmp_path / "two.md", "Two\n===\n\n# Again\n")
+    _write(tmp_path / "none.md", "Just prose.\n")
+
+    issues = {i["file"]: i for i in detect_multiple_h1s(tmp_path)}
+
+    assert set(issues) == {"two.md", "none.md"}
+    assert issues["two.md"]["h1_texts"] == ["Two", "Again"]
+    assert issues["none.md"]["h1_count"] == 0
+
+
+def test_detect_multiple_h1s_skips_parsing_without_heading_markers(tmp_path, monkeypatch):
+    """Files with no '#' or '=' are reported without being parsed."""
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("file without heading markers should not be parsed")
+
+    monkeypatch.setattr(MarkdownCache, "parse", _fail)
+    _write(tmp_path / "plain.md", "Just prose.\n")
+
+    issues = detect_multiple_h1s(tmp_path, MarkdownCache())
+
+    assert issues == [{"file": "plain.md", "h1_count": 0, "h1_texts": []}]
+
+
+@pytest.mark.asyncio
+async def test_assess_quality_reads_each_doc_once(tmp_path, monkeypatch):
+    """Analyzers and scans share one read per markdown file."""
+    import builtins
+
+    _write(tmp_path / "docs" / "index.md", "# Index\n\n- one\n\nSee `helper()`.\n")
+    _write(tmp_path / "docs" / "guide" / "setup.md", "# Setup\n\n```bash\npip install x\n```\n")
+
+    opened = []
+    real_open = builtins.open
+
+    def _recording_open(file, *args, **kwargs):
+        if str(file).endswith(".md"):
+            opened.append(Path(file).name)
+        return real_open(file, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "open", _recording_open)
+    result = await assess_quality(AssessQualityInput(project_path=str(tmp_path), docs_path="docs"))
+
+    assert isinstance(result, dict), result
+    assert sorted(opened) == ["index.md", "setup.md"]
+
+
+@pytest.mark.asyncio
+async def test_assess_quality_indexes_project_once(tmp_path, monkeypatch):
+    """Accuracy and both coverage scans share a single symbol indexing pass."""
+    from doc_manager_mcp.indexing.analysis.tree_sitter import SymbolIndexer
+
+    _write(tmp_path / "pkg" / "api.py", "def documented():\n    pass\n\n\ndef hidden():\n    pass\n")
+    _write(tmp_path / "docs" / "index.md", "# Index\n\nCall `documented()`.\n")
+
+    calls = []
+    real_index_project = SymbolIndexer.index_project
+
+    def _counting_index_project(self, *args, **kwargs):
+        calls.append(args)
+        return real_index_project(self, *args, **kwargs)
+
+    monkeypatch.setattr(SymbolIndexer, "index_project", _counting_index_project)
+    result = await assess_quality(AssessQualityInput(project_path=str(tmp_path), docs_path="docs"))
+
+    assert isinstance(result, dict), result
+    assert len(calls) == 1
+    assert [api["name"] for api in result["undocumented_apis"]["symbols"]] == ["hidden"]
+
+
+def test_undocumented_apis_recognize_inline_and_heading_references(tmp_path):
+    """Inline `name()`, `ClassName` and signature headings all count as documented."""
+    from doc_manager_mcp.tools.analysis.quality.helpers import detect_undocumented_apis
+
+    _write(tmp_path / "pkg" / "api.py", (
+        "def inline_ref():\n    pass\n\n\n"
+        "def heading_ref(x):\n    pass\n\n\n"
+        "class Widget:\n    pass\n\n\n"
+        "def forgotten():\n    pass\n"
+    ))
+    _write(tmp_path / "docs" / "api.md", (
+        "# API\n\nUse `inline_ref()` with a `Widget`.\n\n## heading_ref(x)\n\nDetails.\n"
+    ))
+
+    undocumented = detect_undocumented_apis(tmp_path, tmp_path / "docs")
+
+    assert [api["name"] for api in undocumented] == ["forgotten"]
+
+
+def test_heading_case_counts_repeated_headings_in_every_file(tmp_path):
+    """Repeated headings still count once per occurrence."""
+    from doc_manager_mcp.tools.analysis.quality.helpers import check_heading_case_consistency
+
+    for name in ["a.md", "b.md", "c.md"]:
+        _write(tmp_path / name, "# Configuration Options For Users\n")
+    _write(tmp_path / "d.md", "# Configuration options for users\n")
+
+    result = check_heading_case_consistency(tmp_path)
+
+    assert result["style_counts"] == {"title_case": 3, "sentence_case": 1}
+    assert [f["file"] for f in result["inconsistent_files"]] == ["d.md"]
+
+
+@pytest.mark.asyncio
+async def test_assess_quality_tokenizes_each_doc_once(tmp_path, monkeypatch):
+    """Analyzers and scans query one shared parse per markdown file."""
+    import markdown_it
+
+    _write(tmp_path / "pkg" / "api.py", "def helper():\n    pass\n")
+    _write(tmp_path / "docs" / "index.md", "# Index\n\n- one\n\nSee `helper()`.\n")
+    _write(tmp_path / "docs" / "guide.md", "# Guide\n\n```python\nhelper()\n```\n")
+
+    parsed = []
+    real_parse = markdown_it.MarkdownIt.parse
+
+    def _counting_parse(self, src, *args, **kwargs):
+        parsed.append(src)
+        return real_parse(self, src, *args, **kwargs)
+
+    monkeypatch.setattr(markdown_it.MarkdownIt, "parse", _counting_parse)
+    result = await assess_quality(AssessQualityInput(project_path=str(tmp_path), docs_path="docs"))
+
+    assert isinstance(result, dict), result
+    assert len(parsed) == 2
+
+
+def test_terminology_reports_each_line_once_and_honours_exceptions(tmp_path):
+    """Avoided terms are reported per line, skipping lines with an excepted phrase."""
+    from types import SimpleNamespace
+
+    from doc_manager_mcp.tools.analysis.quality.helpers import check_terminology_compliance
+
+    _write(tmp_path / "guide.md", (
+        "# Guide\n\nSimply run it, simply.\n\nSimply put, it works.\n\n"
+        "```bash\n# simply\n```\n\nThen simply stop.\n"
+    ))
+    conventions = SimpleNamespace(terminology=SimpleNamespace(
+        avoid=[SimpleNamespace(word="simply", exceptions=["simply put"], reason="Condescending")],
+        preferred={},
+    ))
+
+    result = check_terminology_compliance(tmp_path, conventions)
+
+    # Line numbers count the text left after fenced blocks are removed
+    assert [(t["file"], t["line"]) for t in result["avoided_terms_found"]] == [("guide.md", 3), ("guide.md", 9)]
+
+
+def test_list_formatting_skips_parsing_files_without_markers_or_fences(tmp_path, monkeypatch):
+    """Files with no list markers or fences are never tokenized by the list scan."""
+    from doc_manager_mcp.indexing.parsers.markdown import MarkdownParser
+    from doc_manager_mcp.tools.analysis.quality.helpers import check_list_formatting_consistency
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("file should not be parsed")
+
+    monkeypatch.setattr(MarkdownParser, "extract_code_blocks", _fail)
+    _write(tmp_path / "prose.md", "# Prose\n\nNo lists here.\n")
+    _write(tmp_path / "list.md", "# List\n\n* one\n* two\n")
+
+    result = check_list_formatting_consistency(tmp_path)
+
+    assert result["marker_counts"] == {"-": 0, "*": 2, "+": 0}
+
+
+def test_documentation_coverage_counts_names_used_in_code_examples(tmp_path):
+    """A symbol named anywhere in a code block counts once; blocks are not concatenated."""
+    from doc_manager_mcp.tools.analysis.quality.helpers import calculate_documentation_coverage
+
+    _write(tmp_path / "pkg" / "api.py", (
+        "def load():\n    pass\n\n\n"
+        "def save():\n    pass\n\n\n"
+        "def loadsave():\n    pass\n"
+    ))
+    _write(tmp_path / "docs" / "a.md", "# A\n\n```python\nload()\nload()\n```\n")
+    _write(tmp_path / "docs" / "b.md", "# B\n\n```python\nx = 1\n```\n\n```python\nsave()\n```\n")
+
+    coverage = calculate_documentation_coverage(tmp_path, tmp_path / "docs")
+
+    assert coverage["total_symbols"] == 3
+    assert coverage["documented_symbols"] == 2
+    assert coverage["breakdown_by_type"] == {
+        "function": {"total": 3, "documented": 2, "coverage_percentage": 66.7}
+    }
@@ -0,0 +1,32 @@
+"""Tests for the relevance quality criterion."""
+
+from pathlib import Path
+
+from doc_manager_mcp.tools.analysis.quality.relevance import assess_relevance
+
+
+def test_deprecated_references_counted_per_pattern(tmp_path: Path):
+    """Overlapping markers count under each pattern; each file is listed once."""
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    api = docs / "api.md"
+    api.write_text("# API\n\nThis call was deprecated in 2.0 and is no longer supported.\n")
+    guide = docs / "guide.md"
+    guide.write_text("# Guide\n\nUse the new client.\n")
+
+    result = assess_relevance(tmp_path, docs, [api, guide])
+
+    # "deprecated" + "deprecated in" + "no longer supported"
+    assert result["metrics"]["deprecated_references"] == 3
+    assert result["metrics"]["files_with_deprecated"] == 1
+
+
+def test_migration_docs_are_down_weighted(tmp_path: Path):
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    upgrade = docs / "upgrade.md"
+    upgrade.write_text("# Upgrading\n\n" + "The old API is deprecated.\n" * 10)
+
+    result = assess_relevance(tmp_path, docs, [upgrade])
+
+    assert result["metrics"]["deprecated_references"] == 2
@@ -0,0 +1,51 @@
+"""Tests for response and JSON serialization utilities."""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from doc_manager_mcp.core.responses import read_json_file, write_json_file
+
+
+def test_write_json_file_round_trips(tmp_path: Path):
+    """Written files are indented UTF-8 JSON that loads back unchanged."""
+    data = {"files": {"docs/guide.md": "abc123", "docs/café.md": "def456"}, "count": 2}
+    path = tmp_path / "baseline.json"
+
+    write_json_file(path, data)
+
+    text = path.read_text(encoding="utf-8")
+    assert json.loads(text) == data
+    assert '\n  "files"' in text
+
+
+def test_write_json_file_accepts_file_descriptor(tmp_path: Path):
+    """An open descriptor (e.g. from mkstemp) is written and closed."""
+    fd, temp_path = tempfile.mkstemp(dir=tmp_path)
+
+    write_json_file(fd, {"ok": True})
+
+    assert json.loads(Path(temp_path).read_text(encoding="utf-8")) == {"ok": True}
+    with pytest.raises(OSError):
+        os.fstat(fd)
+
+
+def test_read_json_file_round_trips(tmp_path: Path):
+    """Files written by write_json_file load back unchanged."""
+    data = {"files": {"docs/café.md": "abc123"}, "count": 1}
+    path = tmp_path / "baseline.json"
+    write_json_file(path, data)
+
+    assert read_json_file(path) == data
+
+
+def test_read_json_file_rejects_invalid_json(tmp_path: Path):
+    """Malformed JSON raises ValueError whichever parser is installed."""
+    path = tmp_path / "broken.json"
+    path.write_text('{"a": 1 "b": 2}', encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        read_json_file(path)
@@ -0,0 +1,120 @@
+"""Tests for the per-file symbol cache in SymbolIndexer."""
+
+from pathlib import Path
+
+from doc_manager_mcp.indexing.analysis import tree_sitter
+from doc_manager_mcp.indexing.analysis.tree_sitter import SymbolIndexer
+
+
+def _symbol_names(indexer: SymbolIndexer) -> set[str]:
+    return {s.name for symbols in indexer.index.values() for s in symbols}
+
+
+def test_unchanged_file_reuses_cached_symbols(tmp_path: Path):
+    """Re-indexing identical content should not invoke the parser again."""
+    (tmp_path / "module.py").write_text("def cached_func():\n    pass\n")
+
+    first = SymbolIndexer()
+    first.index_project(tmp_path)
+    assert "cached_func" in _symbol_names(first)
+
+    second = SymbolIndexer()
+
+    class _FailingParser:
+        def parse(self, _source):
+            raise AssertionError("parser should not run for cached content")
+
+    second.parsers["python"] = _FailingParser()
+    second.index_project(tmp_path)
+
+    assert _symbol_names(second) == _symbol_names(first)
+
+
+def test_modified_file_is_reparsed(tmp_path: Path):
+    """Changing file content should produce a fresh cache entry."""
+    source = tmp_path / "module.py"
+    source.write_text("def old_func():\n    pass\n")
+    SymbolIndexer().index_project(tmp_path)
+
+    source.write_text("def new_func():\n    pass\n")
+    indexer = SymbolIndexer()
+    indexer.index_project(tmp_path)
+
+    names = _symbol_names(indexer)
+    assert "new_func" in names
+    assert "old_func" not in names
+    assert any(key[0] == "module.py" for key in tree_sitter._FILE_SYMBOL_CACHE)
+
+
+def test_parallel_indexing_matches_serial(tmp_path: Path, monkeypatch):
+    """Process-pool indexing yields the same index as serial indexing."""
+    for i in range(4):
+        (tmp_path / f"mod_{i}.py").write_text(
+            f"class Model{i}:\n    def method_{i}(self):\n        pass\n\ndef func_{i}():\n    pass\n"
+        )
+    (tmp_path / "main.go").write_text("package main\n\nfunc Run() {}\n")
+
+    serial = SymbolIndexer()
+    serial.index_project(tmp_path)
+
+    tree_sitter._FILE_SYMBOL_CACHE.clear()
+    monkeypatch.setattr(tree_sitter, "_PARALLEL_INDEX_MIN_FILES", 1)
+    monkeypatch.setattr(tree_sitter.os, "cpu_count", lambda: 2)
+    parallel = SymbolIndexer()
+    parallel.index_project(tmp_path)
+
+    def _snapshot(indexer: SymbolIndexer):
+        return {
+            name: [(s.type, s.file, s.line, s.parent) for s in symbols]
+            for name, symbols in indexer.index.items()
+        }
+
+    assert _snapshot(parallel) == _snapshot(serial)
+
+
+def test_default_patterns_walk_finds_same_files_as_glob(tmp_path: Path):
+    """The single walk honours root-only excludes and still finds hidden and nested sources."""
+    for relative in [
+        "pkg/mod.py",
+        "pkg/.hidden/secret.py",
+        "web/node_modules/nested.py",  # node_modules/** only excludes at the root
+        "node_modules/dep.py",
+        "venv/lib/site.py",
+        "cmd/main.go",
+        "notes.txt",
+    ]:
+        path = tmp_path / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        name = path.stem
+        path.write_text(f"func F_{name}() {{}}\n" if path.suffix == ".go" else f"def f_{name}():\n    pass\n")
+
+    indexer = SymbolIndexer()
+    indexer.index_project(tmp_path)
+
+    indexed = {s.file for symbols in indexer.index.values() for s in symbols}
+    assert indexed == {"pkg/mod.py", "pkg/.hidden/secret.py", "web/node_modules/nested.py", "cmd/main.go"}
+
+
+def test_concurrent_cache_inserts_evict_safely(monkeypatch):
+    """Threads filling a full cache at once never trip over each other's evictions."""
+    import threading
+
+    monkeypatch.setattr(tree_sitter, "_FILE_SYMBOL_CACHE", {})
+    monkeypatch.setattr(tree_sitter, "_FILE_SYMBOL_CACHE_MAX", 8)
+    errors = []
+
+    def _fill(worker: int):
+        try:
+            for i in range(2000):
+                tree_sitter._cache_file_symbols((f"{worker}/{i}.py", b""), ())
+        except Exception as e:  # pragma: no cover - reported below
+            errors.append(e)
+
+    threads = [threading.Thread(target=_fill, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(tree_sitter._FILE_SYMBOL_CACHE) <= 8
@@ -232,151 +232,63 @@ def run_ab_test_on_project(project_path: Path) -> ABTestResult:
 # ============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def fixture_dir() -> Path:
     """Path to test fixtures directory."""
     return Path(__file__).parent.parent / "fixtures" / "sample_project"
 
 
-def test_simple_module_extraction(fixture_dir: Path):
-    """Test symbol extraction on simple module with only functions."""
-    file_path = fixture_dir / "simple_module.py"
-    assert file_path.exists(), f"Fixture not found: {file_path}"
-
-    indexer = SymbolIndexer()
-    indexer.index_project(fixture_dir)
-
-    # Filter symbols from this specific file
-    symbols = []
-    for sym_list in indexer.index.values():
-        for symbol in sym_list:
-            if "simple_module.py" in symbol.file:
-                symbols.append(symbol)
-
-    # Check expected counts
-    expected = FIXTURE_EXPECTATIONS["simple_module.py"]
-    assert len(symbols) == expected["total"], (
-        f"Expected {expected['total']} symbols, got {len(symbols)}. "
-        f"Found symbols: {[(s.name, s.type.value) for s in symbols]}"
-    )
-
-    # Check types
-    functions = [s for s in symbols if s.type == SymbolType.FUNCTION]
-    assert len(functions) == expected["functions"]
-
-
-def test_simple_class_extraction(fixture_dir: Path):
-    """Test symbol extraction on class with methods."""
-    file_path = fixture_dir / "simple_class.py"
-    assert file_path.exists(), f"Fixture not found: {file_path}"
-
-    indexer = SymbolIndexer()
-    indexer.index_project(fixture_dir)
-
-    # Filter symbols from this specific file
-    symbols = []
-    for sym_list in indexer.index.values():
-        for symbol in sym_list:
-            if "simple_class.py" in symbol.file:
-                symbols.append(symbol)
-
-    # Check expected counts
-    expected = FIXTURE_EXPECTATIONS["simple_class.py"]
-
-    classes = [s for s in symbols if s.type == SymbolType.CLASS]
-    methods = [s for s in symbols if s.type == SymbolType.METHOD]
-
-    assert len(classes) == expected["classes"]
-    assert len(methods) == expected["methods"]
-
-
-def test_nested_classes_extraction(fixture_dir: Path):
-    """Test symbol extraction on nested classes."""
-    file_path = fixture_dir / "nested_classes.py"
-    assert file_path.exists(), f"Fixture not found: {file_path}"
-
+@pytest.fixture(scope="module")
+def fixture_index(fixture_dir: Path) -> SymbolIndexer:
+    """Index the fixture project once; tests only read from the result."""
     indexer = SymbolIndexer()
     indexer.index_project(fixture_dir)
+    return indexer
 
-    # Filter symbols from this specific file
-    symbols = []
-    for sym_list in indexer.index.values():
-        for symbol in sym_list:
-            if "nested_classes.py" in symbol.file:
-                symbols.append(symbol)
-
-    # Check expected counts
-    expected = FIXTURE_EXPECTATIONS["nested_classes.py"]
 
-    classes = [s for s in symbols if s.type == SymbolType.CLASS]
-    methods = [s for s in symbols if s.type == SymbolType.METHOD]
-
-    assert len(classes) == expected["classes"]
-    assert len(methods) == expected["methods"]
-
-    # Verify nested class parent attribution
-    inner_class = [s for s in classes if s.name == "Inner"]
-    if inner_class:
-        assert inner_class[0].name == "Inner", "Nested class should be extracted"
-        assert inner_class[0].parent == "Outer", "Nested class should have parent set"
+def _symbols_in_file(indexer: SymbolIndexer, file_name: str) -> list[Symbol]:
+    """Collect indexed symbols that come from one fixture file."""
+    return [
+        symbol
+        for sym_list in indexer.index.values()
+        for symbol in sym_list
+        if file_name in symbol.file
+    ]
 
 
-def test_nested_functions_extraction(fixture_dir: Path):
-    """Test symbol extraction on nested functions (closures).
+@pytest.mark.parametrize("file_name", list(FIXTURE_EXPECTATIONS))
+def test_fixture_symbol_counts(fixture_dir: Path, fixture_index: SymbolIndexer, file_name: str):
+    """Each fixture file yields the expected number of symbols per type.
 
-    CRITICAL: Nested functions should be counted as FUNCTION, not METHOD.
+    Covers plain modules, classes with methods, nested classes, nested
+    functions (closures must be FUNCTION, not METHOD) and a mixed file.
     """
-    file_path = fixture_dir / "nested_functions.py"
+    file_path = fixture_dir / file_name
     assert file_path.exists(), f"Fixture not found: {file_path}"
 
-    indexer = SymbolIndexer()
-    indexer.index_project(fixture_dir)
-
-    # Filter symbols from this specific file
-    symbols = []
-    for sym_list in indexer.index.values():
-        for symbol in sym_list:
-            if "nested_functions.py" in symbol.file:
-                symbols.append(symbol)
-
-    # Check expected counts
-    expected = FIXTURE_EXPECTATIONS["nested_functions.py"]
-
-    functions = [s for s in symbols if s.type == SymbolType.FUNCTION]
-    methods = [s for s in symbols if s.type == SymbolType.METHOD]
+    symbols = _symbols_in_file(fixture_index, file_name)
+    expected = FIXTURE_EXPECTATIONS[file_name]
 
-    # CRITICAL: All nested functions should be FUNCTION type
-    assert len(methods) == 0, "Nested functions should NOT be classified as methods"
-    assert len(functions) == expected["functions"], (
-        f"Expected {expected['functions']} functions, got {len(functions)}"
+    assert len(symbols) == expected["total"], (
+        f"Expected {expected['total']} symbols, got {len(symbols)}. "
+        f"Found symbols: {[(s.name, s.type.value) for s in symbols]}"
     )
+    counts = {
+        "functions": SymbolType.FUNCTION,
+        "classes": SymbolType.CLASS,
+        "methods": SymbolType.METHOD,
+    }
+    for key, symbol_type in counts.items():
+        actual = sum(1 for s in symbols if s.type == symbol_type)
+        assert actual == expected[key], f"{file_name}: expected {expected[key]} {key}, got {actual}"
 
 
-def test_mixed_complex_extraction(fixture_dir: Path):
-    """Test symbol extraction on complex file with mix of scenarios."""
-    file_path = fixture_dir / "mixed_complex.py"
-    assert file_path.exists(), f"Fixture not found: {file_path}"
-
-    indexer = SymbolIndexer()
-    indexer.index_project(fixture_dir)
-
-    # Filter symbols from this specific file
-    symbols = []
-    for sym_list in indexer.index.values():
-        for symbol in sym_list:
-            if "mixed_complex.py" in symbol.file:
-                symbols.append(symbol)
-
-    # Check expected counts
-    expected = FIXTURE_EXPECTATIONS["mixed_complex.py"]
-
-    functions = [s for s in symbols if s.type == SymbolType.FUNCTION]
-    classes = [s for s in symbols if s.type == SymbolType.CLASS]
-    methods = [s for s in symbols if s.type == SymbolType.METHOD]
-
-    assert len(functions) == expected["functions"]
-    assert len(classes) == expected["classes"]
-    assert len(methods) == expected["methods"]
+def test_nested_class_parent_attribution(fixture_index: SymbolIndexer):
+    """Nested classes are extracted with their enclosing class as parent."""
+    symbols = _symbols_in_file(fixture_index, "nested_classes.py")
+    inner_class = [s for s in symbols if s.type == SymbolType.CLASS and s.name == "Inner"]
+    if inner_class:
+        assert inner_class[0].parent == "Outer", "Nested class should have parent set"
 
 
 def test_ab_comparison_full_fixtures(fixture_dir: Path):
@@ -406,14 +318,13 @@ def test_ab_comparison_full_fixtures(fixture_dir: Path):
     )
 
 
-def test_symbol_uniqueness(fixture_dir: Path):
+def test_symbol_uniqueness(fixture_index: SymbolIndexer):
     """Verify that each symbol location is unique (no exact duplicates).
 
     After Phase 1 fix, each (name, file, line, column) combination should appear
     only once in the symbol index.
     """
-    indexer = SymbolIndexer()
-    indexer.index_project(fixture_dir)
+    indexer = fixture_index
 
     symbols = []
     for sym_list in indexer.index.values():
@@ -435,14 +346,13 @@ def test_symbol_uniqueness(fixture_dir: Path):
     assert len(duplicates) == 0, f"Found exact duplicate symbols: {duplicates}"
 
 
-def test_no_method_function_duplicates(fixture_dir: Path):
+def test_no_method_function_duplicates(fixture_index: SymbolIndexer):
     """Verify methods are not also counted as functions.
 
     Phase 1 fix implemented: methods inside classes now ONLY appear as METHOD type,
     not as both FUNCTION and METHOD.
     """
-    indexer = SymbolIndexer()
-    indexer.index_project(fixture_dir)
+    indexer = fixture_index
 
     symbols = []
     for sym_list in indexer.index.values():
@@ -0,0 +1,310 @@
+"""Tests for the validate_docs tool across multi-file documentation trees."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from doc_manager_mcp.core import calculate_checksum
+from doc_manager_mcp.core.markdown_cache import MarkdownCache
+from doc_manager_mcp.models import ValidateDocsInput
+from doc_manager_mcp.tools.analysis.validation.validator import (
+    _format_validation_report,
+    validate_docs,
+)
+
+
+def _write(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding='utf-8')
+
+
+async def _validate(project: Path, **overrides) -> dict:
+    params = {
+        "project_path": str(project),
+        "docs_path": "docs",
+        "check_snippets": False,
+        "check_stale_references": False,
+    }
+    params.update(overrides)
+    result = await validate_docs(ValidateDocsInput(**params))
+    assert isinstance(result, dict), result
+    return result
+
+
+@pytest.mark.asyncio
+async def test_reports_issues_from_every_file(tmp_path):
+    """Issues from nested files are all reported with their own line numbers."""
+    _write(tmp_path / "docs" / "index.md", "# Index\n\n[Guide](guide/intro.md)\n\n[Gone](missing.md)\n")
+    _write(tmp_path / "docs" / "guide" / "intro.md", "# Intro\n\n![](diagram.png)\n")
+
+    result = await _validate(tmp_path)
+    found = {(i["type"], i["file"].replace('\\', '/'), i["line"]) for i in result["issues"]}
+
+    assert ("broken_link", "index.md", 5) in found
+    assert ("missing_alt_text", "guide/intro.md", 3) in found
+    assert ("missing_asset", "guide/intro.md", 3) in found
+    assert not any(i["file"].endswith("index.md") and i["line"] == 3 for i in result["issues"])
+
+
+@pytest.mark.asyncio
+async def test_clean_documentation_has_no_issues(tmp_path):
+    """Valid links, present images and external URLs produce an empty report."""
+    _write(tmp_path / "docs" / "index.md", "# Index\n\n[Other](other.md)\n![Logo](logo.png)\n")
+    _write(tmp_path / "docs" / "other.md", "# Other\n\n[Site](https://example.com)\n")
+    (tmp_path / "docs" / "logo.png").write_bytes(b"png")
+
+    result = await _validate(tmp_path)
+
+    assert result["total_issues"] == 0
+
+
+@pytest.mark.asyncio
+async def test_images_outside_docs_tree_are_resolved(tmp_path):
+    """Images referenced outside the docs directory are still checked on disk."""
+    _write(tmp_path / "docs" / "guide" / "index.md", "# Guide\n\n![Logo](../../assets/logo.png)\n\n![Chart](../../assets/chart.png)\n")
+    (tmp_path / "assets").mkdir()
+    (tmp_path / "assets" / "logo.png").write_bytes(b"png")
+
+    result = await _validate(tmp_path, check_links=False)
+
+    assert [(i["type"], i["image_src"]) for i in result["issues"]] == [
+        ("missing_asset", "../../assets/chart.png")
+    ]
+
+
+@pytest.mark.asyncio
+async def test_raw_html_issues_report_their_own_lines(tmp_path):
+    """Each raw HTML link and image is reported on the line it appears."""
+    _write(
+        tmp_path / "docs" / "index.md",
+        '# Index\n\n<a href="gone.md">Gone</a>\n\n<img src="a.png">\n\n'
+        '<a href="also-gone.md">Also</a> <a href="missing.md">Missing</a>\n',
+    )
+
+    result = await _validate(tmp_path)
+    found = sorted((i["type"], i["line"]) for i in result["issues"])
+
+    assert found == [
+        ("broken_link", 3),
+        ("broken_link", 7),
+        ("broken_link", 7),
+        ("missing_alt_text", 5),
+        ("missing_asset", 5),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_external_and_special_links_are_skipped(tmp_path):
+    """External schemes, shortcodes and anchors are never checked on disk."""
+    _write(
+        tmp_path / "docs" / "index.md",
+        "# Index\n\n[Web](https://example.com) [Old](http://example.com) "
+        "[Mail](mailto:a@example.com) [Call](tel:+15555550100) "
+        '[Ref]({{< ref "guide" >}}) [Top](#index)\n',
+    )
+
+    result = await _validate(tmp_path, check_assets=False)
+
+    assert result["issues"] == []
+
+
+@pytest.mark.asyncio
+async def test_image_traversal_outside_project_is_rejected(tmp_path):
+    """Image paths that climb out of the project are reported without a lookup."""
+    project = tmp_path / "project"
+    _write(project / "docs" / "index.md", "# Index\n\n![Secret](../../outside.png)\n")
+    (tmp_path / "outside.png").write_bytes(b"png")
+
+    result = await _validate(project, check_links=False)
+
+    assert [(i["type"], i["line"]) for i in result["issues"]] == [("invalid_asset_path", 3)]
+
+
+@pytest.mark.asyncio
+async def test_symlinked_doc_outside_project_is_not_read(tmp_path):
+    """A markdown symlink escaping the project is skipped; in-project links are kept."""
+    project = tmp_path / "project"
+    _write(project / "docs" / "index.md", "# Index\n")
+    _write(project / "notes.md", "# Notes\n\n[Gone](gone.md)\n")
+    _write(tmp_path / "secret.md", "# Secret Content\n\n[Leak](leak.md)\n")
+    try:
+        (project / "docs" / "escape_link.md").symlink_to(tmp_path / "secret.md")
+        (project / "docs" / "notes.md").symlink_to(project / "notes.md")
+    except OSError:
+        pytest.skip("symlinks not supported")
+
+    result = await _validate(project, check_assets=False)
+
+    assert [i["link_url"] for i in result["issues"]] == ["gone.md"]
+
+
+@pytest.mark.asyncio
+async def test_code_syntax_errors_use_fenced_block_lines(tmp_path):
+    """Only the broken fenced block is reported by the TreeSitter syntax check."""
+    _write(
+        tmp_path / "docs" / "index.md",
+        "# Index\n\n```python\nok = 1\n```\n\n```python\ndef broken(:\n    pass\n```\n",
+    )
+
+    result = await _validate(tmp_path, check_links=False, check_assets=False, validate_code_syntax=True)
+
+    assert [i["type"] for i in result["issues"]] == ["code_syntax_error"]
+    assert result["issues"][0]["language"] == "python"
+
+
+def test_report_counts_issues_by_severity():
+    """The report totals errors and warnings; other severities only count in the total."""
+    issues = [{"severity": "error"}, {"severity": "warning"}, {"severity": "error"}, {"severity": "info"}]
+    report = _format_validation_report(issues)
+
+    assert (report["total_issues"], report["errors"], report["warnings"]) == (4, 2, 1)
+    assert report["issues"] is issues
+
+
+@pytest.mark.asyncio
+async def test_incremental_mode_validates_only_changed_docs(tmp_path):
+    """With a baseline, unchanged docs are skipped and edited ones are validated."""
+    _write(tmp_path / "docs" / "stable.md", "# Stable\n\n[Gone](gone.md)\n")
+    _write(tmp_path / "docs" / "edited.md", "# Edited\n")
+    baseline = {
+        "files": {
+            f"docs/{name}": calculate_checksum(tmp_path / "docs" / name)
+            for name in ("stable.md", "edited.md")
+        }
+    }
+    _write(tmp_path / ".doc-manager" / "memory" / "repo-baseline.json", json.dumps(baseline))
+
+    assert (await _validate(tmp_path, incremental=True))["total_issues"] == 0
+
+    _write(tmp_path / "docs" / "edited.md", "# Edited\n\n[Missing](missing.md)\n")
+    result = await _validate(tmp_path, incremental=True)
+
+    assert [i["link_url"] for i in result["issues"]] == ["missing.md"]
+
+
+@pytest.mark.asyncio
+async def test_repeated_targets_are_reported_at_every_occurrence(tmp_path):
+    """Duplicate broken links and images are each reported on their own line."""
+    _write(
+        tmp_path / "docs" / "index.md",
+        "# Index\n\n[Gone](gone.md)\n\n![Pic](../assets/pic.png)\n\n"
+        "[Again](gone.md)\n\n![Pic](../assets/pic.png)\n",
+    )
+    _write(tmp_path / "docs" / "other.md", "# Other\n\n![Pic](../assets/pic.png)\n")
+
+    result = await _validate(tmp_path)
+    found = sorted((i["type"], i["file"], i["line"]) for i in result["issues"])
+
+    assert found == [
+        ("broken_link", "index.md", 3),
+        ("broken_link", "index.md", 7),
+        ("missing_asset", "index.md", 5),
+        ("missing_asset", "index.md", 9),
+        ("missing_asset", "other.md", 3),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_html_image_alt_text_in_any_attribute_order(tmp_path):
+    """HTML images are checked for alt text regardless of attribute order."""
+    _write(
+        tmp_path / "docs" / "index.md",
+        '# Index\n\n<img alt="Logo" src="logo.png">\n\n<img src="logo.png" alt="Logo" />\n\n'
+        '<img data-src="lazy.png" src="logo.png">\n',
+    )
+    (tmp_path / "docs" / "logo.png").write_bytes(b"png")
+
+    result = await _validate(tmp_path, check_links=False)
+
+    assert [(i["type"], i["line"]) for i in result["issues"]] == [("missing_alt_text", 7)]
+
+
+def test_symbol_check_skips_docs_without_inline_code(tmp_path, monkeypatch):
+    """Docs without inline code never trigger symbol indexing."""
+    from doc_manager_mcp.tools.analysis.validation import helpers
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("symbol index should not be built")
+
+    monkeypatch.setattr(helpers, "SymbolIndexer", _fail)
+    doc = tmp_path / "docs" / "plain.md"
+    _write(doc, "# Plain\n\nNo code here.\n")
+
+    assert helpers.validate_documented_symbols(doc.read_text(), doc, tmp_path, None, doc.parent) == []
+
+
+@pytest.mark.asyncio
+async def test_missing_or_non_directory_docs_path_is_reported(tmp_path):
+    """A missing docs path and a file passed as docs path get distinct errors."""
+    _write(tmp_path / "notes.md", "# Notes\n")
+
+    missing = await validate_docs(ValidateDocsInput(project_path=str(tmp_path), docs_path="nope"))
+    not_dir = await validate_docs(ValidateDocsInput(project_path=str(tmp_path), docs_path="notes.md"))
+
+    assert "does not exist" in missing
+    assert "is not a directory" in not_dir
+
+
+@pytest.mark.asyncio
+async def test_plain_prose_docs_are_never_parsed(tmp_path, monkeypatch):
+    """Files without link, image or fence markers skip markdown parsing."""
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("plain prose should not be parsed")
+
+    monkeypatch.setattr(MarkdownCache, "parse", _fail)
+    _write(tmp_path / "docs" / "plain.md", "# Plain\n\nJust prose, nothing to check.\n")
+
+    result = await _validate(tmp_path, check_snippets=True)
+
+    assert result["total_issues"] == 0
+
+
+def test_unchanged_code_examples_reuse_cached_issues(tmp_path, monkeypatch):
+    """Re-validating identical content skips syntax checking and returns copies."""
+    from doc_manager_mcp.tools.analysis.validation import helpers
+
+    doc = tmp_path / "docs" / "guide.md"
+    content = "# Guide\n\n```python\ndef broken(:\n    pass\n```\n"
+    _write(doc, content)
+    first = helpers.validate_code_examples(content, doc, tmp_path, doc.parent)
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("cached content should not be re-validated")
+
+    monkeypatch.setattr(helpers.CodeValidator, "validate_syntax", _fail)
+    second = helpers.validate_code_examples(content, doc, tmp_path, doc.parent)
+
+    assert second == first and first
+    second[0]["line"] = 0
+    assert helpers.validate_code_examples(content, doc, tmp_path, doc.parent) == first
+
+
+def test_code_validator_is_reused_within_a_thread():
+    """Doc files validated on one thread share a single CodeValidator."""
+    import threading
+
+    from doc_manager_mcp.tools.analysis.validation import helpers
+
+    validator = helpers._get_code_validator()
+    assert helpers._get_code_validator() is validator
+
+    other = []
+    thread = threading.Thread(target=lambda: other.append(helpers._get_code_validator()))
+    thread.start()
+    thread.join()
+    assert other[0] is not validator
+
+
+def test_documented_symbols_checked_against_index(tmp_path):
+    """Namespaced calls are looked up by function name; unknown names are reported."""
+    from doc_manager_mcp.tools.analysis.validation import helpers
+
+    doc = tmp_path / "docs" / "api.md"
+    content = "# API\n\nUse `Client.connect()`, `disconnect()` and `Session`, not `Gone`.\n"
+    _write(doc, content)
+    symbol_index = {"connect": ["sym"], "Session": ["sym"]}
+
+    issues = helpers.validate_documented_symbols(content, doc, tmp_path, symbol_index, doc.parent)
+
+    assert [(i["symbol"], i["symbol_type"]) for i in issues] == [("disconnect()", "function"), ("Gone", "class")]